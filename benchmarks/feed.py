@@ -0,0 +1,91 @@
+# Moneyball Phil — Odds fetcher load test
+# -----------------------------------------------------
+# Refreshes N markets from the local mock feed (moneyball.mock_feed, run
+# as a separate process) with the async fetcher, at a few pool sizes,
+# and compares each with the sequential cost (N × mean round trip). With
+# a pool at least as large as N every request is in flight within the
+# same round-trip window; what is left on top is per-request parsing on
+# both ends (a fraction of a millisecond each), not waiting.
+#
+#   python benchmarks/feed.py                              # 500 markets, 50 ms latency
+#   python benchmarks/feed.py --markets 2000 --latency 0.1 --pools 16,64,256,2000
+#   python benchmarks/feed.py --fail-rate 0.05             # with retried 503s
+#
+# Offline only: nothing leaves 127.0.0.1.
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from moneyball.mock_feed import KINDS, MockFeed  # noqa: E402
+from moneyball.odds_fetch import fetch_snapshot  # noqa: E402
+
+DEFAULT_POOLS = (1, 32, 128, 512)
+
+
+def _start_feed(events: int, books: int, latency: float, fail_rate: float):
+    # The feed runs in its own process, like a remote server, so it does not
+    # compete with the fetcher for this interpreter
+    proc = subprocess.Popen([sys.executable, "-m", "moneyball.mock_feed", "--port", "0", "--events", str(events),
+                             "--books", ",".join(f"B{i}" for i in range(books)), "--latency", str(latency),
+                             "--fail-rate", str(fail_rate)], cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    banner = proc.stdout.readline()
+    if " on http://" not in banner:
+        proc.kill()
+        raise RuntimeError(f"mock feed did not start: {banner!r}")
+    return proc, banner.rsplit(" on ", 1)[1].strip()
+
+
+def measure(markets: int, latency: float, pools, fail_rate: float = 0.0, books: int = 3) -> list:
+    # Enough events for ``markets`` markets (a few markets per event and book)
+    per_event = sum(len({m for m, _ in ms}) for ms in KINDS.values()) / len(KINDS)
+    events = int(markets / (per_event * books)) + 1
+    ids = [m["id"] for m in MockFeed(events, [f"B{i}" for i in range(books)]).markets[:markets]]
+    proc, url = _start_feed(events, books, latency, fail_rate)
+    rows = []
+    try:
+        for pool in pools:
+            # The sequential case is timed on a slice and scaled; in full it takes N × latency
+            sample = ids if pool > 1 else ids[:max(1, min(len(ids), 20))]
+            result = fetch_snapshot(url, markets=sample, connections=pool)
+            seconds = result.seconds * len(ids) / len(sample)
+            rows.append({"pool": pool, "markets": len(ids), "seconds": seconds,
+                         "round_trips": seconds / latency if latency else float("nan"),
+                         "markets_per_sec": len(ids) / seconds if seconds else float("inf"),
+                         "retries": result.retries, "failed": len(sample) - result.markets,
+                         "scaled": pool == 1})
+    finally:
+        proc.terminate()
+        proc.wait()
+    return rows
+
+
+def report(rows, latency: float) -> str:
+    lines = [f"{'pool':>6} {'markets':>8} {'seconds':>9} {'≈ RTTs':>8} {'markets/s':>11} {'retries':>8} {'failed':>7}"]
+    for r in rows:
+        lines.append(f"{r['pool']:>6} {r['markets']:>8} {r['seconds']:>9.3f} {r['round_trips']:>8.1f} "
+                     f"{r['markets_per_sec']:>11,.0f} {r['retries']:>8} {r['failed']:>7}"
+                     + ("   (scaled from a sample)" if r["scaled"] else ""))
+    lines.append(f"round trip = {latency * 1000:.0f} ms mock latency")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Load-test the async odds fetcher against the local mock feed.")
+    ap.add_argument("--markets", type=int, default=500)
+    ap.add_argument("--latency", type=float, default=0.05, help="mock feed seconds per request")
+    ap.add_argument("--pools", default=",".join(map(str, DEFAULT_POOLS)), help="comma-separated pool sizes")
+    ap.add_argument("--fail-rate", type=float, default=0.0)
+    args = ap.parse_args(argv)
+    pools = [int(p) for p in args.pools.split(",") if p.strip()]
+    print(report(measure(args.markets, args.latency, pools, args.fail_rate), args.latency))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
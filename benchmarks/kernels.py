@@ -0,0 +1,269 @@
+# Moneyball Phil — Kernel micro-benchmarks
+# -----------------------------------------------------
+# Per-call cost of every pricing kernel at a scalar size and two batch
+# sizes (1, 1k, 100k items). Kernels with a scalar-only API are timed the
+# way the app calls them, one call per item; their vectorized
+# counterparts are listed next to them.
+#
+#   python benchmarks/kernels.py                        # table + compare to the baseline
+#   python benchmarks/kernels.py --save                 # record a new baseline
+#   python benchmarks/kernels.py --sizes 1,1000 --only goal   # quick run of a subset
+#
+# Each case reports items/sec (best of the timed repeats) and the peak
+# memory allocated by one call (tracemalloc, which also sees NumPy
+# buffers). A case regresses when items/sec drops, or peak memory grows,
+# by more than the tolerance against benchmarks/baseline_kernels.json;
+# the script then exits 1. A case that looks slower is measured again
+# (CONFIRM_RUNS times) and keeps its best run, so one noisy burst does
+# not fail the suite. The stored baseline is machine-specific: re-record
+# it with --save when moving to new hardware.
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from moneyball import ats, kernels, soccer  # noqa: E402
+
+DEFAULT_SIZES = (1, 1_000, 100_000)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_kernels.json")
+SPEED_TOLERANCE = 0.30    # fail if items/sec falls more than 30% below baseline
+MEMORY_TOLERANCE = 0.25   # fail if peak memory grows more than 25% above baseline
+# Noise on a shared box comes in bursts longer than a single call, so the
+# best of many calls over half a second is what stays stable run to run
+MIN_TIME = 0.5            # repeat a call until this many seconds are spent ...
+MIN_REPEATS = 3           # ... and at least this many times
+CONFIRM_RUNS = 2          # re-measure a flagged case this many times before calling it a regression
+
+
+# ---------------------------
+# Cases: setup(size, rng) → (fn, args); fn(*args) prices `size` items
+# ---------------------------
+def _loop(kernel: Callable) -> Callable:
+    def run(*columns):
+        for args in zip(*columns):
+            kernel(*args)
+    return run
+
+
+def _logistic(n, rng):
+    x, line = rng.uniform(150, 350, n), rng.uniform(150, 350, n)
+    return kernels.logistic_prob, ((float(x[0]), float(line[0])) if n == 1 else (x, line))
+
+
+def _std_norm_cdf(n, rng):
+    z = rng.normal(0, 1.5, n)
+    return kernels.std_norm_cdf, (float(z[0]) if n == 1 else z,)
+
+
+def _binom_cdf(n, rng):
+    return _loop(kernels.binom_cdf), (rng.integers(3, 6, n).tolist(), rng.integers(0, 3, n).tolist(),
+                                      rng.uniform(0.2, 0.35, n).tolist())
+
+
+def _binom_cdf_vector(n, rng):
+    # The K ladder's route: one PMF row per item, CDF by cumulative sum
+    bf, p = rng.integers(18, 28, n), rng.uniform(0.15, 0.35, n)
+    return (lambda bf, p: np.cumsum(kernels.binom_pmf_vector(bf, p, 27), axis=-1)), (bf, p)
+
+
+def _poisson_cdf(n, rng):
+    return _loop(kernels.poisson_cdf), (rng.integers(0, 5, n).tolist(), rng.uniform(0.5, 5.0, n).tolist())
+
+
+def _poisson_cdf_vector(n, rng):
+    return (lambda lam: np.cumsum(kernels.poisson_pmf_vector(lam, 10), axis=-1)), (rng.uniform(0.5, 5.0, n),)
+
+
+def _safe_goal_matrix(n, rng):
+    return _loop(kernels.safe_goal_matrix), (rng.uniform(0.3, 3.0, n).tolist(), rng.uniform(0.3, 3.0, n).tolist())
+
+
+def _goal_tensor(n, rng):
+    return soccer.goal_tensor, (rng.uniform(0.3, 3.0, n), rng.uniform(0.3, 3.0, n))
+
+
+def _goal_matrix_cached(n, rng):
+    # The Soccer page's route: Dixon-Coles matrices memoized per (λh, λa, ρ);
+    # a matchday's worth of distinct fixtures, each priced repeatedly
+    pool = rng.uniform(0.3, 3.0, (min(n, 200), 2)).round(2)
+    pick = pool[rng.integers(0, len(pool), n)]
+    return _loop(lambda h, a: soccer.goal_matrix(h, a, -0.1)), (pick[:, 0].tolist(), pick[:, 1].tolist())
+
+
+def _market_probs_from_matrix(n, rng):
+    T = soccer.goal_tensor(rng.uniform(0.3, 3.0, n), rng.uniform(0.3, 3.0, n))
+    return _loop(kernels.market_probs_from_matrix), (list(T),)
+
+
+def _market_probs(n, rng):
+    return soccer.market_probs, (soccer.goal_tensor(rng.uniform(0.3, 3.0, n), rng.uniform(0.3, 3.0, n)),)
+
+
+def _true_prob_from_line(n, rng):
+    types = rng.choice(["Points Only", "PRA"], n).tolist()
+    return _loop(kernels.true_prob_from_line), (types, rng.uniform(10, 45, n).tolist(),
+                                                rng.uniform(10, 45, n).tolist(), rng.integers(1, 31, n).tolist())
+
+
+def _true_prob_from_line_vector(n, rng):
+    # The NBA roster scorer's route: one call on arrays
+    types = rng.choice(["Points Only", "PRA"], n).astype(object)
+    return kernels.true_prob_from_line, (types, rng.uniform(10, 45, n), rng.uniform(10, 45, n),
+                                         rng.integers(1, 31, n))
+
+
+def _ats_projection(n, rng):
+    games = {
+        "home": np.array(["Home"] * n), "away": np.array(["Away"] * n),
+        "home_pf": rng.uniform(95, 125, n), "home_pa": rng.uniform(95, 125, n),
+        "away_pf": rng.uniform(95, 125, n), "away_pa": rng.uniform(95, 125, n),
+        "spread_line_home": rng.uniform(-12, 12, n).round() + 0.5, "total_line": rng.uniform(200, 240, n).round() + 0.5,
+        "form_H_pct": rng.uniform(-5, 5, n), "injury_A_pct": rng.uniform(-5, 0, n),
+    }
+    return ats.evaluate_games, (games, "NBA")
+
+
+CASES: Dict[str, Callable] = {
+    "logistic_prob": _logistic,
+    "std_norm_cdf": _std_norm_cdf,
+    "binom_cdf": _binom_cdf,
+    "binom_cdf (pmf vector)": _binom_cdf_vector,
+    "poisson_cdf": _poisson_cdf,
+    "poisson_cdf (pmf vector)": _poisson_cdf_vector,
+    "safe_goal_matrix": _safe_goal_matrix,
+    "safe_goal_matrix (soccer.goal_tensor)": _goal_tensor,
+    "safe_goal_matrix (soccer.goal_matrix, ρ cached)": _goal_matrix_cached,
+    "market_probs_from_matrix": _market_probs_from_matrix,
+    "market_probs_from_matrix (soccer.market_probs)": _market_probs,
+    "true_prob_from_line": _true_prob_from_line,
+    "true_prob_from_line (array)": _true_prob_from_line_vector,
+    "ats projection (ats.evaluate_games)": _ats_projection,
+}
+
+
+# ---------------------------
+# Measurement
+# ---------------------------
+def _time_per_call(fn: Callable, args: Tuple) -> float:
+    best, spent, calls = float("inf"), 0.0, 0
+    while spent < MIN_TIME or calls < MIN_REPEATS:
+        t = time.perf_counter()
+        fn(*args)
+        dt = time.perf_counter() - t
+        best, spent, calls = min(best, dt), spent + dt, calls + 1
+    return best
+
+
+def _peak_bytes(fn: Callable, args: Tuple) -> int:
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(name: str, size: int, seed: int = 0) -> dict:
+    # Warm up on the same code path (scalar vs array) without paying for a full batch
+    warm_fn, warm_args = CASES[name](min(size, 2), np.random.default_rng(seed))
+    warm_fn(*warm_args)
+    fn, args = CASES[name](size, np.random.default_rng(seed))
+    sec = _time_per_call(fn, args)
+    return {"size": size, "sec_per_call": sec, "items_per_sec": size / sec, "peak_bytes": _peak_bytes(fn, args)}
+
+
+def measure(sizes=DEFAULT_SIZES, only: str = "") -> Dict[str, dict]:
+    """{"<case>[<size>]": result} for every case whose name contains ``only``."""
+    return {f"{name}[{size}]": run_case(name, size) for name in CASES if only in name for size in sizes}
+
+
+def confirm(result: Dict[str, dict], keys, runs: int = CONFIRM_RUNS):
+    """Re-measure ``keys`` in place, keeping each case's fastest run."""
+    for key in keys:
+        name, size = key.rsplit("[", 1)
+        for _ in range(runs):
+            again = run_case(name, int(size.rstrip("]")))
+            if again["items_per_sec"] > result[key]["items_per_sec"]:
+                result[key] = again
+
+
+def compare(result: Dict[str, dict], baseline: Dict[str, dict], speed_tol: float = SPEED_TOLERANCE,
+            memory_tol: float = MEMORY_TOLERANCE) -> Dict[str, List[str]]:
+    """Regressions per case against ``baseline`` (cases missing from either side are skipped)."""
+    problems = {}
+    for key, r in result.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        found = []
+        if r["items_per_sec"] < base["items_per_sec"] * (1.0 - speed_tol):
+            found.append(f"items/sec {r['items_per_sec']:,.0f} < {base['items_per_sec']:,.0f} -{speed_tol:.0%}")
+        # A few KiB of slack so scalar cases don't flag on allocator noise
+        if r["peak_bytes"] > base["peak_bytes"] * (1.0 + memory_tol) + 4096:
+            found.append(f"peak {_kib(r['peak_bytes'])} > {_kib(base['peak_bytes'])} +{memory_tol:.0%}")
+        if found:
+            problems[key] = found
+    return problems
+
+
+def _kib(n: int) -> str:
+    return f"{n / 1024:,.1f} KiB"
+
+
+def report(result: Dict[str, dict], baseline: Dict[str, dict], problems: Dict[str, List[str]]) -> str:
+    lines = [f"{'kernel [items]':<56}{'items/sec':>14}{'per call':>12}{'peak mem':>14}{'vs base':>9}"]
+    for key, r in result.items():
+        base = baseline.get(key)
+        delta = f"{r['items_per_sec'] / base['items_per_sec'] - 1.0:+.0%}" if base else "—"
+        per_call = r["sec_per_call"] * 1e6
+        per_call = f"{per_call:,.1f} µs" if per_call < 1e4 else f"{per_call / 1e3:,.1f} ms"
+        flag = "  REGRESSION" if key in problems else ""
+        lines.append(f"{key:<56}{r['items_per_sec']:>14,.0f}{per_call:>12}{_kib(r['peak_bytes']):>14}{delta:>9}{flag}")
+    for key, found in problems.items():
+        lines.append(f"  {key}: " + "; ".join(found))
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Items/sec and peak memory for each pricing kernel, vs a stored baseline.")
+    ap.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma-separated batch sizes")
+    ap.add_argument("--only", default="", help="run cases whose name contains this text")
+    ap.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON (default: benchmarks/baseline_kernels.json)")
+    ap.add_argument("--save", action="store_true", help="write this run as the new baseline (merged by case)")
+    ap.add_argument("--speed-tol", type=float, default=SPEED_TOLERANCE, help="allowed items/sec drop (fraction)")
+    ap.add_argument("--memory-tol", type=float, default=MEMORY_TOLERANCE, help="allowed peak memory growth (fraction)")
+    ap.add_argument("--json", action="store_true", help="print raw JSON instead of a table")
+    args = ap.parse_args(argv)
+
+    result = measure([int(s) for s in args.sizes.split(",")], args.only)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({**baseline, **result}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        problems = {}
+    else:
+        problems = compare(result, baseline, args.speed_tol, args.memory_tol)
+        if problems:
+            confirm(result, list(problems))
+            problems = compare(result, baseline, args.speed_tol, args.memory_tol)
+    print(json.dumps(result, indent=2) if args.json else report(result, baseline, problems))
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# Moneyball Phil — Simulation scaling
+# -----------------------------------------------------
+# Throughput of the multi-core simulation runner (moneyball.sim) at 1, 2,
+# 4, … workers up to the core count, on the correlated parlay kernel, and
+# a check that every worker count returns bit-identical results for the
+# same seed.
+#
+#   python benchmarks/sim.py                         # 8M draws, 6 legs
+#   python benchmarks/sim.py --draws 40000000 --workers 1,2,4,8,16
+#
+# The first parallel job pays for starting the pool; it is warmed up
+# before timing. Exits 1 if any worker count disagrees with 1 worker.
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from moneyball import parlay, sim  # noqa: E402
+
+LEGS = [{"game": "a", "team": "x"}, {"game": "a", "team": "x"}, {"game": "a"}, {"game": "b"},
+        {"game": "b", "team": "y"}, {"game": "b", "team": "y"}]
+PROBS = [0.62, 0.55, 0.58, 0.7, 0.52, 0.6]
+
+
+def default_worker_counts():
+    n, counts = sim.cpu_count(), []
+    w = 1
+    while w < n:
+        counts.append(w)
+        w *= 2
+    return counts + [n]
+
+
+def measure(draws: int, worker_counts, repeat: int = 3) -> list:
+    corr = parlay.correlation_matrix(LEGS)
+    rows = []
+    for w in worker_counts:
+        if w > 1:
+            parlay.simulate_parlay(PROBS, corr, n_draws=sim.BLOCK_DRAWS * w, workers=w)   # start the pool
+        best, result = float("inf"), None
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            result = parlay.simulate_parlay(PROBS, corr, n_draws=draws, seed=11, workers=w)
+            best = min(best, time.perf_counter() - t0)
+        rows.append({"workers": w, "seconds": best, "draws_per_sec": draws / best, "true_prob": result.true_prob})
+    return rows
+
+
+def report(rows) -> str:
+    base = rows[0]["draws_per_sec"]
+    lines = [f"{'workers':>8} {'seconds':>9} {'draws/s':>14} {'speed-up':>9}  true_prob"]
+    for r in rows:
+        lines.append(f"{r['workers']:>8} {r['seconds']:>9.3f} {r['draws_per_sec']:>14,.0f} "
+                     f"{r['draws_per_sec'] / base:>8.2f}x  {r['true_prob']!r}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Multi-core scaling and reproducibility of moneyball.sim.")
+    ap.add_argument("--draws", type=int, default=8_000_000)
+    ap.add_argument("--workers", help="comma-separated worker counts (default: 1, 2, 4, … up to the core count)")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+    counts = [int(w) for w in args.workers.split(",")] if args.workers else default_worker_counts()
+    if counts[0] != 1:
+        counts = [1] + counts
+    rows = measure(args.draws, counts, args.repeat)
+    print(report(rows))
+    mismatched = [r["workers"] for r in rows if r["true_prob"] != rows[0]["true_prob"]]
+    if mismatched:
+        print(f"NOT reproducible: workers {mismatched} differ from 1 worker", file=sys.stderr)
+        return 1
+    print(f"identical results for every worker count ({sim.cpu_count()} cores available)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# Moneyball Phil — Startup timing
+# -----------------------------------------------------
+# Measures the Streamlit app the way a new session sees it, each sample in
+# a fresh Python process (so nothing is warm in sys.modules):
+#
+#   cold start    – first script run on the default page
+#   first render  – first run after switching to each page
+#   rerun         – a second run of the same page (widget interaction)
+#
+#   python benchmarks/startup.py                      # median of 3 processes
+#   python benchmarks/startup.py --script old_app.py  # compare another version
+#
+# The app runs under streamlit.testing's AppTest (no browser). Only the
+# script thread's compile + exec time is counted, so AppTest's polling,
+# network and front-end time are excluded.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SCRIPT = os.path.join(ROOT, "moneyball_all_in_one.py")
+
+_PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+from streamlit.runtime.scriptrunner import script_cache, script_runner
+t_import = time.perf_counter() - t0
+
+# Time only the script thread's work, not AppTest's polling. A server
+# compiles the script once per process (its ScriptCache is shared by every
+# session), while AppTest recompiles on each run, so compile time is only
+# counted for the cold start.
+spent = {"compile": 0.0, "exec": 0.0}
+def timed(fn, key):
+    def wrapper(*a, **kw):
+        t = time.perf_counter()
+        try:
+            return fn(*a, **kw)
+        finally:
+            spent[key] += time.perf_counter() - t
+    return wrapper
+script_runner.exec_func_with_error_handling = timed(script_runner.exec_func_with_error_handling, "exec")
+script_cache.ScriptCache.get_bytecode = timed(script_cache.ScriptCache.get_bytecode, "compile")
+
+def run(at, cold=False):
+    spent.update(compile=0.0, exec=0.0)
+    at.run()
+    return spent["exec"] + (spent["compile"] if cold else 0.0)
+
+script, page = sys.argv[1], sys.argv[2]
+at = AppTest.from_file(script, default_timeout=120)
+out = {"import_streamlit": t_import, "cold_start": run(at, cold=True), "pages": at.sidebar.selectbox[0].options}
+if page:
+    at.sidebar.selectbox[0].select(page)
+    out["first_render"] = run(at)
+    out["rerun"] = run(at)
+    out["exceptions"] = [e.value for e in at.exception]
+print(json.dumps(out))
+"""
+
+
+def _probe(script: str, page: str = "") -> dict:
+    proc = subprocess.run([sys.executable, "-c", _PROBE, script, page], cwd=os.path.dirname(script),
+                          capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure(script: str = DEFAULT_SCRIPT, repeat: int = 3) -> dict:
+    """Median timings (seconds): cold start plus first render / rerun per page."""
+    script = os.path.abspath(script)
+    first = [_probe(script) for _ in range(repeat)]
+    result = {
+        "import_streamlit": statistics.median(r["import_streamlit"] for r in first),
+        "cold_start": statistics.median(r["cold_start"] for r in first),
+        "pages": {},
+    }
+    for page in first[0]["pages"]:
+        runs = [_probe(script, page) for _ in range(repeat)]
+        result["pages"][page] = {
+            "first_render": statistics.median(r["first_render"] for r in runs),
+            "rerun": statistics.median(r["rerun"] for r in runs),
+            "exceptions": runs[0]["exceptions"],
+        }
+    return result
+
+
+def report(result: dict) -> str:
+    ms = lambda s: f"{s * 1000:8.1f} ms"
+    lines = [f"{'import streamlit':<28}{ms(result['import_streamlit'])}",
+             f"{'cold start (default page)':<28}{ms(result['cold_start'])}",
+             "",
+             f"{'page':<28}{'first render':>12}{'rerun':>12}"]
+    for page, r in result["pages"].items():
+        flag = "  (exception)" if r["exceptions"] else ""
+        lines.append(f"{page:<28}{ms(r['first_render']):>12}{ms(r['rerun']):>12}{flag}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Cold-start and per-page first-render timing for the Streamlit app.")
+    ap.add_argument("--script", default=DEFAULT_SCRIPT, help="app script to measure (default: moneyball_all_in_one.py)")
+    ap.add_argument("--repeat", type=int, default=3, help="fresh processes per measurement; the median is reported")
+    ap.add_argument("--json", action="store_true", help="print raw JSON instead of a table")
+    args = ap.parse_args(argv)
+    result = measure(args.script, args.repeat)
+    print(json.dumps(result, indent=2) if args.json else report(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+# Moneyball Phil — importable pricing library
+# -----------------------------------------------------
+# Everything under this package is safe to import from batch jobs and
+# workers: nothing here imports Streamlit.
+#
+#   moneyball.odds     – vectorized odds conversion (American / decimal / text)
+#   moneyball.params   – versioned model constants (params/vNNNN.json), loaded when the kernels are imported
+#   moneyball.kernels  – per-sport pricing kernels used by the app modules
+#   moneyball.nfl      – NFL alt-line ladders on a (players × lines) grid
+#   moneyball.ats      – batch ATS / totals / moneyline scorer
+#   moneyball.parlay   – correlated parlay pricing (Gaussian copula MC)
+#   moneyball.sim      – multi-core Monte Carlo blocks with SeedSequence streams (reproducible for any worker count)
+#   moneyball.optimizer – top-K parlay search over saved legs (bounded DFS)
+#   moneyball.kelly    – simultaneous fractional-Kelly stakes across all open bets and parlays
+#   moneyball.mlb      – batch hit model over an AB-count distribution for whole lineups
+#   moneyball.nba      – batch NBA player scorer for a roster table
+#   moneyball.pitcher  – K and ER PMFs with full line ladders for a slate of starters
+#   moneyball.soccer   – batch goal tensor and markets for fixture lists
+#   moneyball.slate    – per-module row pricers behind the CLI (python -m moneyball)
+#   moneyball.backtest – priced markets, inputs and results in memory-mapped Arrow files; model replay and scoring
+#   moneyball.calibrate – maximum-likelihood fit of the model constants to the settled history
+#   moneyball.store    – SQLite store for saved boards and parlay legs
+#   moneyball.records  – typed, slotted saved plays (numbers stored, formatted at render)
+#   moneyball.odds_feed – indexed odds snapshots (CSV / JSONL import, lookups, changed markets)
+#   moneyball.odds_fetch – async feed fetcher (pooled keep-alive connections, retries, rate limit)
+#   moneyball.mock_feed – local stand-in odds server for offline development and load tests
@@ -0,0 +1,162 @@
+# Moneyball Phil — Batch ATS & Totals scorer
+# -----------------------------------------------------
+# Runs the ats_totals_app projection (base averages + form / injuries /
+# red zone / pace / park / weather adjustments) and prices all six markets
+# (spread both sides, over/under, both moneylines) for a whole table of
+# games at once, with erf evaluated on full arrays.
+#
+# ``games`` is a DataFrame (or any mapping of column → values) with the
+# form's fields: home, away, home_pf, home_pa, away_pf, away_pa,
+# spread_line_home, spread_odds_home, spread_odds_away, total_line,
+# over_odds, under_odds, ml_home, ml_away. Every advanced-adjustment field
+# is an optional column (missing = 0, auto_volatility defaults to True); a
+# "sport" column overrides the ``sport`` argument per game.
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from .kernels import (
+    calculate_ev_pct, std_norm_cdf, get_sport_sigmas, suggested_volatility, project_scores_base,
+)
+
+RESULT_COLUMNS = ["Bet Type", "Odds", "True %", "Implied %", "EV %"]
+# moneyball.odds_feed market names of the six result rows, in order
+FEED_MARKETS = ("spread_home", "spread_away", "total_over", "total_under", "ml_home", "ml_away")
+
+FOOTBALL = ("NFL", "NCAA Football")
+BASKETBALL = ("NBA", "NCAA Basketball")
+
+# Optional adjustment columns, grouped by the sports they apply to (None = all)
+ADJUSTMENTS = {
+    None: ["home_edge_pts", "away_edge_pts", "form_H_pct", "form_A_pct", "injury_H_pct", "injury_A_pct",
+           "pace_pct_global", "variance_pct_manual"],
+    FOOTBALL: ["plays_pct", "to_margin_pts", "redzone_H_pct", "redzone_A_pct"],
+    BASKETBALL: ["pace_pct_hoops", "ortg_H_pct", "ortg_A_pct", "drtg_H_pct", "drtg_A_pct", "rest_H_pct", "rest_A_pct"],
+    ("MLB",): ["sp_H_runs", "sp_A_runs", "bullpen_H_runs", "bullpen_A_runs", "park_total_pct", "weather_total_pct"],
+}
+
+
+class AtsSlate(NamedTuple):
+    home: np.ndarray
+    away: np.ndarray
+    home_pts: np.ndarray
+    away_pts: np.ndarray
+    proj_total: np.ndarray
+    proj_margin: np.ndarray
+    bet_type: np.ndarray    # (n, 6) labels, rows in results_df order
+    odds: np.ndarray        # (n, 6)
+    true_pct: np.ndarray    # (n, 6)
+    implied_pct: np.ndarray
+    ev_pct: np.ndarray
+
+    def results_df(self, formatted: bool = True):
+        """
+        The ats_totals_app results_df, six rows per game. With
+        ``formatted=False`` the % columns stay floats (in percent) for
+        callers that format at display time.
+        """
+        import pandas as pd
+        fmt = (lambda a: [f"{x:.2f}%" for x in a.ravel()]) if formatted else (lambda a: a.ravel())
+        return pd.DataFrame({
+            "Bet Type": self.bet_type.ravel(),
+            "Odds": self.odds.ravel(),
+            "True %": fmt(self.true_pct),
+            "Implied %": fmt(self.implied_pct),
+            "EV %": fmt(self.ev_pct),
+        }, columns=RESULT_COLUMNS)
+
+
+def _column(games, name: str, n: int, default):
+    col = games.get(name) if hasattr(games, "get") else None
+    if col is None:
+        return np.full(n, default)
+    return np.asarray(col)
+
+
+def volatility_pct(sports, auto_volatility, manual_pct) -> np.ndarray:
+    """Per-game σ inflation in %: the sport's suggested volatility, or the manual value."""
+    return np.where(auto_volatility, [suggested_volatility(s) for s in sports], manual_pct)
+
+
+def evaluate_games(games, sport: Optional[str] = None) -> AtsSlate:
+    n = len(np.asarray(games["home_pf"]))
+    num = lambda name, default=0.0: _column(games, name, n, default).astype(float)
+    sports = _column(games, "sport", n, sport).astype(object)
+    if any(s is None for s in sports):
+        raise ValueError("No sport given: pass sport= or include a 'sport' column.")
+
+    # Adjustments only apply to the sports whose form shows them
+    adj = {}
+    for group, names in ADJUSTMENTS.items():
+        applies = np.ones(n, dtype=bool) if group is None else np.isin(sports, group)
+        for name in names:
+            adj[name] = np.where(applies, num(name), 0.0)
+
+    # ===== Base from averages =====
+    home_pts, away_pts = project_scores_base(num("home_pf"), num("home_pa"), num("away_pf"), num("away_pa"))
+
+    # ===== Universal additive + % adjustments =====
+    home_pts = home_pts + adj["home_edge_pts"]
+    away_pts = away_pts + adj["away_edge_pts"]
+    home_pts *= (1 + adj["form_H_pct"]/100.0) * (1 + adj["injury_H_pct"]/100.0)
+    away_pts *= (1 + adj["form_A_pct"]/100.0) * (1 + adj["injury_A_pct"]/100.0)
+
+    # ===== Football specifics =====
+    home_pts += adj["to_margin_pts"]/2.0
+    away_pts -= adj["to_margin_pts"]/2.0
+    home_pts *= (1 + adj["redzone_H_pct"]/100.0)
+    away_pts *= (1 + adj["redzone_A_pct"]/100.0)
+    scale = 1 + adj["plays_pct"]/100.0
+    home_pts *= scale; away_pts *= scale
+
+    # ===== Basketball specifics =====
+    home_pts *= (1 + adj["pace_pct_hoops"]/100.0) * (1 + adj["ortg_H_pct"]/100.0) * (1 + adj["rest_H_pct"]/100.0)
+    away_pts *= (1 + adj["ortg_A_pct"]/100.0) * (1 + adj["rest_A_pct"]/100.0)
+    home_pts *= (1 + adj["drtg_A_pct"]/100.0)
+    away_pts *= (1 + adj["drtg_H_pct"]/100.0)
+
+    # ===== MLB specifics =====
+    home_pts += adj["sp_H_runs"] + adj["bullpen_H_runs"]
+    away_pts += adj["sp_A_runs"] + adj["bullpen_A_runs"]
+    factor = (1 + adj["park_total_pct"]/100.0) * (1 + adj["weather_total_pct"]/100.0)
+    home_pts *= factor; away_pts *= factor
+
+    # ===== Global pace/volatility tweaks =====
+    home_pts *= (1 + adj["pace_pct_global"]/100.0)
+    away_pts *= (1 + adj["pace_pct_global"]/100.0)
+
+    proj_total = home_pts + away_pts
+    proj_margin = home_pts - away_pts
+
+    vol = volatility_pct(sports, _column(games, "auto_volatility", n, True).astype(bool), adj["variance_pct_manual"])
+    sigmas = np.array([get_sport_sigmas(s) for s in sports], dtype=float).reshape(n, 2)
+    sd_total = sigmas[:, 0] * (1 + vol/100.0)
+    sd_margin = sigmas[:, 1] * (1 + vol/100.0)
+
+    # ===== Market probabilities (all games at once) =====
+    spread = num("spread_line_home")
+    true_home = std_norm_cdf((proj_margin + spread) / sd_margin) * 100.0
+    true_over = std_norm_cdf((proj_total - num("total_line")) / sd_total) * 100.0
+    true_home_ml = std_norm_cdf(proj_margin / sd_margin) * 100.0
+    true_pct = np.column_stack([true_home, 100.0 - true_home,
+                                true_over, np.maximum(0.0, 100.0 - true_over),
+                                true_home_ml, 100.0 - true_home_ml])
+    odds = np.column_stack([num("spread_odds_home", -110.0), num("spread_odds_away", -110.0),
+                            num("over_odds", -110.0), num("under_odds", -110.0),
+                            num("ml_home", -110.0), num("ml_away", -110.0)])
+    ev_pct, implied_pct = calculate_ev_pct(true_pct, odds)
+
+    home = _column(games, "home", n, "").astype(str)
+    away = _column(games, "away", n, "").astype(str)
+    total_line = num("total_line")
+    bet_type = np.array([[f"{h} {s:+.2f}", f"{a} {(-s):+.2f}", f"Over {t:.2f}", f"Under {t:.2f}",
+                          f"{h} ML", f"{a} ML"]
+                         for h, a, s, t in zip(home, away, spread, total_line)], dtype=object).reshape(n, 6)
+    return AtsSlate(home, away, home_pts, away_pts, proj_total, proj_margin,
+                    bet_type, odds, true_pct, implied_pct, ev_pct)
+
+
+def score_games(games, sport: Optional[str] = None):
+    """results_df for a whole slate: six rows per game, in input order."""
+    return evaluate_games(games, sport).results_df()
@@ -0,0 +1,508 @@
+# Moneyball Phil — Backtest history
+# -----------------------------------------------------
+# Every priced market, with the inputs that produced it, its odds and its
+# eventual result, kept in columnar Arrow files (one per module and
+# season) that are memory-mapped on read. Any module's current model can
+# be replayed over the stored inputs in vectorized chunks and scored
+# against the results.
+#
+#   python -m moneyball.backtest record nfl week1.csv --season 2024 --results week1_results.csv
+#   python -m moneyball.backtest settle nfl week2_results.csv --season 2024
+#   python -m moneyball.backtest report --replay --by sport,kind,tier
+#
+#   record("nfl", rows, results, season="2024")   # prices rows as the CLI does and stores each market
+#   frame = replay("nfl")                         # today's model over every stored nfl input
+#   rep = evaluate(frame)                         # BacktestReport(summary, calibration) DataFrames
+#
+# Input rows are the module's slate rows (python -m moneyball), plus an
+# optional "date". Results are rows of event, market, result and an
+# optional date; result is W / L / P (also win / loss / push, 1 / 0; blank
+# = unsettled) and matches markets case-insensitively, on date too when
+# both sides have one.
+#
+# Layout: $MONEYBALL_HISTORY (default ./history)/<module>/<season>.arrow,
+# one row per market. Inputs are stored as text in "in.<field>" columns,
+# repeated on each market of the row, so a file replays on its own.
+#
+# ROI and hit rate count the markets the model would have bet (EV above
+# ``min_ev``, with odds), at $1 each; Brier score and calibration use
+# every settled market.
+
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import sim
+from .odds_feed import iter_snapshot, norm
+from .slate import ROW_PRICERS
+
+HISTORY_ENV = "MONEYBALL_HISTORY"
+DEFAULT_ROOT = "history"
+CHUNK_ROWS = 20_000
+INPUT_PREFIX = "in."
+DEFAULT_BY = ("sport", "kind", "tier")
+DEFAULT_BINS = 10
+REPLAY_SLICE = 100_000           # markets per replay task
+REPLAY_PARALLEL_MIN = 200_000    # below this, replay runs inline
+
+MODULE_SPORT = {"nfl": "NFL", "nba": "NBA", "mlb": "MLB", "pitcher_er": "MLB", "pitcher_k": "MLB",
+                "soccer": "Soccer"}       # ats: the row's sport
+MARKET_FIELDS = ("row_id", "date", "season", "module", "sport", "event", "market", "kind", "odds", "dec_odds",
+                 "true_pct", "implied_pct", "ev", "tier", "result")
+_TEXT_FIELDS = ("date", "season", "module", "sport", "event", "market", "kind", "odds", "tier")
+_FLOAT_FIELDS = ("dec_odds", "true_pct", "implied_pct", "ev", "result")
+_RESULTS = {"w": 1.0, "win": 1.0, "won": 1.0, "hit": 1.0, "1": 1.0, "1.0": 1.0,
+            "l": 0.0, "loss": 0.0, "lost": 0.0, "miss": 0.0, "0": 0.0, "0.0": 0.0,
+            "p": np.nan, "push": np.nan, "void": np.nan, "": np.nan}
+_LINE = re.compile(r"[-+]?\d+(?:\.\d+)?(?![\d.+])")      # a line, not the "1+" of "1+ Hit"
+_SEASON = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+class RecordResult(NamedTuple):
+    rows: int              # input rows read
+    markets: int           # markets stored
+    settled: int           # of those, with a result
+    errors: List[str]      # "row N: reason" for rows the model rejected
+    paths: List[str]       # files written
+
+
+class BacktestReport(NamedTuple):
+    summary: object        # DataFrame: one row per group
+    calibration: object    # DataFrame: predicted vs actual hit rate per probability bin
+
+
+def history_root(root: Optional[str] = None) -> str:
+    return root or os.environ.get(HISTORY_ENV) or DEFAULT_ROOT
+
+
+def history_path(module: str, season: str, root: Optional[str] = None) -> str:
+    return os.path.join(history_root(root), module, f"{season}.arrow")
+
+
+def seasons(root: Optional[str] = None) -> Dict[str, List[str]]:
+    """Stored seasons per module."""
+    base, out = history_root(root), {}
+    for module in sorted(ROW_PRICERS):
+        d = os.path.join(base, module)
+        if os.path.isdir(d):
+            found = sorted(f[:-len(".arrow")] for f in os.listdir(d) if f.endswith(".arrow"))
+            if found:
+                out[module] = found
+    return out
+
+
+def read_rows(path: str) -> Iterable[dict]:
+    """Rows of a CSV / JSONL file (iter_snapshot) or a Parquet / Arrow file."""
+    if path.lower().endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+        return pq.read_table(path).to_pylist()
+    if path.lower().endswith((".arrow", ".feather")):
+        return _read(path).to_pylist()
+    return iter_snapshot(path)
+
+
+def market_kind(market: str, home: str = "", away: str = "") -> str:
+    """The market without its line: "Over 245.5 Pass Yds" → "Over Pass Yds", "Lakers +3.50" → "Home"."""
+    text = str(market)
+    for team, side in ((home, "Home"), (away, "Away")):
+        if team and text.startswith(team + " "):
+            text = side + text[len(team):]
+    return " ".join(_LINE.sub("", text).split())
+
+
+def parse_result(value) -> float:
+    """1.0 won, 0.0 lost, NaN push / void / unsettled."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return np.nan
+    key = str(value).strip().lower()
+    if key not in _RESULTS:
+        raise ValueError(f"unknown result '{value}' (W / L / P)")
+    return _RESULTS[key]
+
+
+def _season_of(row: dict, season: Optional[str]) -> str:
+    s = season or str(row.get("season") or "").strip() or str(row.get("date") or "").strip()[:4] or "unknown"
+    return _SEASON.sub("_", s)
+
+
+def _results_index(results: Iterable[dict]) -> Dict[Tuple[str, str, str], float]:
+    # (date or "", event, market) → result
+    index = {}
+    for n, row in enumerate(results, 1):
+        try:
+            index[(str(row.get("date") or "").strip(), norm(row.get("event")), norm(row.get("market")))] = \
+                parse_result(row.get("result"))
+        except ValueError as e:
+            raise ValueError(f"results row {n}: {e}") from None
+    return index
+
+
+def _lookup(index, date: str, event: str, market: str) -> Optional[float]:
+    key = (event, market)
+    if date and (date,) + key in index:
+        return index[(date,) + key]
+    return index.get(("",) + key)
+
+
+# ---------------------------
+# Arrow files
+# ---------------------------
+def _read(path: str):
+    import pyarrow as pa
+    with pa.memory_map(path, "r") as source:
+        return pa.ipc.open_file(source).read_all()      # zero-copy: buffers stay backed by the map
+
+
+def _write(path: str, table):
+    import pyarrow as pa
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=CHUNK_ROWS * 4)
+    os.replace(tmp, path)
+
+
+def _market_table(cols: Dict[str, list], inputs: Dict[str, list]):
+    import pyarrow as pa
+    arrays = {"row_id": pa.array(cols["row_id"], pa.int64())}
+    arrays.update({k: pa.array(cols[k], pa.string()) for k in _TEXT_FIELDS})
+    arrays.update({k: pa.array(cols[k], pa.float64()) for k in _FLOAT_FIELDS})
+    table = pa.table({k: arrays[k] for k in MARKET_FIELDS})
+    for name, values in inputs.items():
+        table = table.append_column(INPUT_PREFIX + name, pa.array(values, pa.string()))
+    return table
+
+
+def _modules(module, stored: Dict[str, List[str]]) -> List[str]:
+    # None = every stored module; a name or a sequence of names
+    return list(stored) if module is None else [module] if isinstance(module, str) else list(module)
+
+
+def load(module=None, season: Optional[Sequence[str]] = None, root: Optional[str] = None):
+    """
+    Stored markets as one Arrow table (memory-mapped). ``module`` is a
+    name, a list of names or None for all. Several modules share only the
+    market columns; a single module keeps its inputs.
+    """
+    import pyarrow as pa
+    stored = seasons(root)
+    modules = _modules(module, stored)
+    tables = [_read(history_path(m, s, root)) for m in modules for s in stored.get(m, [])
+              if season is None or s in season]
+    if not tables:
+        return _market_table({k: [] for k in MARKET_FIELDS}, {})
+    if len(modules) > 1:
+        tables = [t.select(list(MARKET_FIELDS)) for t in tables]
+    return pa.concat_tables(tables, promote_options="default")
+
+
+# ---------------------------
+# Record / settle
+# ---------------------------
+def _price_rows(module: str, rows: List[dict], chunk_size: int = CHUNK_ROWS) -> List[List[dict]]:
+    price = ROW_PRICERS[module]
+    out: List[List[dict]] = []
+    for start in range(0, len(rows), chunk_size):
+        out.extend(price(rows[start:start + chunk_size]))
+    return out
+
+
+def record(module: str, rows: Iterable[dict], results: Optional[Iterable[dict]] = None,
+           season: Optional[str] = None, root: Optional[str] = None, chunk_size: int = CHUNK_ROWS) -> RecordResult:
+    """
+    Price ``rows`` with the module's model and append every market, with
+    its inputs, to the season's file. ``season`` defaults to the row's
+    "season" or the year of its "date".
+    """
+    if module not in ROW_PRICERS:
+        raise ValueError(f"unknown module '{module}' ({', '.join(sorted(ROW_PRICERS))})")
+    rows = [{k: v for k, v in r.items() if k is not None} for r in rows]
+    index = _results_index(results) if results is not None else {}
+    by_season: Dict[str, List[int]] = {}
+    for i, row in enumerate(rows):
+        by_season.setdefault(_season_of(row, season), []).append(i)
+
+    errors, paths, n_markets, n_settled = [], [], 0, 0
+    for s, idx in by_season.items():
+        path = history_path(module, s, root)
+        old = _read(path) if os.path.exists(path) else None
+        next_id = int(old["row_id"].to_numpy().max()) + 1 if old is not None and old.num_rows else 0
+        season_rows = [rows[i] for i in idx]
+        fields = sorted({k for r in season_rows for k in r} - {"date", "season"})
+        cols = {k: [] for k in MARKET_FIELDS}
+        inputs = {k: [] for k in fields}
+        for k, (row, priced) in enumerate(zip(season_rows, _price_rows(module, season_rows, chunk_size))):
+            date = str(row.get("date") or "").strip()
+            sport = MODULE_SPORT.get(module) or str(row.get("sport") or "").strip()
+            for r in priced:
+                if r.get("error"):
+                    errors.append(f"row {idx[k] + 1}: {r['error']}")
+                    continue
+                result = _lookup(index, date, norm(r["event"]), norm(r["market"]))
+                implied = r["implied_pct"]
+                cols["row_id"].append(next_id + k)
+                for key, value in (("date", date), ("season", s), ("module", module), ("sport", sport),
+                                   ("event", r["event"]), ("market", r["market"]),
+                                   ("kind", market_kind(r["market"], str(row.get("home") or "").strip(),
+                                                        str(row.get("away") or "").strip())),
+                                   ("odds", "" if r["odds"] is None else str(r["odds"])), ("tier", r["tier"])):
+                    cols[key].append(value)
+                cols["dec_odds"].append(100.0 / implied if implied else np.nan)
+                cols["true_pct"].append(r["true_pct"])
+                cols["implied_pct"].append(implied)
+                cols["ev"].append(r["ev"])
+                cols["result"].append(np.nan if result is None else result)
+                for f in fields:
+                    v = row.get(f)
+                    inputs[f].append("" if v is None else str(v))
+                n_settled += result is not None and not np.isnan(result)
+        n_markets += len(cols["row_id"])
+        table = _market_table(cols, inputs)
+        if old is not None:
+            import pyarrow as pa
+            table = pa.concat_tables([old, table], promote_options="default")
+        _write(path, table)
+        paths.append(path)
+    return RecordResult(len(rows), n_markets, n_settled, errors, paths)
+
+
+def settle(module: str, results: Iterable[dict], season: Optional[Sequence[str]] = None,
+           root: Optional[str] = None) -> int:
+    """Write results onto stored markets; returns how many markets changed."""
+    import pyarrow as pa
+    index = _results_index(results)
+    changed = 0
+    for s in seasons(root).get(module, []):
+        if season is not None and s not in season:
+            continue
+        path = history_path(module, s, root)
+        table = _read(path)
+        current = table["result"].to_numpy(zero_copy_only=False)
+        updated = current.copy()
+        for i, (date, event, market) in enumerate(zip(*(table[c].to_pylist() for c in ("date", "event", "market")))):
+            result = _lookup(index, date or "", norm(event), norm(market))
+            if result is not None:
+                updated[i] = result
+        n = int(np.sum(~((updated == current) | (np.isnan(updated) & np.isnan(current)))))
+        if n:
+            table = table.set_column(table.schema.get_field_index("result"), "result", pa.array(updated, pa.float64()))
+            _write(path, table)
+            changed += n
+    return changed
+
+
+# ---------------------------
+# Replay
+# ---------------------------
+def _replay_table(module: str, table, chunk_size: int):
+    row_ids = table["row_id"].to_numpy()
+    ids, first = np.unique(row_ids, return_index=True)
+    in_cols = [c for c in table.column_names if c.startswith(INPUT_PREFIX)]
+    taken = table.take(first)
+    values = [taken[c].to_pylist() for c in in_cols]
+    names = [c[len(INPUT_PREFIX):] for c in in_cols]
+    rows = [dict(zip(names, vals)) for vals in zip(*values)]
+
+    replayed: Dict[Tuple[int, str], dict] = {}
+    for rid, priced in zip(ids.tolist(), _price_rows(module, rows, chunk_size)):
+        for r in priced:
+            if not r.get("error"):
+                replayed[(rid, r["market"])] = r
+    true_pct = np.full(table.num_rows, np.nan)
+    implied = np.full(table.num_rows, np.nan)
+    ev = np.full(table.num_rows, np.nan)
+    tier = [None] * table.num_rows
+    for i, key in enumerate(zip(row_ids.tolist(), table["market"].to_pylist())):
+        r = replayed.get(key)
+        if r is not None:
+            true_pct[i], implied[i], ev[i], tier[i] = r["true_pct"], r["implied_pct"], r["ev"], r["tier"]
+    return true_pct, implied, ev, tier
+
+
+def _slices(row_ids: np.ndarray, size: int) -> List[Tuple[int, int]]:
+    # (start, stop) ranges of about ``size`` markets that never split an input row
+    cuts = [0]
+    while cuts[-1] + size < row_ids.size:
+        cuts.append(int(np.searchsorted(row_ids, row_ids[cuts[-1] + size], side="right")))
+    cuts = [c for c in cuts if c < row_ids.size] or [0]
+    return list(zip(cuts, cuts[1:] + [row_ids.size]))
+
+
+def _replay_slice(module: str, path: str, start: int, stop: int, chunk_size: int):
+    # Runs in pool workers: each reads (maps) the file itself
+    return _replay_table(module, _read(path).slice(start, stop - start), chunk_size)
+
+
+def replay(module=None, season: Optional[Sequence[str]] = None, root: Optional[str] = None,
+           chunk_size: int = CHUNK_ROWS, workers: Optional[int] = None):
+    """
+    Re-price every stored input with today's model. Returns the markets as
+    a DataFrame whose true_pct / implied_pct / ev / tier are the replayed
+    ones (the stored ones stay in recorded_true_pct and recorded_ev);
+    markets the model no longer produces are dropped.
+
+    Files are split into slices of whole input rows that replay on the
+    moneyball.sim process pool; ``workers`` None uses every core for
+    large histories ($MONEYBALL_WORKERS overrides) and 1 runs inline.
+    """
+    import pandas as pd
+    stored = seasons(root)
+    files = [(m, history_path(m, s, root)) for m in _modules(module, stored)
+             for s in stored.get(m, []) if season is None or s in season]
+    if not files:
+        return load(module, season, root).to_pandas()
+    tables = [_read(path) for _, path in files]
+    slices = [_slices(t["row_id"].to_numpy(), REPLAY_SLICE) for t in tables]
+    jobs = [(m, path, a, b, chunk_size) for (m, path), sl in zip(files, slices) for a, b in sl]
+    total = sum(t.num_rows for t in tables)
+    if workers is None:
+        workers = sim.default_workers(sim.PARALLEL_MIN_DRAWS if total >= REPLAY_PARALLEL_MIN else 0)
+    workers = min(len(jobs), max(1, int(workers)))
+    if workers > 1:
+        try:
+            parts = list(sim.get_pool(workers).map(_replay_slice, *zip(*jobs)))
+        except BrokenProcessPool:
+            sim.shutdown_pool()
+            workers = 1
+    if workers <= 1:
+        parts = [_replay_slice(*job) for job in jobs]
+
+    frames, k = [], 0
+    for table, sl in zip(tables, slices):
+        file_parts, k = parts[k:k + len(sl)], k + len(sl)
+        true_pct, implied, ev = (np.concatenate([p[i] for p in file_parts]) for i in range(3))
+        df = table.select(list(MARKET_FIELDS)).to_pandas()
+        df["recorded_true_pct"], df["recorded_ev"] = df["true_pct"], df["ev"]
+        df["true_pct"], df["implied_pct"], df["ev"] = true_pct, implied, ev
+        df["tier"] = [t for p in file_parts for t in p[3]]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            df["dec_odds"] = np.where(implied > 0, 100.0 / implied, np.nan)
+        frames.append(df[~np.isnan(true_pct)])
+    return pd.concat(frames, ignore_index=True)
+
+
+# ---------------------------
+# Scoring
+# ---------------------------
+def evaluate(markets, by: Sequence[str] = DEFAULT_BY, bins: int = DEFAULT_BINS, min_ev: float = 0.0,
+             curve_by: Sequence[str] = ("sport",)) -> BacktestReport:
+    """
+    ROI, hit rate, Brier score and calibration for a markets table
+    (load() / replay() output, Arrow table or DataFrame), grouped by
+    ``by``; calibration curves are grouped by ``curve_by`` over ``bins``
+    equal-width probability bins.
+    """
+    import pandas as pd
+    df = markets if isinstance(markets, pd.DataFrame) else markets.to_pandas()
+    p = np.clip(df["true_pct"].to_numpy(dtype=float) / 100.0, 0.0, 1.0)
+    result = df["result"].to_numpy(dtype=float)
+    dec = df["dec_odds"].to_numpy(dtype=float)
+    settled = ~np.isnan(result) & ~np.isnan(p)
+    bet = settled & (df["ev"].to_numpy(dtype=float) > min_ev) & (dec > 1.0)
+    won = np.where(settled, result, 0.0)
+    calc = pd.DataFrame({
+        "markets": settled.astype(int),
+        "bets": bet.astype(int),
+        "hits": np.where(bet, won, 0.0),
+        "profit": np.where(bet, np.where(won > 0, dec - 1.0, -1.0), 0.0),
+        "sq_err": np.where(settled, (p - won) ** 2, 0.0),
+        "p_sum": np.where(settled, p, 0.0),
+        "won_sum": won,
+    })
+    keys = [df[k].fillna("").astype(str) for k in by] or [pd.Series("All", index=df.index, name="group")]
+    g = calc.groupby(keys, sort=True).sum()
+    markets_n, bets_n = g["markets"].to_numpy(float), g["bets"].to_numpy(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        summary = pd.DataFrame({
+            "Markets": g["markets"].astype(int),
+            "Bets": g["bets"].astype(int),
+            "Hit %": np.round(g["hits"] / bets_n * 100, 2),
+            "Profit (u)": np.round(g["profit"], 2),
+            "ROI %": np.round(g["profit"] / bets_n * 100, 2),
+            "Brier": np.round(g["sq_err"] / markets_n, 4),
+            "Avg True %": np.round(g["p_sum"] / markets_n * 100, 2),
+            "Actual %": np.round(g["won_sum"] / markets_n * 100, 2),
+        }, index=g.index).reset_index()
+    summary = summary[summary["Markets"] > 0].reset_index(drop=True)
+
+    cal = pd.DataFrame({"n": 1, "p": p, "won": won})[settled]
+    bin_idx = np.minimum((cal["p"].to_numpy() * bins).astype(int), bins - 1)   # settled rows only: no NaN casts
+    cal_keys = [df.loc[settled, k].fillna("").astype(str) for k in curve_by] + \
+               [pd.Series(bin_idx, index=cal.index, name="bin")]
+    c = cal.groupby(cal_keys, sort=True).agg(n=("n", "sum"), p=("p", "mean"), won=("won", "mean")).reset_index()
+    width = 100.0 / bins
+    calibration = pd.DataFrame({
+        **{k: c[k] for k in curve_by},
+        "Bin": [f"{b * width:g}–{(b + 1) * width:g}%" for b in c["bin"]],
+        "n": c["n"].astype(int),
+        "Predicted %": np.round(c["p"] * 100, 2),
+        "Actual %": np.round(c["won"] * 100, 2),
+    })
+    return BacktestReport(summary, calibration)
+
+
+# ---------------------------
+# CLI
+# ---------------------------
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m moneyball.backtest",
+                                 description="Record priced markets with results and backtest the models.")
+    ap.add_argument("--root", help=f"history directory (default: ${HISTORY_ENV} or ./{DEFAULT_ROOT})")
+    sub = ap.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="price a slate file and store every market")
+    rec.add_argument("module", choices=sorted(ROW_PRICERS))
+    rec.add_argument("input", help="slate rows: CSV, JSONL or Parquet")
+    rec.add_argument("--results", help="results file (event, market, result[, date])")
+    rec.add_argument("--season", help="default: the row's season, else the year of its date")
+    st = sub.add_parser("settle", help="write results onto stored markets")
+    st.add_argument("module", choices=sorted(ROW_PRICERS))
+    st.add_argument("results")
+    st.add_argument("--season", action="append")
+    rep = sub.add_parser("report", help="ROI, hit rate, Brier score and calibration")
+    rep.add_argument("--module", choices=sorted(ROW_PRICERS))
+    rep.add_argument("--season", action="append")
+    rep.add_argument("--replay", action="store_true", help="re-price the stored inputs with today's model")
+    rep.add_argument("--by", default=",".join(DEFAULT_BY), help="comma-separated group columns")
+    rep.add_argument("--bins", type=int, default=DEFAULT_BINS)
+    rep.add_argument("--min-ev", type=float, default=0.0, help="bet markets with EV above this")
+    rep.add_argument("--calibration", action="store_true", help="also print the calibration table")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    try:
+        if args.command == "record":
+            res = record(args.module, read_rows(args.input),
+                         read_rows(args.results) if args.results else None, args.season, args.root)
+            for err in res.errors[:10]:
+                print(f"warning: {err}", file=sys.stderr)
+            print(f"[{args.module}] {res.rows} rows → {res.markets} markets ({res.settled} settled, "
+                  f"{len(res.errors)} errors) → {', '.join(res.paths) or 'nothing written'}", file=sys.stderr)
+        elif args.command == "settle":
+            n = settle(args.module, read_rows(args.results), args.season, args.root)
+            print(f"[{args.module}] {n} markets settled", file=sys.stderr)
+        else:
+            frame = replay(args.module, args.season, args.root) if args.replay else \
+                load(args.module, args.season, args.root)
+            by = [b.strip() for b in args.by.split(",") if b.strip()]
+            report = evaluate(frame, by, args.bins, args.min_ev)
+            print(report.summary.to_string(index=False))
+            if args.calibration:
+                print()
+                print(report.calibration.to_string(index=False))
+            print(f"{len(frame):,} markets in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # Run the package's copy so replay tasks pickle by an importable name, not __main__
+    from moneyball.backtest import main as package_main
+    sys.exit(package_main())
@@ -0,0 +1,465 @@
+# Moneyball Phil — Parameter calibration
+# -----------------------------------------------------
+# Fits the model constants in moneyball.params to the settled markets in
+# the backtest history (moneyball.backtest) by maximum likelihood: every
+# market's result is a Bernoulli draw with the model's probability for
+# the side that was priced. The model inputs behind each constant are
+# rebuilt from the stored slate rows once; candidate values are then
+# scored on whole arrays.
+#
+#   python -m moneyball.calibrate                       # fit everything with enough data, print the table
+#   python -m moneyball.calibrate --write               # … and save it as the next params version
+#   python -m moneyball.calibrate --only nfl,soccer.def_factor --season 2024 --season 2025
+#
+#   fits = calibrate(season=["2024"])                   # [Fit(label, param, n, current, fitted, ll_current, ll_fitted, …)]
+#   write_fits(fits)                                    # → params.ParamSet of the new version
+#
+# Scalar constants (each sport's ATS sigmas count as two) are searched on
+# a grid split across the moneyball.sim process pool, then refined with a
+# bounded 1-D search around the best grid point. The MLB AVG weights are
+# fitted by a gradient search on the simplex (SLSQP). Constants with fewer
+# than MIN_MARKETS settled markets, or whose fit does not beat the current
+# value, keep the current value.
+
+import argparse
+import copy
+import sys
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import ats, backtest, nba, nfl, params, sim, slate
+from .kernels import (
+    AVG_WEIGHTS, DEF_FACTOR, NBA_POINTS_SCALE, NBA_PRA_SCALE, NFL_RECEPTIONS_SCALE, NFL_TDS_SCALE,
+    NFL_YARDS_SCALE, PA_PER_INNING, SPORT_SIGMAS, SOCCER_MARKETS, defense_logit_shift, pitcher_difficulty,
+    std_norm_cdf,
+)
+
+MIN_MARKETS = 200
+GRID_POINTS = 48
+GRID_CHUNK = 8          # grid values per pool task
+_EPS = 1e-9
+
+
+class Target(NamedTuple):
+    label: str                  # "nfl.yards_scale", "ats.sigmas[NFL].margin"
+    param: str                  # moneyball.params name
+    key: Tuple                  # position inside the parameter's value (() = the value itself)
+    current: float
+    grid: np.ndarray
+    scorer: str                 # _SCORERS name: (features, values) → log-likelihood per value
+    features: Dict[str, np.ndarray]
+
+    @property
+    def n(self) -> int:
+        return int(self.features["y"].size)
+
+
+class Fit(NamedTuple):
+    label: str
+    param: str
+    key: Tuple
+    n: int                      # settled markets used
+    current: Any
+    fitted: Any
+    ll_current: float
+    ll_fitted: float
+    at_edge: bool               # best grid point on the edge of the grid
+
+    @property
+    def improved(self) -> bool:
+        return self.ll_fitted > self.ll_current
+
+
+# ---------------------------
+# Log-likelihood scorers (top level, so pool workers can run them)
+# ---------------------------
+def _bernoulli(p: np.ndarray, y: np.ndarray) -> float:
+    p = np.clip(p, _EPS, 1.0 - _EPS)
+    return float(np.sum(y * np.log(p) + (1.0 - y) * np.log1p(-p)))
+
+
+def _ll_logistic(f, values) -> np.ndarray:
+    # P(over) = clip(sigmoid((x − line) / scale + shift)); the side's probability is over or 1 − over
+    out = np.empty(len(values))
+    for i, s in enumerate(values):
+        with np.errstate(over="ignore"):
+            over = np.clip(1.0 / (1.0 + np.exp(-((f["x"] - f["line"]) / s + f["shift"]))), f["lo"], f["hi"])
+        out[i] = _bernoulli(np.where(f["side"] > 0, over, 1.0 - over), f["y"])
+    return out
+
+
+def _ll_normal(f, values) -> np.ndarray:
+    # ATS: P(side) = Φ(side · d / (σ · (1 + vol)))
+    return np.array([_bernoulli(std_norm_cdf(f["side"] * f["d"] / (s * f["inflation"])), f["y"]) for s in values])
+
+
+def _ll_batters_faced(f, values) -> np.ndarray:
+    # Ks ~ Binomial(round(IP · PA per inning), pK); over = P(K > floor(line))
+    from scipy.stats import binom
+    out = np.empty(len(values))
+    for i, pa in enumerate(values):
+        n_bf = np.maximum(1, np.rint(f["ip"] * pa))
+        over = binom.sf(f["k_under"], n_bf, f["pK"])
+        out[i] = _bernoulli(np.where(f["side"] > 0, over, 1.0 - over), f["y"])
+    return out
+
+
+def _ll_def_factor(f, values) -> np.ndarray:
+    # λ = (xG for · xGA against) / DEF_FACTOR, then the Dixon-Coles goal grid
+    from .soccer import evaluate_fixtures
+    out = np.empty(len(values))
+    for i, c in enumerate(values):
+        try:
+            probs = evaluate_fixtures(f["base_home"] / c, f["base_away"] / c, rho=f["rho"]).probs
+        except ValueError:          # ρ outside the valid range for these λ
+            out[i] = -np.inf
+            continue
+        p = np.select([f["market"] == k for k in range(len(SOCCER_MARKETS))],
+                      [probs[key][f["fixture"]] for key in SOCCER_MARKETS])
+        out[i] = _bernoulli(p, f["y"])
+    return out
+
+
+_SCORERS: Dict[str, Callable] = {"logistic": _ll_logistic, "normal": _ll_normal,
+                                 "batters_faced": _ll_batters_faced, "def_factor": _ll_def_factor}
+
+
+def _score_task(scorer: str, features, values) -> np.ndarray:
+    return _SCORERS[scorer](features, np.asarray(values, dtype=float))
+
+
+# ---------------------------
+# History → model inputs
+# ---------------------------
+def _history(module: str, season, root, parse_row):
+    """
+    (parsed rows, settled markets DataFrame) for a module; each market's
+    "row" indexes the parsed rows. Rows the parser rejects are dropped.
+    """
+    table = backtest.load(module, season, root)
+    if not table.num_rows:
+        return [], None
+    df = table.to_pandas()
+    df = df[df["result"].notna()].reset_index(drop=True)
+    if df.empty:
+        return [], None
+    import pandas as pd
+    codes, _ = pd.factorize(df["season"].astype(str) + ":" + df["row_id"].astype(str))
+    first = pd.Series(np.arange(len(df))).groupby(codes).first().to_numpy()
+    in_cols = [c for c in df.columns if c.startswith(backtest.INPUT_PREFIX)]
+    names = [c[len(backtest.INPUT_PREFIX):] for c in in_cols]
+    parsed, remap = [], np.full(len(first), -1)
+    for i, values in enumerate(df.iloc[first][in_cols].itertuples(index=False, name=None)):
+        row = {k: (v if isinstance(v, str) else None) for k, v in zip(names, values)}
+        try:
+            parsed.append(parse_row(row))
+        except Exception:
+            continue
+        remap[i] = len(parsed) - 1
+    df["row"] = remap[codes]
+    return parsed, df[df["row"] >= 0].reset_index(drop=True)
+
+
+def _market_index(df, labels_of_row: Callable[[int], Sequence[str]]) -> np.ndarray:
+    # Position of each stored market among its row's market labels (−1: no longer priced)
+    cache: Dict[int, Dict[str, int]] = {}
+    out = np.empty(len(df), dtype=int)
+    for i, (r, market) in enumerate(zip(df["row"].to_numpy(), df["market"].to_numpy())):
+        if r not in cache:
+            cache[r] = {label: j for j, label in enumerate(labels_of_row(r))}
+        out[i] = cache[r].get(market, -1)
+    return out
+
+
+def _target(label, param, key, current, grid, scorer, features, mask) -> Target:
+    return Target(label, param, key, float(current), np.asarray(grid, dtype=float), scorer,
+                  {k: (v[mask] if isinstance(v, np.ndarray) and v.shape[:1] == mask.shape else v)
+                   for k, v in features.items()})
+
+
+def _nfl_targets(season, root) -> List[Target]:
+    parsed, df = _history("nfl", season, root, slate._nfl_fields)
+    if df is None or df.empty:
+        return []
+    group, _, ypg, def_yds, std_line, alt_line, per_game, def_per_game, second_line, _ = \
+        (np.asarray(c) for c in zip(*parsed))
+    _, adj_ypg, adj_2nd = nfl.project(group, ypg.astype(float), per_game.astype(float), def_yds.astype(float),
+                                      def_per_game.astype(float))
+    std_line, alt_line, second_line = (a.astype(float) for a in (std_line, alt_line, second_line))
+    j = _market_index(df, lambda r: slate._nfl_labels(group[r], std_line[r], alt_line[r], second_line[r]))
+    row = df["row"].to_numpy()
+    lines = np.column_stack([std_line, std_line, alt_line, second_line, second_line])
+    ok = j >= 0
+    features = {"x": np.where(j >= 3, adj_2nd[row], adj_ypg[row]), "line": lines[row, np.maximum(j, 0)],
+                "side": np.where(np.isin(j, (1, 4)), -1.0, 1.0), "shift": 0.0, "lo": 0.0, "hi": 1.0,
+                "y": df["result"].to_numpy(dtype=float)}
+    qb = group[row] == "QB"
+    return [
+        _target("nfl.yards_scale", "nfl.yards_scale", (), NFL_YARDS_SCALE, np.geomspace(2, 80, GRID_POINTS),
+                "logistic", features, ok & (j < 3)),
+        _target("nfl.receptions_scale", "nfl.receptions_scale", (), NFL_RECEPTIONS_SCALE,
+                np.geomspace(0.2, 8, GRID_POINTS), "logistic", features, ok & (j >= 3) & ~qb),
+        _target("nfl.tds_scale", "nfl.tds_scale", (), NFL_TDS_SCALE, np.geomspace(0.05, 4, GRID_POINTS),
+                "logistic", features, ok & (j >= 3) & qb),
+    ]
+
+
+def _nba_targets(season, root) -> List[Target]:
+    parsed, df = _history("nba", season, root, slate._nba_fields)
+    if df is None or df.empty:
+        return []
+    col = lambda key: [f[key] for f in parsed]
+    res = nba.price_players(col("player"), *(col(key) for key in nba.ROSTER_COLUMNS))
+    kinds = np.where(res.stat_type == "Points Only", "Points", "PRA")
+    j = _market_index(df, lambda r: (f"Over {res.line[r]:g} {kinds[r]}", f"Under {res.line[r]:g} {kinds[r]}",
+                                     f"Over {res.alt_line[r]:g} {kinds[r]} (Alt)"))
+    row = df["row"].to_numpy()
+    line = np.where(j == 2, res.alt_line[row], res.line[row])
+    features = {"x": res.projection[row], "line": line, "side": np.where(j == 1, -1.0, 1.0),
+                "shift": defense_logit_shift(np.asarray(col("def_rank"), dtype=float))[row], "lo": 0.10, "hi": 0.90,
+                "y": df["result"].to_numpy(dtype=float)}
+    ok = (j >= 0) & (line > 0)
+    points = res.stat_type[row] == "Points Only"
+    return [
+        _target("nba.points_scale", "nba.points_scale", (), NBA_POINTS_SCALE, np.geomspace(1, 40, GRID_POINTS),
+                "logistic", features, ok & points),
+        _target("nba.pra_scale", "nba.pra_scale", (), NBA_PRA_SCALE, np.geomspace(1, 40, GRID_POINTS),
+                "logistic", features, ok & ~points),
+    ]
+
+
+def _ats_targets(season, root) -> List[Target]:
+    parsed, df = _history("ats", season, root, slate._ats_fields)
+    if df is None or df.empty:
+        return []
+    res = ats.evaluate_games({k: [f[k] for f in parsed] for k in parsed[0]})
+    sports = np.array([f["sport"] for f in parsed], dtype=object)
+    vol = ats.volatility_pct(sports, np.array([f["auto_volatility"] for f in parsed]),
+                             np.array([f["variance_pct_manual"] for f in parsed], dtype=float))
+    spread = np.array([f["spread_line_home"] for f in parsed], dtype=float)
+    total_line = np.array([f["total_line"] for f in parsed], dtype=float)
+    j = _market_index(df, lambda r: res.bet_type[r])
+    row = df["row"].to_numpy()
+    d = np.column_stack([res.proj_margin + spread, res.proj_margin + spread, res.proj_total - total_line,
+                         res.proj_total - total_line, res.proj_margin, res.proj_margin])
+    features = {"d": d[row, np.maximum(j, 0)], "side": np.where(np.isin(j, (1, 3, 5)), -1.0, 1.0),
+                "inflation": 1.0 + vol[row] / 100.0, "y": df["result"].to_numpy(dtype=float)}
+    keyed = np.array([s if s in SPORT_SIGMAS else "default" for s in sports], dtype=object)[row]
+    targets = []
+    for sport in sorted(set(keyed)):
+        for k, name, markets in ((0, "total", (2, 3)), (1, "margin", (0, 1, 4, 5))):
+            targets.append(_target(f"ats.sigmas[{sport}].{name}", "ats.sigmas", (sport, k), SPORT_SIGMAS[sport][k],
+                                   np.geomspace(0.5, 60, GRID_POINTS), "normal", features,
+                                   (j >= 0) & (keyed == sport) & np.isin(j, markets)))
+    return targets
+
+
+def _pitcher_k_targets(season, root) -> List[Target]:
+    parsed, df = _history("pitcher_k", season, root, slate._pitcher_k_fields)
+    if df is None or df.empty:
+        return []
+    k_line = np.array([f["k_line"] for f in parsed], dtype=float)
+    j = _market_index(df, lambda r: (f"O{parsed[r]['k_line']} K", f"U{parsed[r]['k_line']} K"))
+    row = df["row"].to_numpy()
+    features = {"ip": np.array([f["expected_ip"] for f in parsed], dtype=float)[row],
+                "pK": np.array([f["pK"] for f in parsed], dtype=float)[row],
+                "k_under": np.floor(k_line)[row], "side": np.where(j == 1, -1.0, 1.0),
+                "y": df["result"].to_numpy(dtype=float)}
+    return [_target("pitcher.pa_per_inning", "pitcher.pa_per_inning", (), PA_PER_INNING,
+                    np.linspace(3.4, 5.2, GRID_POINTS), "batters_faced", features, j >= 0)]
+
+
+def _soccer_targets(season, root) -> List[Target]:
+    parsed, df = _history("soccer", season, root, slate._soccer_fields)
+    if df is None or df.empty:
+        return []
+    labels = [slate._SOCCER_LABELS[key] for key in SOCCER_MARKETS]
+    j = _market_index(df, lambda r: labels)
+    row = df["row"].to_numpy()
+    used, fixture = np.unique(row, return_inverse=True)      # only fixtures with settled markets
+    f_used = [parsed[r] for r in used]
+    features = {"base_home": np.array([f["lam_home"] for f in f_used]) * DEF_FACTOR,
+                "base_away": np.array([f["lam_away"] for f in f_used]) * DEF_FACTOR,
+                "rho": np.array([f["rho"] for f in f_used]), "fixture": fixture, "market": j,
+                "y": df["result"].to_numpy(dtype=float)}
+    ok = j >= 0
+    features = {k: (v[ok] if k in ("fixture", "market", "y") else v) for k, v in features.items()}
+    return [Target("soccer.def_factor", "soccer.def_factor", (), float(DEF_FACTOR), np.linspace(0.6, 2.4, GRID_POINTS),
+                   "def_factor", features)]
+
+
+def _mlb_features(season, root):
+    parsed, df = _history("mlb", season, root, slate._mlb_fields)
+    if df is None or df.empty:
+        return None
+    from .mlb import expected_ab
+    row = df["row"].to_numpy()
+    col = lambda key: np.array([f[key] for f in parsed], dtype=float)[row]
+    adjustment, _ = pitcher_difficulty(col("pitcher_whip"), col("pitcher_era"))
+    return {"avgs": np.column_stack([col(k) for k in ("season_avg", "last7_avg", "split_avg", "hand_avg",
+                                                      "pitcher_avg")]),
+            "adjustment": adjustment, "est_ab": expected_ab(col("order").astype(int)),
+            "y": df["result"].to_numpy(dtype=float)}
+
+
+TARGETS: Dict[str, Callable] = {"nfl": _nfl_targets, "nba": _nba_targets, "ats": _ats_targets,
+                                "pitcher_k": _pitcher_k_targets, "soccer": _soccer_targets}
+
+
+# ---------------------------
+# Fitting
+# ---------------------------
+def _grid_search(targets: List[Target], workers: Optional[int]) -> List[np.ndarray]:
+    # Log-likelihood of every grid value of every target; chunks run on the sim pool
+    jobs = [(t.scorer, t.features, t.grid[a:a + GRID_CHUNK]) for t in targets
+            for a in range(0, t.grid.size, GRID_CHUNK)]
+    if workers is None:
+        workers = sim.default_workers(sim.PARALLEL_MIN_DRAWS if sum(t.n for t in targets) >= 100_000 else 0)
+    workers = min(len(jobs), max(1, int(workers)))
+    parts = None
+    if workers > 1:
+        try:
+            parts = list(sim.get_pool(workers).map(_score_task, *zip(*jobs)))
+        except BrokenProcessPool:
+            sim.shutdown_pool()
+    if parts is None:
+        parts = [_score_task(*job) for job in jobs]
+    out, k = [], 0
+    for t in targets:
+        n_chunks = -(-t.grid.size // GRID_CHUNK)
+        out.append(np.concatenate(parts[k:k + n_chunks]))
+        k += n_chunks
+    return out
+
+
+def _refine(t: Target, ll_grid: np.ndarray) -> Tuple[float, float, bool]:
+    from scipy.optimize import minimize_scalar
+    best = int(np.argmax(ll_grid))
+    lo, hi = t.grid[max(best - 1, 0)], t.grid[min(best + 1, t.grid.size - 1)]
+    value, ll = float(t.grid[best]), float(ll_grid[best])
+    if hi > lo and np.isfinite(ll):
+        res = minimize_scalar(lambda v: -_score_task(t.scorer, t.features, [v])[0], bounds=(lo, hi),
+                              method="bounded", options={"xatol": 1e-4 * value})
+        if res.success and -res.fun > ll:
+            value, ll = float(res.x), float(-res.fun)
+    return value, ll, best in (0, t.grid.size - 1)
+
+
+def _fit_weights(features, current: Sequence[float]) -> Tuple[List[float], float, float]:
+    # Gradient search for the five AVG weights on the simplex
+    from scipy.optimize import minimize
+    from .mlb import hit_probability
+
+    def ll(w):
+        avg = np.clip(features["avgs"] @ w + features["adjustment"], 0.0, 1.0)
+        return _bernoulli(hit_probability(avg, features["est_ab"]), features["y"])
+
+    w0 = np.asarray(current, dtype=float)
+    res = minimize(lambda w: -ll(w), w0, method="SLSQP", bounds=[(0.0, 1.0)] * w0.size,
+                   constraints=[{"type": "eq", "fun": lambda w: w.sum() - 1.0}],
+                   options={"maxiter": 200, "ftol": 1e-10})
+    w = np.clip(res.x, 0.0, 1.0)
+    w = np.round(w / w.sum(), 4)
+    w[np.argmax(w)] += 1.0 - w.sum()         # keep the rounded weights summing to exactly 1
+    return [float(x) for x in w], ll(w0), ll(w)
+
+
+def _selected(label: str, only: Optional[Sequence[str]]) -> bool:
+    return not only or any(label == o or label.startswith(o + ".") or label.startswith(o + "[") for o in only)
+
+
+def calibrate(season: Optional[Sequence[str]] = None, root: Optional[str] = None,
+              only: Optional[Sequence[str]] = None, min_markets: int = MIN_MARKETS,
+              workers: Optional[int] = None) -> List[Fit]:
+    """
+    Fit every constant with at least ``min_markets`` settled markets in the
+    history. ``only`` limits the fit to parameter names or prefixes
+    ("nfl", "ats.sigmas", "soccer.def_factor").
+    """
+    targets = [t for build in TARGETS.values() for t in build(season, root)
+               if _selected(t.label, only) and t.n >= min_markets]
+    fits = []
+    for t, ll_grid in zip(targets, _grid_search(targets, workers) if targets else []):
+        value, ll, edge = _refine(t, ll_grid)
+        ll_current = float(_score_task(t.scorer, t.features, [t.current])[0])
+        fits.append(Fit(t.label, t.param, t.key, t.n, t.current, round(value, 4), ll_current, ll, edge))
+    if _selected("mlb.avg_weights", only):
+        features = _mlb_features(season, root)
+        if features is not None and features["y"].size >= min_markets:
+            fitted, ll_current, ll = _fit_weights(features, AVG_WEIGHTS)
+            fits.append(Fit("mlb.avg_weights", "mlb.avg_weights", (), int(features["y"].size), list(AVG_WEIGHTS),
+                            fitted, ll_current, ll, False))
+    return fits
+
+
+def write_fits(fits: Sequence[Fit], meta: Optional[Dict[str, Any]] = None,
+               root: Optional[str] = None) -> Optional[params.ParamSet]:
+    """Save the improved fits over the active parameters as the next version (None if none improved)."""
+    values = copy.deepcopy(params.ACTIVE.values)
+    changed = [f for f in fits if f.improved]
+    if not changed:
+        return None
+    for f in changed:
+        if f.key:
+            sport, k = f.key
+            values[f.param][sport][k] = f.fitted
+        else:
+            values[f.param] = f.fitted
+    record = {f.label: {"markets": f.n, "previous": f.current, "fitted": f.fitted,
+                        "loglik_previous": round(f.ll_current, 3), "loglik_fitted": round(f.ll_fitted, 3),
+                        "grid_edge": f.at_edge} for f in changed}
+    record.update(meta or {})
+    return params.write({name: values[name] for name in {f.param for f in changed}}, fit=record, root=root)
+
+
+def report(fits: Sequence[Fit]) -> str:
+    fmt = lambda v: "[" + ", ".join(f"{x:g}" for x in v) + "]" if isinstance(v, list) else f"{v:g}"
+    lines = [f"{'parameter':<34} {'markets':>8} {'current':>28} {'fitted':>28} {'LL current':>12} {'LL fitted':>12}"
+             f" {'Δ LL/1k':>8}"]
+    for f in fits:
+        note = "  (grid edge)" if f.at_edge else ("" if f.improved else "  (kept)")
+        lines.append(f"{f.label:<34} {f.n:>8,} {fmt(f.current):>28} {fmt(f.fitted):>28} {f.ll_current:>12.1f} "
+                     f"{f.ll_fitted:>12.1f} {(f.ll_fitted - f.ll_current) / f.n * 1000:>8.2f}{note}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m moneyball.calibrate",
+                                 description="Fit the model constants to the backtest history by maximum likelihood.")
+    ap.add_argument("--root", help=f"history directory (default: ${backtest.HISTORY_ENV} or ./{backtest.DEFAULT_ROOT})")
+    ap.add_argument("--params-dir", help=f"parameter versions (default: ${params.PARAMS_ENV} or {params.DEFAULT_DIR})")
+    ap.add_argument("--season", action="append", help="fit on these seasons only (repeatable)")
+    ap.add_argument("--only", help="comma-separated parameter names or prefixes")
+    ap.add_argument("--min-markets", type=int, default=MIN_MARKETS)
+    ap.add_argument("--workers", type=int, help="pool workers for the grid (default: every core for large fits)")
+    ap.add_argument("--write", action="store_true", help="save the improved values as the next params version")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    only = [o.strip() for o in args.only.split(",") if o.strip()] if args.only else None
+    try:
+        fits = calibrate(args.season, args.root, only, args.min_markets, args.workers)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    if not fits:
+        print(f"nothing to fit: no parameter has {args.min_markets}+ settled markets in the history", file=sys.stderr)
+        return 1
+    print(report(fits))
+    print(f"{sum(f.n for f in fits):,} markets fitted in {time.perf_counter() - t0:.2f}s "
+          f"(active params v{params.ACTIVE.version})", file=sys.stderr)
+    if args.write:
+        saved = write_fits(fits, {"history": backtest.history_root(args.root), "seasons": args.season or "all"},
+                           args.params_dir)
+        print(f"wrote {saved.path} (v{saved.version})" if saved else "no parameter improved; nothing written",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    # Run the package's copy so grid tasks pickle by an importable name, not __main__
+    from moneyball.calibrate import main as package_main
+    sys.exit(package_main())
@@ -0,0 +1,107 @@
+# Moneyball Phil — Headless slate runner
+# -----------------------------------------------------
+# Streams a slate file (CSV or JSONL, one row per player/match with the
+# same fields the module's form collects) through the module's model in
+# fixed-size chunks and writes priced rows as they are produced, so memory
+# stays flat no matter how large the input is.
+#
+#   python -m moneyball nfl props.csv -o priced.csv
+#   python -m moneyball soccer fixtures.jsonl -o - --chunk-size 5000
+#
+# Throughput is reported on stderr when the run finishes.
+
+import argparse
+import contextlib
+import csv
+import json
+import sys
+import time
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from .slate import OUTPUT_FIELDS, PRICERS
+
+
+def _infer_format(path: str, explicit: Optional[str]) -> str:
+    if explicit:
+        return explicit
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def read_rows(fh: TextIO, fmt: str) -> Iterator[dict]:
+    if fmt == "jsonl":
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        yield from csv.DictReader(fh)
+
+
+def chunked(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _Writer:
+    def __init__(self, fh: TextIO, fmt: str):
+        self.fh, self.fmt = fh, fmt
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(fh, fieldnames=OUTPUT_FIELDS, extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write(self, rows: List[dict]):
+        if self._csv is not None:
+            self._csv.writerows(rows)
+        else:
+            self.fh.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in rows)
+
+
+def run(module: str, src: TextIO, dst: TextIO, in_fmt: str, out_fmt: str, chunk_size: int = 1000) -> dict:
+    """Price every row of ``src`` into ``dst``; returns run stats."""
+    price_chunk = PRICERS[module]
+    writer = _Writer(dst, out_fmt)
+    n_in = n_out = n_err = 0
+    t0 = time.perf_counter()
+    for chunk in chunked(read_rows(src, in_fmt), chunk_size):
+        priced = price_chunk(chunk)
+        writer.write(priced)
+        n_in += len(chunk)
+        n_out += len(priced)
+        n_err += sum(1 for r in priced if r.get("error"))
+    elapsed = time.perf_counter() - t0
+    return {"rows": n_in, "results": n_out, "errors": n_err, "seconds": elapsed,
+            "rows_per_sec": n_in / elapsed if elapsed > 0 else float("inf")}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="moneyball", description="Price a full slate without the Streamlit UI.")
+    ap.add_argument("module", choices=sorted(PRICERS), help="which app module's model to run")
+    ap.add_argument("input", help="CSV or JSONL slate file ('-' for stdin)")
+    ap.add_argument("-o", "--output", default="-", help="output file, CSV or JSONL by extension (default: stdout)")
+    ap.add_argument("--input-format", choices=["csv", "jsonl"])
+    ap.add_argument("--output-format", choices=["csv", "jsonl"])
+    ap.add_argument("--chunk-size", type=int, default=1000)
+    args = ap.parse_args(argv)
+
+    in_fmt = _infer_format(args.input, args.input_format)
+    out_fmt = _infer_format(args.output, args.output_format)
+    src = contextlib.nullcontext(sys.stdin) if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    with src as fin:
+        dst = contextlib.nullcontext(sys.stdout) if args.output == "-" else \
+            open(args.output, "w", newline="", encoding="utf-8")
+        with dst as fout:
+            stats = run(args.module, fin, fout, in_fmt, out_fmt, max(1, args.chunk_size))
+
+    print(f"[{args.module}] {stats['rows']} rows → {stats['results']} priced markets "
+          f"({stats['errors']} errors) in {stats['seconds']:.3f}s — {stats['rows_per_sec']:,.0f} rows/s",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
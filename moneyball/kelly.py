@@ -0,0 +1,156 @@
+# Moneyball Phil — Simultaneous Kelly stakes
+# -----------------------------------------------------
+# Sizes every open bet at once: singles and parlays over a shared pool of
+# legs, staked to maximize expected log bankroll growth over the joint
+# outcome of all of them. Kelly-sizing each bet alone ignores that they
+# settle together (and that parlays reuse legs), so the total stake
+# over-bets the bankroll.
+#
+#   alloc = allocate(leg_probs, [(0,), (1,), (2,), (0, 3)], dec_odds, fraction=0.5, cap=0.25)
+#   alloc.stakes[i]   → share of bankroll on bet i; alloc.solo[i] → bet i Kelly-sized alone
+#
+# Outcomes are enumerated exactly while the legs are independent and few
+# (2^legs ≤ 2^ENUMERATE_MAX_LEGS); otherwise they are sampled with the
+# parlay engine's Gaussian copula (leg correlations from
+# parlay.correlation_matrix) under a fixed seed, then reweighted so each
+# leg's hit rate is exactly its probability. Fractional Kelly scales
+# the growth-optimal portfolio, and ``cap`` bounds the total at risk: the
+# full-Kelly portfolio is solved with Σ stakes ≤ cap / fraction, so the
+# scaled stakes never exceed the cap.
+
+from statistics import NormalDist
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .parlay import _psd_cholesky
+
+ENUMERATE_MAX_LEGS = 12
+DEFAULT_SCENARIOS = 20_000
+DEFAULT_FRACTION = 0.5
+DEFAULT_CAP = 0.25
+RAKE_SWEEPS = 50
+RAKE_TOL = 1e-9
+
+
+class KellyAllocation(NamedTuple):
+    stakes: np.ndarray        # (n,) share of bankroll per bet, after fraction and cap
+    solo: np.ndarray          # (n,) fractional Kelly for each bet on its own
+    true_prob: np.ndarray     # (n,) hit probability under the outcome model
+    ev_pct: np.ndarray        # (n,) ROI per $1 in %
+    growth: float             # expected log growth per round at ``stakes``
+    n_outcomes: int           # distinct joint outcomes the optimizer saw
+    exact: bool               # outcomes enumerated rather than sampled
+
+    @property
+    def total(self) -> float:
+        return float(self.stakes.sum())
+
+
+def solo_kelly(true_prob, dec_odds, fraction: float = 1.0) -> np.ndarray:
+    """Kelly share for each bet on its own: (p·d − 1) / (d − 1), floored at 0."""
+    p, d = np.asarray(true_prob, dtype=float), np.asarray(dec_odds, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f = np.where(d > 1.0, (p * d - 1.0) / (d - 1.0), 0.0)
+    return fraction * np.clip(np.nan_to_num(f), 0.0, 1.0)
+
+
+def leg_outcomes(leg_probs, corr: Optional[np.ndarray] = None, n_scenarios: int = DEFAULT_SCENARIOS,
+                 seed: int = 0):
+    """
+    (hits, weights, exact): joint leg outcomes as a (k, legs) bool array
+    with probability weights summing to 1. Exact for few independent legs,
+    otherwise ``n_scenarios`` copula draws with repeats merged and leg
+    marginals matched to ``leg_probs``.
+    """
+    p = np.clip(np.asarray(leg_probs, dtype=float), 0.0, 1.0)
+    n = p.size
+    independent = corr is None or np.allclose(corr, np.eye(n))
+    if independent and n <= ENUMERATE_MAX_LEGS:
+        hits = ((np.arange(2 ** n)[:, None] >> np.arange(n)) & 1).astype(bool)
+        weights = np.prod(np.where(hits, p, 1.0 - p), axis=1)
+        keep = weights > 0
+        return hits[keep], weights[keep], True
+    rng = np.random.default_rng(seed)
+    if independent:
+        hits = rng.random((int(n_scenarios), n)) < p
+    else:
+        nd = NormalDist()
+        thresholds = np.array([nd.inv_cdf(x) if 0.0 < x < 1.0 else (np.inf if x >= 1.0 else -np.inf) for x in p])
+        L = _psd_cholesky(np.asarray(corr, dtype=float))
+        hits = rng.standard_normal((int(n_scenarios), n)) @ L.T <= thresholds
+    hits, counts = np.unique(hits, axis=0, return_counts=True)
+    return hits, _rake(hits, counts / counts.sum(), p), False
+
+
+def _rake(hits: np.ndarray, weights: np.ndarray, p: np.ndarray, sweeps: int = RAKE_SWEEPS) -> np.ndarray:
+    # Reweight sampled outcomes so every leg hits with exactly its probability
+    # (iterative proportional fitting); the joint structure stays the sample's
+    for _ in range(sweeps):
+        for j in np.flatnonzero((p > 0) & (p < 1)):
+            hit = hits[:, j]
+            w_hit = weights[hit].sum()
+            if 0 < w_hit < 1:
+                weights = np.where(hit, weights * (p[j] / w_hit), weights * ((1 - p[j]) / (1 - w_hit)))
+        if np.abs(weights @ hits - p).max() < RAKE_TOL:
+            break
+    return weights
+
+
+def _solve(returns: np.ndarray, weights: np.ndarray, budget: float, x0: np.ndarray) -> np.ndarray:
+    # max Σ_k w_k log(1 + R_k · f)  s.t.  f ≥ 0, Σ f ≤ budget
+    from scipy.optimize import minimize
+
+    def objective(f):
+        wealth = np.maximum(1.0 + returns @ f, 1e-12)
+        return -float(weights @ np.log(wealth)), -(returns.T @ (weights / wealth))
+
+    res = minimize(objective, x0, jac=True, method="SLSQP", bounds=[(0.0, budget)] * x0.size,
+                   constraints=[{"type": "ineq", "fun": lambda f: budget - f.sum(),
+                                 "jac": lambda f: -np.ones_like(f)}],
+                   options={"maxiter": 500, "ftol": 1e-12})
+    f = np.clip(res.x, 0.0, budget)
+    return f * min(1.0, budget / f.sum()) if f.sum() > 0 else f
+
+
+def allocate(leg_probs: Sequence[float], bets: Sequence[Sequence[int]], dec_odds: Sequence[float],
+             corr: Optional[np.ndarray] = None, fraction: float = DEFAULT_FRACTION, cap: float = DEFAULT_CAP,
+             n_scenarios: int = DEFAULT_SCENARIOS, seed: int = 0) -> KellyAllocation:
+    """
+    Growth-optimal stakes (shares of bankroll) for ``bets``, each a tuple of
+    leg indices into ``leg_probs`` (one index = a single, several = a
+    parlay that pays ``dec_odds[i]`` when all its legs hit). ``corr`` is an
+    optional leg correlation matrix; ``fraction`` scales the full-Kelly
+    portfolio (0.5 = half Kelly) and ``cap`` bounds the total stake.
+    """
+    if not 0.0 < fraction <= 1.0:
+        raise ValueError("fraction must be in (0, 1].")
+    if not 0.0 < cap <= 1.0:
+        raise ValueError("cap must be in (0, 1].")
+    d = np.asarray(dec_odds, dtype=float)
+    n_legs = len(leg_probs)
+    if len(bets) != d.size:
+        raise ValueError("bets and dec_odds must have the same length.")
+    incidence = np.zeros((d.size, n_legs), dtype=np.int32)
+    for i, legs in enumerate(bets):
+        if not len(legs) or min(legs) < 0 or max(legs) >= n_legs:
+            raise ValueError(f"bet {i} has no legs or a leg index out of range.")
+        incidence[i, list(legs)] = 1
+
+    hits, weights, exact = leg_outcomes(leg_probs, corr, n_scenarios, seed)
+    wins = hits.astype(np.int32) @ incidence.T == incidence.sum(axis=1)       # (k, n) bet i won
+    wins, inverse = np.unique(wins, axis=0, return_inverse=True)
+    weights = np.bincount(inverse.ravel(), weights=weights, minlength=len(wins))
+    returns = np.where(wins, d - 1.0, -1.0)
+
+    true_prob = weights @ wins
+    solo = solo_kelly(true_prob, d, fraction)
+    budget = cap / fraction
+    stakes = np.zeros(d.size)
+    live = np.flatnonzero((d > 1.0) & (true_prob > 0))
+    if live.size:
+        x0 = solo[live] / fraction
+        x0 *= min(1.0, 0.5 * budget / max(x0.sum(), 1e-12))
+        stakes[live] = fraction * _solve(returns[:, live], weights, budget, x0)
+    growth = float(weights @ np.log(np.maximum(1.0 + returns @ stakes, 1e-300)))
+    return KellyAllocation(stakes, solo, true_prob, (true_prob * d - 1.0) * 100.0, growth, len(weights), exact)
@@ -0,0 +1,128 @@
+# Moneyball Phil — Batch MLB hit model
+# -----------------------------------------------------
+# The mlb_hits_app model (weighted AVG + pitcher difficulty, P(1+ hit))
+# for whole lineups at once. Every input may be a scalar or an array;
+# they broadcast, so 9 hitters × every game on a slate is one call on
+# (games, 9) arrays, and batting order defaults to 1–9 along the last
+# axis.
+#
+# Instead of rounding the lineup slot's expected at-bats (AB_LOOKUP) to
+# an integer, the AB count is a distribution with that mean:
+#
+#   AB = AB_MIN + Binomial(AB_MAX - AB_MIN, q),  q = (est_ab - AB_MIN) / (AB_MAX - AB_MIN)
+#
+# and P(1+ hit) = 1 − Σ P(AB = k)·(1 − avg)^k, so a 4.6 AB leadoff hitter
+# and a 4.4 AB third hitter no longer price the same.
+#
+#   res = price_hitters(names, season, last7, split, hand, vs_pitcher, whip, era, odds)   # (games, 9) arrays
+#   res.true_prob[g, i], res.ev[g, i], res.zone[g, i]
+#   score_lineups(df)                                  # one row per hitter, any number of games
+
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .kernels import AB_LOOKUP, binom_pmf_vector, calculate_weighted_avg, classify_zone, pitcher_difficulty
+from .odds import american_to_prob, parse_american
+
+AB_MIN = 2
+AB_MAX = 6
+DEFAULT_AB = 4.0       # slots outside 1–9
+
+_AB_BY_SLOT = np.array([DEFAULT_AB] + [AB_LOOKUP.get(k, DEFAULT_AB) for k in range(1, 10)])
+
+LINEUP_COLUMNS = ("season_avg", "last7_avg", "split_avg", "hand_avg", "pitcher_avg", "pitcher_whip", "pitcher_era")
+
+
+class HitSlate(NamedTuple):
+    players: np.ndarray
+    batting_order: np.ndarray
+    weighted_avg: np.ndarray
+    adj_avg: np.ndarray
+    pitcher_tier: np.ndarray
+    est_ab: np.ndarray
+    true_prob: np.ndarray       # P(1+ hit), 0..1
+    implied_prob: np.ndarray    # 0..1
+    ev: np.ndarray              # true − implied, in pp
+    zone: np.ndarray
+
+    def to_frame(self):
+        """One row per hitter, in input order."""
+        import pandas as pd
+        return pd.DataFrame({
+            "Player": self.players.ravel(),
+            "Order": self.batting_order.ravel(),
+            "Est. AB": self.est_ab.ravel(),
+            "Adj AVG": np.round(self.adj_avg, 3).ravel(),
+            "Pitcher Tier": self.pitcher_tier.ravel(),
+            "True %": np.round(self.true_prob * 100, 2).ravel(),
+            "Implied %": np.round(self.implied_prob * 100, 2).ravel(),
+            "EV %": np.round(self.ev, 2).ravel(),
+            "Zone": self.zone.ravel(),
+        })
+
+
+def expected_ab(batting_order) -> np.ndarray:
+    """AB_LOOKUP for an array of lineup slots (DEFAULT_AB outside 1–9)."""
+    order = np.asarray(batting_order, dtype=int)
+    return np.where((order >= 1) & (order <= 9), _AB_BY_SLOT[np.clip(order, 0, 9)], DEFAULT_AB)
+
+
+def ab_distribution(est_ab) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (AB counts, pmf) of the AB model with mean ``est_ab``; pmf has a
+    trailing axis over AB_MIN..AB_MAX. Means outside that range clip to it.
+    """
+    q = np.clip((np.asarray(est_ab, dtype=float) - AB_MIN) / (AB_MAX - AB_MIN), 0.0, 1.0)
+    return np.arange(AB_MIN, AB_MAX + 1), binom_pmf_vector(AB_MAX - AB_MIN, q, AB_MAX - AB_MIN)
+
+
+def hit_probability(avg, est_ab) -> np.ndarray:
+    """P(1+ hit) for a per-AB hit rate ``avg`` over the AB distribution with mean ``est_ab``."""
+    avg = np.clip(np.asarray(avg, dtype=float), 0.0, 1.0)
+    counts, pmf = ab_distribution(est_ab)
+    miss = (1.0 - avg)[..., None] ** counts
+    return 1.0 - np.sum(pmf * miss, axis=-1)
+
+
+def price_hitters(players, season_avg, last7_avg, split_avg, hand_avg, pitcher_avg, pitcher_whip, pitcher_era,
+                  odds, batting_order=None) -> HitSlate:
+    """
+    True hit %, EV and zone for every hitter. Arrays broadcast together;
+    ``odds`` is American; ``batting_order`` None means 1–9 along the last axis.
+    """
+    if batting_order is None:
+        batting_order = np.arange(1, 10)
+    arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (
+        season_avg, last7_avg, split_avg, hand_avg, pitcher_avg, pitcher_whip, pitcher_era, odds, batting_order)))
+    season, last7, split_, hand, vs_pitcher, whip, era, odds, order = arrays
+    weighted = calculate_weighted_avg(season, last7, split_, hand, vs_pitcher)
+    adjustment, tier = pitcher_difficulty(whip, era)
+    adj_avg = np.clip(weighted + adjustment, 0.0, 1.0)
+    order = order.astype(int)
+    est_ab = expected_ab(order)
+    true_prob = hit_probability(adj_avg, est_ab)
+    implied = np.asarray(american_to_prob(odds), dtype=float)
+    players = np.broadcast_to(np.asarray(players, dtype=object), order.shape)
+    return HitSlate(players, order, weighted, adj_avg, tier, est_ab, true_prob, implied,
+                    (true_prob - implied) * 100.0, classify_zone(np.atleast_1d(true_prob)).reshape(true_prob.shape))
+
+
+def score_lineups(table, odds_column: str = "odds", order_column: str = "batting_order",
+                  player_column: str = "player", game_column: Optional[str] = "game"):
+    """
+    Price a table of hitters (DataFrame or mapping of columns) with the
+    form's fields: player, batting_order, season_avg, last7_avg, split_avg,
+    hand_avg, pitcher_avg, pitcher_whip, pitcher_era and American odds.
+    A "game" column, if present, is kept in front of the result.
+    """
+    n = len(np.asarray(table[odds_column]))
+    odds = np.array([parse_american(x) for x in np.asarray(table[odds_column], dtype=object)], dtype=float)
+    players = table[player_column] if player_column in table else [f"Hitter {i + 1}" for i in range(n)]
+    res = price_hitters(np.asarray(players, dtype=object),
+                        *(np.asarray(table[c], dtype=float) for c in LINEUP_COLUMNS),
+                        odds, np.asarray(table[order_column], dtype=int))
+    df = res.to_frame()
+    if game_column and game_column in table:
+        df.insert(0, "Game", np.asarray(table[game_column], dtype=object))
+    return df
@@ -0,0 +1,268 @@
+# Moneyball Phil — Local mock odds feed
+# -----------------------------------------------------
+# A stand-in HTTP odds server for developing and load-testing the fetcher
+# (moneyball.odds_fetch) offline. It serves the feed protocol documented
+# there for a synthetic slate: soccer fixtures, games (spread / total /
+# moneyline), pitchers and NBA players, each priced by every book, with
+# the market names the app looks up (see moneyball.odds_feed).
+#
+#   python -m moneyball.mock_feed --port 8765 --events 120 --latency 0.05
+#   python -m moneyball.odds_fetch http://127.0.0.1:8765 -o snapshot.jsonl
+#
+#   with MockFeedServer(MockFeed(events=120, latency=0.05)) as server:   # background thread
+#       result = fetch_snapshot(server.url)
+#
+# Each request waits ``latency`` seconds (plus jitter) before answering,
+# like a remote feed; ``fail_rate`` answers a share of requests with 503
+# and ``rps`` answers requests over that rate with 429 + Retry-After, to
+# exercise the fetcher's retries. Every ``move_every`` seconds a
+# ``move_fraction`` of the markets re-price, so repeated snapshots differ
+# only in the markets that moved. GET /v1/stats reports request and
+# connection counts.
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from .odds import decimal_to_american
+
+DEFAULT_BOOKS = ("DK", "FD", "MGM")
+
+# (market, line) pairs per event kind; None = no line
+KINDS = {
+    "soccer": [("O1.5", None), ("O2.5", None), ("BTTS", None)],
+    "game": [("spread_home", -3.5), ("spread_away", 3.5), ("total_over", 221.5), ("total_under", 221.5),
+             ("ml_home", None), ("ml_away", None)],
+    "pitcher": [("er_under", 2.5), ("k_over", 5.5), ("k_under", 5.5), ("k_over", 6.5), ("k_under", 6.5)],
+    "nba": [("pts_over", 24.5), ("pts_under", 24.5), ("pra_over", 38.5), ("pra_under", 38.5)],
+}
+
+
+def _american(p: float) -> int:
+    return int(decimal_to_american(1.0 / p))
+
+
+class MockFeed:
+    """The synthetic slate and its prices; safe to share between server threads."""
+
+    def __init__(self, events: int = 120, books=DEFAULT_BOOKS, latency: float = 0.0, jitter: float = 0.2,
+                 fail_rate: float = 0.0, rps: Optional[float] = None, move_every: Optional[float] = None,
+                 move_fraction: float = 0.1, seed: int = 0):
+        self.latency, self.jitter = float(latency), float(jitter)
+        self.fail_rate, self.rps = float(fail_rate), rps
+        self.move_every, self.move_fraction = move_every, float(move_fraction)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.markets: List[dict] = []                      # listing order
+        self._prices: Dict[str, List[Tuple[Optional[float], float]]] = {}   # id → [(line, implied p)]
+        kinds = list(KINDS)
+        for i in range(int(events)):
+            kind = kinds[i % len(kinds)]
+            event = {"soccer": f"FC {i:03d} vs United {i:03d}", "game": f"Home {i:03d} vs Away {i:03d}",
+                     "pitcher": f"Pitcher {i:03d}", "nba": f"Player {i:03d}"}[kind]
+            by_market: Dict[str, List[Tuple[Optional[float], float]]] = {}
+            for market, line in KINDS[kind]:
+                by_market.setdefault(market, []).append((line, None))
+            for book in books:
+                for market, lines in by_market.items():
+                    mid = str(len(self.markets))
+                    self.markets.append({"id": mid, "book": book, "event": event, "market": market})
+                    self._prices[mid] = [(line, self._rng.uniform(0.35, 0.65)) for line, _ in lines]
+        self._started = time.monotonic()
+        self._moves = 0
+        self._window = (0, 0)                              # (second, requests in it) for rps
+        self.requests = 0
+        self.connections = 0
+
+    # ---------------- Prices ----------------
+    def move(self, fraction: Optional[float] = None) -> int:
+        """Re-price a random ``fraction`` of the markets now; returns how many moved."""
+        with self._lock:
+            return self._move(self.move_fraction if fraction is None else fraction)
+
+    def _move(self, fraction: float) -> int:
+        ids = self._rng.sample(list(self._prices), int(round(len(self._prices) * fraction)))
+        for mid in ids:
+            step = self._rng.choice((-1, 1)) * self._rng.uniform(0.01, 0.04)
+            self._prices[mid] = [(line, min(0.9, max(0.1, p + step))) for line, p in self._prices[mid]]
+        return len(ids)
+
+    def _catch_up(self):
+        if not self.move_every:
+            return
+        due = int((time.monotonic() - self._started) / self.move_every)
+        while self._moves < due:
+            self._move(self.move_fraction)
+            self._moves += 1
+
+    def market(self, mid: str) -> Optional[dict]:
+        with self._lock:
+            self._catch_up()
+            prices = self._prices.get(mid)
+            if prices is None:
+                return None
+            quotes = [{"line": line, "american": _american(p)} for line, p in prices]
+        return dict(self.markets[int(mid)], quotes=quotes)
+
+    # ---------------- Request handling ----------------
+    def _admit(self) -> Optional[Tuple[int, dict]]:
+        # Error answer for this request, if any (rate limit, injected failure)
+        with self._lock:
+            self.requests += 1
+            if self.rps:
+                now = int(time.monotonic())
+                second, count = self._window
+                count = count + 1 if second == now else 1
+                self._window = (now, count)
+                if count > self.rps:
+                    return 429, {"error": "rate limited"}
+            if self.fail_rate and self._rng.random() < self.fail_rate:
+                return 503, {"error": "injected failure"}
+        return None
+
+    async def respond(self, path: str) -> Tuple[int, dict]:
+        delay = self.latency * (1.0 + self.jitter * (2.0 * random.random() - 1.0))
+        if delay > 0:
+            await asyncio.sleep(delay)
+        path = urlsplit(path).path.rstrip("/")
+        if path == "/v1/stats":
+            return 200, {"requests": self.requests, "connections": self.connections, "markets": len(self.markets)}
+        refused = self._admit()
+        if refused is not None:
+            return refused
+        if path == "/v1/markets":
+            return 200, {"markets": self.markets}
+        if path.startswith("/v1/markets/"):
+            payload = self.market(unquote(path[len("/v1/markets/"):]))
+            return (200, payload) if payload is not None else (404, {"error": "unknown market"})
+        return 404, {"error": "not found"}
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 429: "Too Many Requests", 503: "Service Unavailable"}
+
+
+async def _serve_connection(feed: MockFeed, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    feed.connections += 1
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            parts = request_line.decode("latin-1").split()
+            if len(parts) != 3 or parts[0] != "GET":
+                status, payload = 400, {"error": "GET only"}
+            else:
+                status, payload = await feed.respond(parts[1])
+            close = headers.get("connection", "").lower() == "close" or parts[-1:] == ["HTTP/1.0"]
+            body = json.dumps(payload).encode()
+            head = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}", "Content-Type: application/json",
+                    f"Content-Length: {len(body)}", "Connection: " + ("close" if close else "keep-alive")]
+            if status == 429:
+                head.append("Retry-After: 1")
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+            await writer.drain()
+            if close:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(feed: MockFeed, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+    return await asyncio.start_server(lambda r, w: _serve_connection(feed, r, w), host, port, backlog=1024)
+
+
+class MockFeedServer:
+    """Runs a MockFeed on its own event loop in a background thread (port 0 = any free port)."""
+
+    def __init__(self, feed: Optional[MockFeed] = None, host: str = "127.0.0.1", port: int = 0):
+        self.feed = feed or MockFeed()
+        self.host, self.port = host, port
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "MockFeedServer":
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._server = self._loop.run_until_complete(serve(self.feed, self.host, self.port))
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            self._loop.run_forever()
+            self._server.close()
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="mock-odds-feed", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+    def __enter__(self) -> "MockFeedServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m moneyball.mock_feed", description="Serve a synthetic odds feed.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765, help="0 = any free port")
+    ap.add_argument("--events", type=int, default=120)
+    ap.add_argument("--books", default=",".join(DEFAULT_BOOKS), help="comma-separated book names")
+    ap.add_argument("--latency", type=float, default=0.05, help="seconds per request (±20%% jitter)")
+    ap.add_argument("--fail-rate", type=float, default=0.0, help="share of requests answered 503")
+    ap.add_argument("--rps", type=float, help="answer 429 above this many requests per second")
+    ap.add_argument("--move-every", type=float, help="re-price --move-fraction of the markets every N seconds")
+    ap.add_argument("--move-fraction", type=float, default=0.1)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    feed = MockFeed(args.events, [b.strip() for b in args.books.split(",") if b.strip()], args.latency,
+                    fail_rate=args.fail_rate, rps=args.rps, move_every=args.move_every,
+                    move_fraction=args.move_fraction, seed=args.seed)
+
+    async def run():
+        server = await serve(feed, args.host, args.port)
+        port = server.sockets[0].getsockname()[1]      # the bound port when --port 0
+        print(f"mock odds feed: {len(feed.markets)} markets on http://{args.host}:{port}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
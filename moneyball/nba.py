@@ -0,0 +1,123 @@
+# Moneyball Phil — Batch NBA player scorer
+# -----------------------------------------------------
+# The nba_app model (last-season base blended with the current-season
+# average, load management, defense factor, then a logistic P(over line)
+# shifted by defense rank) for a whole roster at once. Every input may be
+# a scalar or an array; they broadcast, so a night's slate is one call.
+#
+#   res = price_players(names, "PRA", pts, reb, ast, recent, gp, pre_g, pre_mpg, "None", 0, def_rank,
+#                       line, odds_over, odds_under)
+#   res.over_prob[i], res.ev_over[i], res.matchup[i]
+#   score_roster(df)                                  # one row per player, any number of games
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .kernels import defense_tier, nba_projection, true_prob_from_line
+from .odds import implied_from_text
+
+# Roster columns → price_players() arguments, with the form's defaults
+ROSTER_COLUMNS = {
+    "stat_type": "PRA", "base_pts": 0.0, "base_reb": 0.0, "base_ast": 0.0, "recent_avg": 0.0, "gp": 0,
+    "pre_games": 0, "pre_mpg": 0.0, "lm_profile": "None", "lm_custom_pct": 0.0, "def_rank": 15, "line": 0.0,
+    "odds_over": "", "odds_under": "", "alt_line": 0.0, "alt_odds": "",
+}
+
+
+class NBASlate(NamedTuple):
+    players: np.ndarray
+    stat_type: np.ndarray
+    projection: np.ndarray      # blended, after LM and defense factor
+    w_new: np.ndarray           # current-season blend weight
+    matchup: np.ndarray         # "🟨 Moderate Defense (0%)"
+    line: np.ndarray
+    over_prob: np.ndarray       # 0..1 (under = 1 − over)
+    implied_over: np.ndarray    # 0..1, NaN without odds
+    implied_under: np.ndarray
+    alt_line: np.ndarray        # 0 = none
+    alt_prob: np.ndarray        # NaN without an alt line
+    implied_alt: np.ndarray
+
+    @property
+    def ev_over(self) -> np.ndarray:
+        return (self.over_prob - self.implied_over) * 100.0
+
+    @property
+    def ev_under(self) -> np.ndarray:
+        return (1.0 - self.over_prob - self.implied_under) * 100.0
+
+    @property
+    def ev_alt(self) -> np.ndarray:
+        return (self.alt_prob - self.implied_alt) * 100.0
+
+    def to_frame(self):
+        """One row per player, in input order."""
+        import pandas as pd
+        return pd.DataFrame({
+            "Player": self.players,
+            "Type": np.where(self.stat_type == "Points Only", "Points", "PRA"),
+            "Line": self.line,
+            "Proj": np.round(self.projection, 2),
+            "Matchup": self.matchup,
+            "Over %": np.round(self.over_prob * 100, 2),
+            "Over EV %": np.round(self.ev_over, 2),
+            "Under %": np.round((1.0 - self.over_prob) * 100, 2),
+            "Under EV %": np.round(self.ev_under, 2),
+            "Alt Line": np.where(self.alt_line > 0, self.alt_line, np.nan),
+            "Alt %": np.round(self.alt_prob * 100, 2),
+            "Alt EV %": np.round(self.ev_alt, 2),
+        })
+
+
+def _implied(odds, n: int) -> np.ndarray:
+    # American odds text per player (blank → NaN), as the form reads them
+    texts = [str(t) for t in np.broadcast_to(np.asarray(odds, dtype=object), (n,))]
+    parsed = {t: implied_from_text(t) for t in set(texts)}      # a slate repeats a few prices
+    return np.array([np.nan if parsed[t] is None else parsed[t] for t in texts], dtype=float)
+
+
+def price_players(players, stat_type, base_pts, base_reb, base_ast, recent_avg, gp, pre_games, pre_mpg,
+                  lm_profile, lm_custom_pct, def_rank, line, odds_over="", odds_under="", alt_line=0.0,
+                  alt_odds="") -> NBASlate:
+    """
+    Projection, matchup tier and P(over) for every player. ``stat_type`` is
+    "PRA" or "Points Only", as on the form; odds are American text, blank
+    for none.
+    """
+    players = np.atleast_1d(np.asarray(players, dtype=object))
+    n = players.size
+    stat_type = np.broadcast_to(np.asarray(stat_type, dtype=object), (n,))
+    def_rank = np.broadcast_to(np.asarray(def_rank, dtype=int), (n,))
+    line, alt_line = (np.broadcast_to(np.asarray(x, dtype=float), (n,)) for x in (line, alt_line))
+    projection, w_new = nba_projection(stat_type, base_pts, base_reb, base_ast, recent_avg, gp, pre_games, pre_mpg,
+                                       np.broadcast_to(np.asarray(lm_profile, dtype=object), (n,)), lm_custom_pct,
+                                       def_rank)
+    label, emoji, _, pct_txt = defense_tier(def_rank)
+    matchup = emoji + " " + label + " (" + pct_txt + ")"
+    over = true_prob_from_line(stat_type, projection, line, def_rank)
+    alt = np.where(alt_line > 0, true_prob_from_line(stat_type, projection, alt_line, def_rank), np.nan)
+    return NBASlate(players, np.asarray(stat_type), np.broadcast_to(projection, (n,)),
+                    np.broadcast_to(w_new, (n,)), matchup, line, over, _implied(odds_over, n),
+                    _implied(odds_under, n), alt_line, alt, _implied(alt_odds, n))
+
+
+def score_roster(table):
+    """
+    Price a roster table (DataFrame or mapping of columns) with the form's
+    fields, named as in ROSTER_COLUMNS plus "player"; missing columns take
+    the form's defaults.
+    """
+    import pandas as pd
+    df = pd.DataFrame(table)
+    n = len(df)
+    cols = {}
+    for name, default in ROSTER_COLUMNS.items():
+        col = df[name] if name in df else pd.Series([default] * n, index=df.index)
+        if isinstance(default, str):
+            col = col.fillna(default).astype(str).str.strip()
+            cols[name] = col.where(col != "", default)
+        else:
+            cols[name] = col.fillna(default).astype(type(default))
+    players = df["player"].fillna("Player").astype(str) if "player" in df else [f"Player {i + 1}" for i in range(n)]
+    return price_players(np.asarray(players, dtype=object), *(np.asarray(c) for c in cols.values())).to_frame()
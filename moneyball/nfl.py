@@ -0,0 +1,94 @@
+# Moneyball Phil — Vectorized NFL prop engine
+# -----------------------------------------------------
+# Prices whole alt-line ladders for many QB/WR/RB props in one NumPy pass:
+# the defense tier + projection step runs once per player, then the
+# logistic curve is evaluated on a (players × lines) grid.
+#
+#   lines = yard_ladder(150.5, 350.5, 5)
+#   res = price_ladder(names, "QB", ypg, tds, def_yds, def_tds, lines)
+#   res.over_pct[i, j]  → P(player i over lines[j]) in %
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from .kernels import NFL_RECEPTIONS_SCALE, NFL_TDS_SCALE, NFL_YARDS_SCALE, logistic_prob, nfl_projection
+
+# Logistic scale per stat, as used by nfl_app (moneyball.params)
+YARDS_SCALE = NFL_YARDS_SCALE
+RECEPTIONS_SCALE = NFL_RECEPTIONS_SCALE
+TDS_SCALE = NFL_TDS_SCALE
+
+
+class NflLadder(NamedTuple):
+    players: np.ndarray     # (n,)
+    groups: np.ndarray      # (n,) "QB" / "WR" / "RB"
+    tiers: np.ndarray       # (n,) defense tier label
+    projection: np.ndarray  # (n,) adjusted projection of the priced stat
+    lines: np.ndarray       # (m,) or (n, m)
+    over_pct: np.ndarray    # (n, m) P(over) in %, 2 dp
+
+    @property
+    def under_pct(self) -> np.ndarray:
+        return np.round(100.0 - self.over_pct, 2)
+
+    def to_frame(self):
+        """Long format: one row per player-line pair."""
+        import pandas as pd
+        n, m = self.over_pct.shape
+        lines = np.broadcast_to(self.lines, (n, m))
+        return pd.DataFrame({
+            "Player": np.repeat(self.players, m),
+            "Group": np.repeat(self.groups, m),
+            "Def Tier": np.repeat(self.tiers, m),
+            "Projection": np.repeat(np.round(self.projection, 2), m),
+            "Line": lines.ravel(),
+            "Over %": self.over_pct.ravel(),
+            "Under %": self.under_pct.ravel(),
+        })
+
+
+def yard_ladder(start: float = 150.5, stop: float = 350.5, step: float = 5.0) -> np.ndarray:
+    """Half-point lines from start to stop inclusive."""
+    return np.arange(start, stop + step / 2, step)
+
+
+def project(group, ypg, per_game, def_yds, def_per_game):
+    """
+    Vectorized nfl_projection: (tiers, adj_ypg, adj_2nd) arrays. ``group`` may
+    be one "QB"/"WR"/"RB" for every player or an array with one per player.
+    """
+    ypg, per_game, def_yds, def_per_game = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(x, dtype=float)) for x in (ypg, per_game, def_yds, def_per_game)))
+    groups = np.broadcast_to(np.asarray(group, dtype=str), ypg.shape)
+    tiers = np.empty(ypg.shape, dtype=object)
+    adj_ypg = np.empty(ypg.shape)
+    adj_2nd = np.empty(ypg.shape)
+    for g in np.unique(groups):
+        m = groups == g
+        t, y, s = nfl_projection(str(g), ypg[m], per_game[m], def_yds[m], def_per_game[m])
+        tiers[m], adj_ypg[m], adj_2nd[m] = t, y, s
+    return tiers, adj_ypg, adj_2nd
+
+
+def price_ladder(players, group, ypg, per_game, def_yds, def_per_game, lines,
+                 stat: str = "yards", scale: Optional[float] = None) -> NflLadder:
+    """
+    Price every player against every line in ``lines`` (shared 1-D ladder or
+    one row of lines per player). ``stat`` is "yards" or "second" (pass TDs
+    for QBs, receptions for WR/RB).
+    """
+    players = np.atleast_1d(np.asarray(players, dtype=object))
+    tiers, adj_ypg, adj_2nd = project(group, ypg, per_game, def_yds, def_per_game)
+    groups = np.broadcast_to(np.asarray(group, dtype=str), adj_ypg.shape)
+    lines = np.asarray(lines, dtype=float)
+
+    if stat == "yards":
+        proj = adj_ypg
+        scale = YARDS_SCALE if scale is None else scale
+    else:
+        proj = adj_2nd
+        if scale is None:
+            scale = np.where(groups == "QB", TDS_SCALE, RECEPTIONS_SCALE)[:, None]
+    over = logistic_prob(proj[:, None], lines if lines.ndim == 2 else lines[None, :], scale=scale)
+    return NflLadder(players, np.asarray(groups), tiers, proj, lines, np.atleast_2d(over))
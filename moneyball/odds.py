@@ -0,0 +1,95 @@
+# Moneyball Phil — Odds conversion layer
+# -----------------------------------------------------
+# One implementation of the American/decimal/implied conversions that used
+# to be repeated inside every module. The numeric converters accept a
+# scalar or any array-like: scalars come back as plain Python numbers,
+# arrays come back as NumPy arrays of the same shape.
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def _unwrap(a: np.ndarray):
+    return a.item() if a.ndim == 0 else a
+
+
+# ---------------------------
+# Numeric conversions
+# ---------------------------
+def american_to_prob(odds):
+    """Implied probability [0..1] of American odds (0 is read as +0, i.e. 1.0)."""
+    o = np.asarray(odds, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = np.where(o < 0, -o / (100.0 - o), 100.0 / (o + 100.0))
+    return _unwrap(p)
+
+
+def implied_prob(odds):
+    """american_to_prob, except odds of 0 mean "no price" and map to 0 (the NFL and ATS pages' rule)."""
+    o = np.asarray(odds, dtype=float)
+    return _unwrap(np.where(o == 0, 0.0, american_to_prob(o)))
+
+
+def american_to_decimal(odds):
+    o = np.asarray(odds, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dec = np.where(o >= 0, 1.0 + o / 100.0, 1.0 + 100.0 / np.abs(o))
+    return _unwrap(dec)
+
+
+def decimal_to_american(dec):
+    d = np.asarray(dec, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        am = np.where(d >= 2.0, np.round((d - 1.0) * 100.0), -np.round(100.0 / (d - 1.0)))
+    am = np.where(d <= 1.0, 0, am).astype(int)
+    return _unwrap(am)
+
+
+def decimal_to_prob(dec):
+    d = np.asarray(dec, dtype=float)
+    with np.errstate(divide="ignore"):
+        return _unwrap(np.where(d > 0, 1.0 / d, 0.0))
+
+
+# ---------------------------
+# Text parsing (form fields, CSV cells)
+# ---------------------------
+def parse_american(text) -> float:
+    """'+115' / '-120' / '115' → float. Raises ValueError on empty or invalid input."""
+    s = str(text).strip()
+    if not s:
+        raise ValueError("Odds field is empty.")
+    return float(s.replace("+", ""))
+
+
+def implied_from_text(text) -> Optional[float]:
+    """Implied probability of American odds typed as text, or None when blank/unparseable."""
+    try:
+        return american_to_prob(parse_american(text))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_odds(odds_input) -> Tuple[float, float]:
+    """
+    Accept American like '-120' / '+110' or Decimal like '1.83'.
+    Returns (implied_prob [0..1], decimal_odds). Raises on invalid input.
+    """
+    s = str(odds_input).strip()
+    if not s:
+        raise ValueError("Odds field is empty.")
+    # American?
+    if s.startswith(('+', '-')):
+        am = float(s)
+        if am == 0:
+            raise ValueError("American odds cannot be 0.")
+        dec = american_to_decimal(am)
+        if dec <= 1.0 or not np.isfinite(dec):
+            raise ValueError("Invalid American odds → decimal ≤ 1.")
+        return 1.0 / dec, dec
+    # Decimal
+    dec = float(s)
+    if dec <= 1.0 or not np.isfinite(dec):
+        raise ValueError("Decimal odds must be > 1.0")
+    return 1.0 / dec, dec
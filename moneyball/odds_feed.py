@@ -0,0 +1,222 @@
+# Moneyball Phil — Odds snapshots
+# -----------------------------------------------------
+# An indexed in-memory table of sportsbook prices loaded from local
+# snapshot files, so modules can look prices up instead of having them
+# typed in. A snapshot is CSV (with a header) or JSONL with one quote per
+# row:
+#
+#   book, event, market, line, price
+#   DK,   Arsenal vs Chelsea, O2.5, , -125
+#   FD,   Gerrit Cole, k_over, 6.5, +105
+#
+# price is American when signed, decimal otherwise (parse_odds); line may
+# be blank. Events and markets match case-insensitively. Market names
+# the app looks up:
+#
+#   soccer   O1.5, O2.5, BTTS                       (event "Home vs Away")
+#   ATS      spread_home, spread_away, total_over, total_under, ml_home, ml_away
+#   pitcher  er_under (line 0.5–4.5), k_over, k_under   (event = pitcher name)
+#   NBA      pts_over, pts_under, pra_over, pra_under   (event = player name)
+#
+#   table = OddsTable()
+#   result = table.load("snapshot.csv")          # ImportResult(rows, added, changed, removed, ...)
+#   table.lookup("Arsenal vs Chelsea", "O2.5")   # best price across books → Quote
+#   table.changed_since(version)                 # {(event, market)} re-priced after `version`
+#
+# Loading a newer snapshot replaces the previous quotes of every book it
+# contains. Only (event, market) pairs whose price actually moved are
+# reported as changed, and every pair remembers the import version that
+# last changed it, so callers holding priced results re-price just those.
+
+import csv
+import io
+import json
+import os
+import threading
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .odds import parse_odds
+
+FIELDS = ("book", "event", "market", "line", "price")
+
+Pair = Tuple[str, str]     # (event key, market key)
+
+
+class Quote(NamedTuple):
+    book: str
+    event: str             # as written in the snapshot
+    market: str
+    line: Optional[float]
+    price: str             # as written: "-125", "+105", "1.91"
+    dec: float
+    implied: float
+    version: int           # import that last changed this price
+
+
+class ImportResult(NamedTuple):
+    rows: int              # quotes read
+    added: int
+    changed: int           # existing quotes whose price moved
+    removed: int           # quotes dropped from the re-imported books
+    errors: List[str]      # "row N: reason" for rows that were skipped
+    pairs: Set[Pair]       # (event, market) pairs touched by added / changed / removed quotes
+    version: int
+
+
+def norm(text) -> str:
+    """Event / market key: lower case, single spaces."""
+    return " ".join(str(text or "").split()).lower()
+
+
+def _line(value) -> Optional[float]:
+    s = str(value if value is not None else "").strip()
+    return None if s == "" else round(float(s), 2)
+
+
+def iter_snapshot(source, fmt: Optional[str] = None) -> Iterator[dict]:
+    """
+    Stream rows from a path or an open file (text or binary). ``fmt`` is
+    "csv" or "jsonl"; by default it follows the file extension (CSV
+    unless the name ends in .jsonl / .json / .ndjson).
+    """
+    name = source if isinstance(source, str) else getattr(source, "name", "")
+    if fmt is None:
+        fmt = "jsonl" if str(name).lower().endswith((".jsonl", ".json", ".ndjson")) else "csv"
+    if isinstance(source, str):
+        f = open(source, "r", encoding="utf-8", newline="")
+        owned = True
+    else:
+        f = source if isinstance(source, io.TextIOBase) else io.TextIOWrapper(source, encoding="utf-8", newline="")
+        owned = False
+    try:
+        if fmt == "jsonl":
+            for raw in f:
+                raw = raw.strip()
+                if raw:
+                    yield json.loads(raw)
+        else:
+            yield from csv.DictReader(f)
+    finally:
+        if owned:
+            f.close()
+        elif isinstance(f, io.TextIOWrapper) and f is not source:
+            f.detach()      # leave the caller's binary file open
+
+
+class OddsTable:
+    """
+    Thread-safe quote index: (event, market) → line → book → Quote. One
+    table can serve every session in the process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: Dict[Pair, Dict[Optional[float], Dict[str, Quote]]] = {}
+        self._pair_version: Dict[Pair, int] = {}
+        self.version = 0
+        self.source: Optional[str] = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(books) for lines in self._index.values() for books in lines.values())
+
+    # ---------------- Import ----------------
+    def load(self, source, fmt: Optional[str] = None, replace: bool = True) -> ImportResult:
+        """
+        Import a snapshot. With ``replace`` (a full snapshot), quotes of the
+        books in the file that the file no longer lists are removed.
+        """
+        return self.load_rows(iter_snapshot(source, fmt), replace,
+                              source if isinstance(source, str) else getattr(source, "name", None))
+
+    def load_rows(self, rows: Iterable[dict], replace: bool = True, source: Optional[str] = None) -> ImportResult:
+        parsed: Dict[Tuple[Pair, Optional[float], str], Tuple[dict, float, float]] = {}
+        errors: List[str] = []
+        n = 0
+        for n, row in enumerate(rows, 1):
+            try:
+                book, event, market = (str(row.get(k) or "").strip() for k in ("book", "event", "market"))
+                if not (book and event and market):
+                    raise ValueError("book, event and market are required")
+                imp, dec = parse_odds(row.get("price"))
+                parsed[((norm(event), norm(market)), _line(row.get("line")), book)] = (row, dec, imp)
+            except (TypeError, ValueError) as e:
+                errors.append(f"row {n}: {e}")
+
+        with self._lock:
+            version = self.version + 1
+            added = changed = removed = 0
+            pairs: Set[Pair] = set()
+            for (pair, line, book), (row, dec, imp) in parsed.items():
+                books = self._index.setdefault(pair, {}).setdefault(line, {})
+                old = books.get(book)
+                if old is not None and old.dec == dec:
+                    continue
+                books[book] = Quote(book, str(row["event"]).strip(), str(row["market"]).strip(), line,
+                                    str(row["price"]).strip(), dec, imp, version)
+                pairs.add(pair)
+                if old is None:
+                    added += 1
+                else:
+                    changed += 1
+            if replace:
+                in_file = {book for (_, _, book) in parsed}
+                for pair, lines in list(self._index.items()):
+                    for line, books in list(lines.items()):
+                        for book in [b for b in books if b in in_file and (pair, line, b) not in parsed]:
+                            del books[book]
+                            pairs.add(pair)
+                            removed += 1
+                        if not books:
+                            del lines[line]
+                    if not lines:
+                        del self._index[pair]
+            if pairs:
+                self.version = version
+                for pair in pairs:
+                    self._pair_version[pair] = version
+            if source:
+                self.source = os.path.basename(str(source))
+            return ImportResult(n, added, changed, removed, errors, pairs, self.version)
+
+    # ---------------- Lookups ----------------
+    def quotes(self, event: str, market: str, line: Optional[float] = None) -> List[Quote]:
+        """Every book's quote for one market (one line, or every line)."""
+        with self._lock:
+            lines = self._index.get((norm(event), norm(market)), {})
+            if line is not None:
+                return list(lines.get(_line(line), {}).values())
+            return [q for books in lines.values() for q in books.values()]
+
+    def lookup(self, event: str, market: str, line: Optional[float] = None,
+               book: Optional[str] = None) -> Optional[Quote]:
+        """
+        Best price (highest decimal odds) for a market, or ``book``'s price.
+        Without a ``line`` the main line is used: the one priced closest to
+        even money.
+        """
+        quotes = self.quotes(event, market, line)
+        if book:
+            quotes = [q for q in quotes if q.book == book]
+        if not quotes:
+            return None
+        if line is None:
+            main = min(quotes, key=lambda q: abs(q.implied - 0.5)).line
+            quotes = [q for q in quotes if q.line == main]
+        return max(quotes, key=lambda q: q.dec)
+
+    def changed_since(self, version: int) -> Set[Pair]:
+        """(event, market) pairs whose prices moved in an import after ``version``."""
+        with self._lock:
+            return {pair for pair, v in self._pair_version.items() if v > version}
+
+    def books(self) -> List[str]:
+        with self._lock:
+            return sorted({b for lines in self._index.values() for books in lines.values() for b in books})
+
+    def events(self, markets: Optional[Iterable[str]] = None) -> List[str]:
+        """Events (as written) that have a quote in any of ``markets`` (default: any market)."""
+        wanted = None if markets is None else {norm(m) for m in markets}
+        with self._lock:
+            return sorted({q.event for (_, market), lines in self._index.items() if wanted is None or market in wanted
+                           for books in lines.values() for q in books.values()})
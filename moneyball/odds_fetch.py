@@ -0,0 +1,365 @@
+# Moneyball Phil — Async odds fetcher
+# -----------------------------------------------------
+# Pulls many book/market prices concurrently from an HTTP odds feed and
+# normalizes them into snapshot rows (book, event, market, line, price)
+# that moneyball.odds_feed.OddsTable.load_rows() and parse_odds() take.
+# Standard library only: asyncio streams over a bounded pool of
+# keep-alive HTTP/1.1 connections.
+#
+#   result = fetch_snapshot("http://127.0.0.1:8765")         # every listed market
+#   table.load_rows(result.rows, source=result.url)
+#
+#   async with FeedClient(url, connections=32, rate=200) as client:
+#       refs = await client.list_markets()
+#       result = await client.fetch(refs)
+#
+#   python -m moneyball.odds_fetch http://127.0.0.1:8765 -o snapshot.jsonl
+#
+# Feed protocol (what moneyball.mock_feed serves):
+#
+#   GET /v1/markets        {"markets": [{"id", "book", "event", "market"}, ...]}
+#   GET /v1/markets/<id>   {"id", "book", "event", "market",
+#                           "quotes": [{"line": 2.5 | null, "american": -120 | "decimal": 1.83 | "price": "-120"}]}
+#
+# Requests run concurrently, so refreshing N markets costs about
+# N / connections round trips rather than N. Every request has a timeout;
+# connection errors, timeouts, 429 and 5xx answers are retried with
+# exponential backoff (429 honours Retry-After); the rate limiter caps
+# requests per second across the whole client.
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import sys
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from .odds import parse_odds
+
+DEFAULT_CONNECTIONS = 32
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_RETRIES = 3
+BACKOFF = 0.1               # seconds before the first retry, doubled each time
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+class FetchError(Exception):
+    """A request that still failed after its retries."""
+
+
+class MarketRef(NamedTuple):
+    id: str
+    book: str = ""
+    event: str = ""
+    market: str = ""
+
+
+class FetchResult(NamedTuple):
+    url: str
+    rows: List[dict]        # snapshot rows for OddsTable.load_rows()
+    markets: int            # markets fetched successfully
+    errors: List[str]       # "<market id>: reason" for markets that failed or had bad quotes
+    requests: int           # HTTP requests sent, retries included
+    retries: int
+    seconds: float
+
+
+# ---------------------------
+# Normalization
+# ---------------------------
+def _price_text(q: dict) -> str:
+    # American numbers keep their sign so parse_odds reads them as American
+    if q.get("american") is not None:
+        return f"{int(float(q['american'])):+d}"
+    if q.get("decimal") is not None:
+        return f"{float(q['decimal']):g}"
+    return str(q.get("price", "")).strip()
+
+
+def normalize(payload: dict) -> Tuple[List[dict], List[str]]:
+    """One market payload → (snapshot rows, errors for quotes parse_odds rejects)."""
+    rows, errors = [], []
+    for i, q in enumerate(payload.get("quotes") or []):
+        try:
+            price = _price_text(q)
+            parse_odds(price)
+        except (TypeError, ValueError) as e:
+            errors.append(f"{payload.get('id')}: quote {i}: {e}")
+            continue
+        line = q.get("line")
+        rows.append({"book": payload.get("book", ""), "event": payload.get("event", ""),
+                     "market": payload.get("market", ""), "line": "" if line is None else line, "price": price})
+    return rows, errors
+
+
+# ---------------------------
+# HTTP/1.1 over asyncio streams
+# ---------------------------
+class _Response(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    keep_alive: bool
+
+
+async def _read_response(reader: asyncio.StreamReader) -> _Response:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed by the feed")
+    parts = status_line.decode("latin-1").split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+        raise ConnectionError(f"bad status line {status_line[:60]!r}")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await reader.readline()
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b"".join(chunks)
+    else:
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+    keep_alive = parts[0] != "HTTP/1.0" and headers.get("connection", "").lower() != "close"
+    return _Response(int(parts[1]), headers, body, keep_alive)
+
+
+class _Pool:
+    """At most ``size`` open connections to one host; idle ones are reused (newest first)."""
+
+    def __init__(self, host: str, port: int, ssl: bool, size: int):
+        self.host, self.port, self.ssl = host, port, ssl
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.opened = 0
+
+    async def request(self, path: str, timeout: float) -> _Response:
+        async with self._slots:
+            if self._idle:
+                conn = self._idle.pop()
+                try:
+                    return self._release(conn, await asyncio.wait_for(self._send(conn, path), timeout))
+                except (OSError, asyncio.IncompleteReadError):
+                    # An idle keep-alive connection the feed has since dropped: use a fresh one
+                    self._close(conn)
+                except BaseException:
+                    self._close(conn)
+                    raise
+            conn = None
+            try:
+                conn = await asyncio.wait_for(asyncio.open_connection(self.host, self.port, ssl=self.ssl or None),
+                                              timeout)
+                self.opened += 1
+                return self._release(conn, await asyncio.wait_for(self._send(conn, path), timeout))
+            except BaseException:
+                self._close(conn)
+                raise
+
+    def _release(self, conn, resp: _Response) -> _Response:
+        if resp.keep_alive:
+            self._idle.append(conn)
+        else:
+            self._close(conn)
+        return resp
+
+    async def _send(self, conn, path: str) -> _Response:
+        reader, writer = conn
+        writer.write((f"GET {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                      "Accept: application/json\r\nConnection: keep-alive\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+        return await _read_response(reader)
+
+    @staticmethod
+    def _close(conn):
+        if conn is not None:
+            conn[1].close()
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+
+class _RateLimiter:
+    """Token bucket: ``rate`` requests per second, bursts of up to ``burst``."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1, int(rate)))
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+# ---------------------------
+# Client
+# ---------------------------
+class FeedClient:
+    """
+    Async client for one feed. ``connections`` bounds the pool (and so the
+    requests in flight), ``rate`` caps requests per second (None = no cap),
+    ``timeout`` applies to each attempt and ``retries`` to each request.
+    """
+
+    def __init__(self, url: str, connections: int = DEFAULT_CONNECTIONS, timeout: float = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES, rate: Optional[float] = None, burst: Optional[int] = None):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Feed URL must be http(s)://host[:port][/prefix], got {url!r}")
+        self.url = url.rstrip("/")
+        self._prefix = parts.path.rstrip("/")
+        ssl = parts.scheme == "https"
+        self._pool = _Pool(parts.hostname, parts.port or (443 if ssl else 80), ssl, max(1, int(connections)))
+        self._limiter = _RateLimiter(rate, burst) if rate else None
+        self.timeout = float(timeout)
+        self.retries = max(0, int(retries))
+        self.requests = 0
+        self.retried = 0
+
+    async def __aenter__(self) -> "FeedClient":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
+
+    async def close(self):
+        await self._pool.close()
+
+    @property
+    def connections_opened(self) -> int:
+        return self._pool.opened
+
+    async def get_json(self, path: str):
+        """GET ``path`` (relative to the feed URL) and decode the JSON body, retrying transient failures."""
+        last = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.retried += 1
+                delay = BACKOFF * (2 ** (attempt - 1)) * (0.5 + random.random())
+                if isinstance(last, _Response) and last.status == 429:
+                    try:
+                        delay = max(delay, float(last.headers.get("retry-after", 0)))
+                    except ValueError:
+                        pass
+                await asyncio.sleep(delay)
+            if self._limiter is not None:
+                await self._limiter.acquire()
+            self.requests += 1
+            try:
+                resp = await self._pool.request(self._prefix + path, self.timeout)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                last = e
+                continue
+            if resp.status in RETRY_STATUS:
+                last = resp
+                continue
+            if resp.status != 200:
+                raise FetchError(f"GET {path}: HTTP {resp.status}")
+            try:
+                return json.loads(resp.body)
+            except ValueError as e:
+                raise FetchError(f"GET {path}: bad JSON ({e})") from None
+        if isinstance(last, _Response):
+            reason = f"HTTP {last.status}"
+        else:
+            reason = type(last).__name__ + (f": {last}" if str(last) else "")
+        raise FetchError(f"GET {path}: {reason} after {self.retries + 1} attempts")
+
+    async def list_markets(self) -> List[MarketRef]:
+        payload = await self.get_json("/v1/markets")
+        return [MarketRef(str(m["id"]), m.get("book", ""), m.get("event", ""), m.get("market", ""))
+                for m in payload.get("markets", [])]
+
+    async def fetch(self, refs: Iterable[MarketRef]) -> FetchResult:
+        """Fetch every market concurrently; failed markets are reported, not raised."""
+        refs = list(refs)
+        t0 = time.perf_counter()
+        requests0, retried0 = self.requests, self.retried
+
+        async def one(ref: MarketRef):
+            try:
+                return normalize(await self.get_json(f"/v1/markets/{quote(ref.id, safe='')}"))
+            except FetchError as e:
+                return None, [f"{ref.id}: {e}"]
+
+        rows, errors, ok = [], [], 0
+        for market_rows, market_errors in await asyncio.gather(*(one(r) for r in refs)):
+            if market_rows is not None:
+                ok += 1
+                rows.extend(market_rows)
+            errors.extend(market_errors)
+        return FetchResult(self.url, rows, ok, errors, self.requests - requests0, self.retried - retried0,
+                           time.perf_counter() - t0)
+
+
+def fetch_snapshot(url: str, markets: Optional[Iterable[str]] = None, **client_opts) -> FetchResult:
+    """
+    Blocking helper: list the feed's markets (or use the given market
+    ids) and fetch them all. Runs its own event loop, so call it from
+    plain threads (CLI, Streamlit script), not from async code.
+    """
+    async def run():
+        async with FeedClient(url, **client_opts) as client:
+            refs = [MarketRef(m) for m in markets] if markets is not None else await client.list_markets()
+            return await client.fetch(refs)
+    return asyncio.run(run())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m moneyball.odds_fetch",
+                                 description="Fetch every market of an odds feed into a JSONL snapshot.")
+    ap.add_argument("url", help="feed base URL, e.g. http://127.0.0.1:8765")
+    ap.add_argument("-o", "--output", default="-", help="JSONL snapshot file (default: stdout)")
+    ap.add_argument("--connections", type=int, default=DEFAULT_CONNECTIONS)
+    ap.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    ap.add_argument("--retries", type=int, default=DEFAULT_RETRIES)
+    ap.add_argument("--rate", type=float, help="max requests per second")
+    args = ap.parse_args(argv)
+
+    try:
+        result = fetch_snapshot(args.url, connections=args.connections, timeout=args.timeout,
+                                retries=args.retries, rate=args.rate)
+    except (FetchError, OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    dst = contextlib.nullcontext(sys.stdout) if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    with dst as f:
+        f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in result.rows)
+
+    for err in result.errors[:10]:
+        print(f"warning: {err}", file=sys.stderr)
+    print(f"[fetch] {result.markets} markets → {len(result.rows)} quotes ({len(result.errors)} errors, "
+          f"{result.requests} requests, {result.retries} retries) in {result.seconds:.3f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
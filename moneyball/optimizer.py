@@ -0,0 +1,132 @@
+# Moneyball Phil — Best-combination parlay search
+# -----------------------------------------------------
+# Finds the top-K parlays of 2..k legs from a pool of saved legs without
+# enumerating every combination. Legs are treated as independent, so a
+# parlay's numbers are sums of per-leg logs:
+#
+#   log P(hit)      = Σ log p_i
+#   log (1 + ROI)   = Σ log p_i + Σ log d_i      (d = decimal odds)
+#
+# A depth-first search over legs (sorted best-first on the objective)
+# bounds every branch with the best sum the remaining slots could still
+# add, and cuts it when that bound cannot beat the current K-th best or
+# reach the EV floor.
+#
+#   picks = best_parlays(true_probs, dec_odds, max_legs=4, top_k=10)
+#   picks = best_parlays(..., objective="prob", ev_floor=0.05)
+#
+# Legs that share a group (same game, same player) never go in one parlay:
+# the independent product would misprice them.
+
+import heapq
+import math
+from typing import Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+OBJECTIVES = ("ev", "prob")
+
+
+class ParlayPick(NamedTuple):
+    legs: Tuple[int, ...]   # indices into the input pool
+    true_prob: float        # product of leg probabilities
+    dec_odds: float         # product of leg decimal odds
+    ev_pct: float           # ROI per $1 in %
+
+
+def _suffix_top(values: np.ndarray, k: int) -> List[np.ndarray]:
+    """top[j] = the k largest values in values[j:], descending (shorter near the end)."""
+    top = [np.empty(0)] * (len(values) + 1)
+    for j in range(len(values) - 1, -1, -1):
+        top[j] = np.sort(np.append(top[j + 1], values[j]))[::-1][:k]
+    return top
+
+
+def _best_gain(top: np.ndarray, need: int, room: int) -> float:
+    """Largest sum from adding ``need`` to ``room`` legs whose values are among ``top``."""
+    if len(top) < need:
+        return -math.inf
+    return float(top[:need].sum() + np.clip(top[need:room], 0.0, None).sum())
+
+
+def best_parlays(true_probs: Sequence[float], dec_odds: Sequence[float], max_legs: int = 4, top_k: int = 10,
+                 objective: str = "ev", ev_floor: Optional[float] = None, min_legs: int = 2,
+                 groups: Optional[Sequence[Optional[Hashable]]] = None) -> List[ParlayPick]:
+    """
+    Top ``top_k`` parlays of ``min_legs``..``max_legs`` legs, best first.
+
+    ``objective="ev"`` ranks by expected ROI; ``"prob"`` ranks by true hit
+    probability. ``ev_floor`` (ROI per $1, e.g. 0.05) drops parlays below
+    it under either objective. Legs with the same non-empty ``groups``
+    entry are never combined.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {OBJECTIVES}.")
+    if not 1 <= min_legs <= max_legs:
+        raise ValueError("Need 1 ≤ min_legs ≤ max_legs.")
+    if top_k < 1:
+        raise ValueError("top_k must be ≥ 1.")
+    p = np.asarray(true_probs, dtype=float)
+    d = np.asarray(dec_odds, dtype=float)
+    if p.shape != d.shape:
+        raise ValueError("true_probs and dec_odds must have the same length.")
+    groups = [None] * p.size if groups is None else list(groups)
+
+    # Legs that can never hit or never pay cannot be in a useful parlay
+    usable = np.flatnonzero((p > 0) & (d > 1.0))
+    with np.errstate(divide="ignore"):
+        logp = np.log(np.clip(p[usable], None, 1.0))
+        logv = logp + np.log(d[usable])                  # log(p·d) = log(1 + leg ROI)
+    key = logv if objective == "ev" else logp
+    order = np.argsort(-key, kind="stable")
+    idx, logp, logv, key = usable[order], logp[order], logv[order], key[order]
+    n = idx.size
+
+    group_ids = {}
+    mask = []
+    for g in (groups[i] for i in idx):
+        if g is None or g == "":
+            mask.append(0)
+        else:
+            mask.append(1 << group_ids.setdefault(g, len(group_ids)))
+
+    top_key = _suffix_top(key, max_legs)
+    top_v = top_key if objective == "ev" else _suffix_top(logv, max_legs)
+    floor = -math.inf if ev_floor is None else math.log(max(1.0 + ev_floor, 1e-300))
+    key_list, logp_list, logv_list = key.tolist(), logp.tolist(), logv.tolist()
+
+    heap: List[Tuple[float, Tuple[int, ...]]] = []    # (objective, legs) min-heap of the best K
+
+    def search(start: int, chosen: Tuple[int, ...], used: int, s_key: float, s_v: float):
+        size = len(chosen)
+        if size >= min_legs and s_v >= floor:
+            item = (s_key, chosen)
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        if size == max_legs:
+            return
+        need, room = max(min_legs - size - 1, 0), max_legs - size - 1
+        for j in range(start, n):
+            # Best objective any parlay through leg j can reach; legs are sorted
+            # on the objective, so once this fails every later j fails too.
+            bound = s_key + key_list[j] + _best_gain(top_key[j + 1], need, room)
+            if len(heap) == top_k and bound <= heap[0][0]:
+                break
+            if mask[j] & used:
+                continue
+            if s_v + logv_list[j] + _best_gain(top_v[j + 1], need, room) < floor:
+                if objective == "ev":
+                    break
+                continue
+            search(j + 1, chosen + (j,), used | mask[j], s_key + key_list[j], s_v + logv_list[j])
+
+    search(0, (), 0, 0.0, 0.0)
+
+    picks = []
+    for _, chosen in sorted(heap, reverse=True):
+        true_prob = math.exp(sum(logp_list[j] for j in chosen))
+        dec = float(np.prod(d[idx[list(chosen)]]))
+        picks.append(ParlayPick(tuple(int(idx[j]) for j in chosen), true_prob, dec, (true_prob * dec - 1.0) * 100.0))
+    return picks
@@ -0,0 +1,162 @@
+# Moneyball Phil — Model parameters
+# -----------------------------------------------------
+# The model constants that moneyball.calibrate fits, with the values the
+# modules shipped with as defaults. Fitted sets are versioned JSON files
+# in $MONEYBALL_PARAMS (default: params/ at the repository root):
+#
+#   params/v0003.json   {"version": 3, "created": "...", "params": {...}, "fit": {...}}
+#
+# The highest version is loaded once, when moneyball.kernels is first
+# imported (app start, CLI start, every pool worker), and the kernels
+# bind their constants from it. MONEYBALL_PARAMS_VERSION pins another
+# version (0 = the defaults). Names a file leaves out keep their default.
+# The default directory does not depend on where the app or CLI is
+# started from. An unreadable or invalid latest version is
+# skipped with a logged warning (the newest valid one loads instead); an
+# explicit load(version) or a pinned version raises.
+#
+#   ACTIVE.version, ACTIVE.values["nfl.yards_scale"]
+#   write({"soccer.def_factor": 1.14}, fit={...})    # → ParamSet of the next version
+
+import datetime
+import json
+import logging
+import math
+import os
+import re
+from typing import Any, Dict, List, NamedTuple, Optional
+
+PARAMS_ENV = "MONEYBALL_PARAMS"
+VERSION_ENV = "MONEYBALL_PARAMS_VERSION"
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "params")
+
+DEFAULTS: Dict[str, Any] = {
+    "nfl.yards_scale": 15.0,           # logistic_prob scale, yards
+    "nfl.receptions_scale": 1.5,
+    "nfl.tds_scale": 0.5,
+    "nba.points_scale": 6.5,           # true_prob_from_line logit scale
+    "nba.pra_scale": 8.0,
+    "ats.sigmas": {                    # get_sport_sigmas: [sd_total, sd_margin]
+        "MLB": [3.5, 3.0], "NFL": [10.0, 9.0], "NCAA Football": [12.0, 10.0], "NBA": [15.0, 12.0],
+        "NCAA Basketball": [18.0, 14.0], "default": [12.0, 10.0],
+    },
+    "mlb.avg_weights": [0.2, 0.3, 0.2, 0.2, 0.1],   # season, last 7, split, hand, vs pitcher
+    "pitcher.pa_per_inning": 4.3,
+    "soccer.def_factor": 1.2,
+}
+
+_FILE = re.compile(r"^v(\d+)\.json$")
+log = logging.getLogger(__name__)
+
+
+class ParamSet(NamedTuple):
+    version: int                # 0 = the shipped defaults
+    values: Dict[str, Any]
+    path: Optional[str]
+
+
+def params_dir(root: Optional[str] = None) -> str:
+    return root or os.environ.get(PARAMS_ENV) or DEFAULT_DIR
+
+
+def versions(root: Optional[str] = None) -> List[int]:
+    d = params_dir(root)
+    if not os.path.isdir(d):
+        return []
+    return sorted(int(m.group(1)) for m in map(_FILE.match, os.listdir(d)) if m)
+
+
+def version_path(version: int, root: Optional[str] = None) -> str:
+    return os.path.join(params_dir(root), f"v{version:04d}.json")
+
+
+def validate(name: str, value) -> Any:
+    """``value`` in the shape of the default (positive numbers and sigmas; weights summing to 1)."""
+    if name not in DEFAULTS:
+        raise ValueError(f"unknown parameter '{name}'")
+    default = DEFAULTS[name]
+    if isinstance(default, dict):
+        if not isinstance(value, dict):
+            raise ValueError(f"{name}: expected a mapping")
+        return {**default, **{str(k): _numbers(name, v, len(default["default"]), positive=True) for k, v in value.items()}}
+    if isinstance(default, list):
+        out = _numbers(name, value, len(default))
+        if abs(sum(out) - 1.0) > 1e-6:
+            raise ValueError(f"{name}: weights must sum to 1")
+        return out
+    if not _is_number(value) or not value > 0:
+        raise ValueError(f"{name}: expected a positive number")
+    return float(value)
+
+
+def _is_number(x) -> bool:
+    return isinstance(x, (int, float)) and not isinstance(x, bool) and math.isfinite(x)
+
+
+def _numbers(name: str, value, length: int, positive: bool = False) -> List[float]:
+    if not isinstance(value, (list, tuple)) or len(value) != length or \
+            not all(_is_number(x) and (x > 0 if positive else x >= 0) for x in value):
+        kind = "positive" if positive else "non-negative"
+        raise ValueError(f"{name}: expected {length} {kind} numbers")
+    return [float(x) for x in value]
+
+
+def load(version: Optional[int] = None, root: Optional[str] = None) -> ParamSet:
+    """A stored version (default: the latest) merged over DEFAULTS."""
+    if version is None:
+        found = versions(root)
+        version = found[-1] if found else 0
+    if version == 0:
+        return ParamSet(0, json.loads(json.dumps(DEFAULTS)), None)
+    path = version_path(version, root)
+    values = json.loads(json.dumps(DEFAULTS))
+    try:
+        with open(path, encoding="utf-8") as f:
+            stored = json.load(f)
+        stored = stored.get("params", {}) if isinstance(stored, dict) else None
+        if not isinstance(stored, dict):
+            raise ValueError("expected a JSON object with a \"params\" mapping")
+        for name, value in stored.items():
+            if name in DEFAULTS:        # names a newer release dropped are ignored
+                values[name] = validate(name, value)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"cannot read parameter version {version} ({path}): {e}") from None
+    return ParamSet(version, values, path)
+
+
+def write(values: Dict[str, Any], fit: Optional[Dict[str, Any]] = None, base: Optional[ParamSet] = None,
+          root: Optional[str] = None) -> ParamSet:
+    """
+    Save ``values`` (over ``base``, default the active set) as the next
+    version. ``fit`` is stored alongside as a record of how they were fitted.
+    """
+    base = ACTIVE if base is None else base
+    merged = {**base.values, **{name: validate(name, v) for name, v in values.items()}}
+    version = max(versions(root) + [base.version]) + 1
+    path = version_path(version, root)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    doc = {"version": version, "created": datetime.datetime.now().isoformat(timespec="seconds"),
+           "base_version": base.version, "params": merged, "fit": fit or {}}
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp, path)
+    return ParamSet(version, merged, path)
+
+
+def _active() -> ParamSet:
+    # A pinned version must load; otherwise the newest valid one, so a
+    # half-written or hand-broken file never makes the package unimportable
+    pinned = os.environ.get(VERSION_ENV, "").strip()
+    if pinned:
+        return load(int(pinned))
+    for version in reversed(versions()):
+        try:
+            return load(version)
+        except ValueError as e:
+            log.warning("skipping model parameters: %s", e)
+    return load(0)
+
+
+ACTIVE = _active()
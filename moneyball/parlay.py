@@ -0,0 +1,116 @@
+# Moneyball Phil — Correlated parlay pricing
+# -----------------------------------------------------
+# Replaces the plain product of leg probabilities with a Gaussian-copula
+# simulation: each leg hits when its latent normal falls below
+# Φ⁻¹(true_prob), and the latents are correlated per a leg correlation
+# matrix. Marginals are untouched; only the joint hit rate changes.
+#
+# Default correlations come from leg tags: legs sharing a "team" tag get
+# SAME_TEAM_RHO, legs sharing only a "game" tag get SAME_GAME_RHO, and
+# anything else is independent. Explicit pair overrides win over both.
+
+from statistics import NormalDist
+from typing import Dict, Hashable, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .sim import run_blocks
+
+SAME_GAME_RHO = 0.20
+SAME_TEAM_RHO = 0.40
+
+DEFAULT_DRAWS = 1_000_000
+BATCH_DRAWS = 250_000
+Z_95 = 1.959963984540054
+
+
+class ParlaySim(NamedTuple):
+    true_prob: float          # correlated joint hit probability
+    ci_low: float             # 95% CI on true_prob
+    ci_high: float
+    independent_prob: float   # plain product, for comparison
+    n_draws: int              # 0 when priced exactly (no correlation)
+    ev_pct: Optional[float] = None   # ROI per $1 in %, when decimal odds given
+    ev_ci_low: Optional[float] = None
+    ev_ci_high: Optional[float] = None
+
+
+def _tag(leg: dict, key: str) -> str:
+    return str(leg.get(key) or "").strip().lower()
+
+
+def game_tag(*teams: str) -> str:
+    """Order-free game tag from team names, so "A @ B" and "B vs A" legs match."""
+    return " vs ".join(sorted(t.strip().lower() for t in teams if t and t.strip()))
+
+
+def correlation_matrix(legs: Sequence[dict],
+                       overrides: Optional[Dict[Tuple[Hashable, Hashable], float]] = None,
+                       same_game: float = SAME_GAME_RHO, same_team: float = SAME_TEAM_RHO) -> np.ndarray:
+    """Leg correlation matrix from "game"/"team" tags, with optional {(id_a, id_b): rho} overrides."""
+    n = len(legs)
+    R = np.eye(n)
+    for i in range(n):
+        for j in range(i + 1, n):
+            gi, gj = _tag(legs[i], "game"), _tag(legs[j], "game")
+            ti, tj = _tag(legs[i], "team"), _tag(legs[j], "team")
+            if ti and ti == tj:
+                R[i, j] = R[j, i] = same_team
+            elif gi and gi == gj:
+                R[i, j] = R[j, i] = same_game
+    if overrides:
+        index = {leg.get("id"): k for k, leg in enumerate(legs)}
+        for (a, b), rho in overrides.items():
+            if a in index and b in index and index[a] != index[b]:
+                R[index[a], index[b]] = R[index[b], index[a]] = float(rho)
+    return R
+
+
+def _psd_cholesky(R: np.ndarray) -> np.ndarray:
+    try:
+        return np.linalg.cholesky(R)
+    except np.linalg.LinAlgError:
+        # Hand-entered correlations can be inconsistent: clip to the nearest valid matrix
+        w, V = np.linalg.eigh(R)
+        R = (V * np.clip(w, 1e-6, None)) @ V.T
+        d = np.sqrt(np.diag(R))
+        return np.linalg.cholesky(R / np.outer(d, d))
+
+
+def _hit_block(rng: np.random.Generator, m: int, L: np.ndarray, thresholds: np.ndarray) -> int:
+    # One block of draws: how many had every leg's latent under its threshold
+    z = rng.standard_normal((m, L.shape[0]), dtype=np.float32) @ L.T
+    return int(np.count_nonzero((z <= thresholds).all(axis=1)))
+
+
+def simulate_parlay(true_probs: Sequence[float], corr: Optional[np.ndarray] = None,
+                    dec_odds: Optional[float] = None, n_draws: int = DEFAULT_DRAWS,
+                    seed: int = 0, batch: int = BATCH_DRAWS, workers: Optional[int] = None) -> ParlaySim:
+    """
+    Joint hit probability of all legs under ``corr`` (identity = independent).
+    Draws run in blocks of ``batch`` (moneyball.sim), so memory stays
+    bounded and large jobs spread over cores; a fixed ``seed`` gives the
+    same number on every rerun and for any ``workers``.
+    """
+    p = np.clip(np.asarray(true_probs, dtype=float), 0.0, 1.0)
+    n = p.size
+    independent = float(np.prod(p))
+    R = np.eye(n) if corr is None else np.asarray(corr, dtype=float)
+
+    if n <= 1 or np.allclose(R, np.eye(n)) or independent == 0.0 or np.all(p == 1.0):
+        prob, lo, hi, draws = independent, independent, independent, 0
+    else:
+        nd = NormalDist()
+        thresholds = np.array([nd.inv_cdf(x) if 0.0 < x < 1.0 else (np.inf if x >= 1.0 else -np.inf) for x in p],
+                              dtype=np.float32)
+        L = _psd_cholesky(R).astype(np.float32)
+        hits = sum(run_blocks(_hit_block, n_draws, L, thresholds, seed=seed, block=batch, workers=workers))
+        draws = int(n_draws)
+        prob = hits / draws
+        half = Z_95 * float(np.sqrt(max(prob * (1.0 - prob), 1e-12) / draws))
+        lo, hi = max(0.0, prob - half), min(1.0, prob + half)
+
+    if dec_odds is None:
+        return ParlaySim(prob, lo, hi, independent, draws)
+    roi = lambda q: (q * dec_odds - 1.0) * 100.0
+    return ParlaySim(prob, lo, hi, independent, draws, roi(prob), roi(lo), roi(hi))
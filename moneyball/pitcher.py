@@ -0,0 +1,178 @@
+# Moneyball Phil — Pitcher strikeout and earned-run ladders
+# -----------------------------------------------------
+# The pitcher_app models, built once per pitcher as a full PMF vector:
+# strikeouts (batters faced × per-PA strikeout rate, binomial) and earned
+# runs (Poisson with the projected mean ER). Every line is then priced
+# from the cumulative sum, so a whole ladder (2.5–10.5 Ks, 0.5–4.5 ER and
+# any alt lines) costs the same as one line, and a slate of starters is
+# one (pitchers × lines) array.
+#
+#   res = price_k_slate(names, total_ip, gs, last3, k_pct, opp_k_pct)
+#   res.over_pct[i, j]  → P(pitcher i over res.lines[j]) in %
+#
+#   er = price_er_slate(names, era, xera, opp_ops, league_ops, total_ip, gs, last3)
+#   er.under_pct[i, j]  → P(pitcher i under er.lines[j] ER) in %
+
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .kernels import (
+    BALLPARK_IP_ADJ, binom_pmf_vector, er_lambda, estimate_pK, expected_bf, expected_innings, parse_pct,
+    poisson_pmf_vector,
+)
+
+K_LINES = np.arange(2.5, 10.5 + 0.5, 1.0)
+ER_LINES = np.arange(0.5, 4.5 + 0.5, 1.0)
+
+
+class KLadder(NamedTuple):
+    pitchers: np.ndarray     # (n,)
+    expected_ip: np.ndarray  # (n,)
+    n_bf: np.ndarray         # (n,) batters faced
+    pK: np.ndarray           # (n,) per-PA strikeout probability
+    lines: np.ndarray        # (m,) or (n, m)
+    pmf: np.ndarray          # (n, k) P(exactly k Ks)
+    over_pct: np.ndarray     # (n, m)
+    under_pct: np.ndarray    # (n, m)
+
+    @property
+    def expected_ks(self) -> np.ndarray:
+        return np.round(self.n_bf * self.pK, 2)
+
+    def to_frame(self):
+        """Long format: one row per pitcher-line pair."""
+        import pandas as pd
+        n, m = self.over_pct.shape
+        return pd.DataFrame({
+            "Pitcher": np.repeat(self.pitchers, m),
+            "Exp Ks": np.repeat(self.expected_ks, m),
+            "Line": np.broadcast_to(self.lines, (n, m)).ravel(),
+            "Over %": np.round(self.over_pct, 2).ravel(),
+            "Under %": np.round(self.under_pct, 2).ravel(),
+        })
+
+
+def k_ladder(n_bf, pK, lines=K_LINES, pitchers=None, expected_ip=None) -> KLadder:
+    """
+    Over/Under % for every line from one binomial PMF per pitcher. ``lines``
+    is a shared 1-D ladder or one row of lines per pitcher. A line L goes
+    Under on floor(L) Ks or fewer, so P(under) = CDF[floor(L)].
+    """
+    n_bf = np.atleast_1d(np.asarray(n_bf, dtype=int))
+    pK = np.broadcast_to(np.atleast_1d(np.asarray(pK, dtype=float)), n_bf.shape)
+    lines = np.atleast_1d(np.asarray(lines, dtype=float))
+    k_under = np.floor(lines).astype(int)
+    if np.any(k_under < 0):
+        raise ValueError("K lines must be ≥ 0.")
+    max_k = int(max(n_bf.max(), k_under.max()))
+    pmf = binom_pmf_vector(n_bf, pK, max_k)
+    cum = np.cumsum(pmf, axis=-1)
+    cdf = cum[:, k_under] if lines.ndim == 1 else np.take_along_axis(cum, k_under, axis=-1)
+    n = n_bf.size
+    pitchers = np.asarray([f"Pitcher {i + 1}" for i in range(n)] if pitchers is None else pitchers, dtype=object)
+    expected_ip = np.full(n, np.nan) if expected_ip is None else np.asarray(expected_ip, dtype=float)
+    return KLadder(pitchers, expected_ip, n_bf, np.asarray(pK), lines, pmf, (1.0 - cdf) * 100, cdf * 100)
+
+
+def price_k_slate(pitchers: Sequence[str], total_ip, games_started, last3_ip: Sequence[str],
+                  k_pct: Sequence, opp_k_pct: Sequence, park=1.0, ump=1.0, recent=1.0,
+                  lines=K_LINES) -> KLadder:
+    """
+    K ladder for every starter on a slate, from the K form's inputs.
+    ``k_pct`` / ``opp_k_pct`` accept 24.3 or 0.243 style values.
+    """
+    n = len(pitchers)
+    total_ip, games_started = np.broadcast_to(total_ip, n), np.broadcast_to(games_started, n)
+    expected_ip = np.array([expected_innings(float(ip), int(gs), last3)
+                            for ip, gs, last3 in zip(total_ip, games_started, last3_ip)])
+    n_bf = np.array([expected_bf(ip) for ip in expected_ip])
+    pK = estimate_pK(np.array([parse_pct(x) for x in k_pct]), np.array([parse_pct(x) for x in opp_k_pct]),
+                     np.asarray(park, dtype=float), np.asarray(ump, dtype=float), np.asarray(recent, dtype=float))
+    return k_ladder(n_bf, pK, lines, pitchers, expected_ip)
+
+
+class ERLadder(NamedTuple):
+    pitchers: np.ndarray     # (n,)
+    expected_ip: np.ndarray  # (n,)
+    adjusted_era: np.ndarray  # (n,)
+    lam_er: np.ndarray       # (n,) mean earned runs
+    lines: np.ndarray        # (m,) or (n, m)
+    pmf: np.ndarray          # (n, k) P(exactly k ER)
+    over_pct: np.ndarray     # (n, m)
+    under_pct: np.ndarray    # (n, m)
+
+    def to_frame(self):
+        """Long format: one row per pitcher-line pair."""
+        import pandas as pd
+        n, m = self.under_pct.shape
+        return pd.DataFrame({
+            "Pitcher": np.repeat(self.pitchers, m),
+            "Proj ER": np.repeat(self.lam_er, m),
+            "Line": np.broadcast_to(self.lines, (n, m)).ravel(),
+            "Under %": np.round(self.under_pct, 2).ravel(),
+            "Over %": np.round(self.over_pct, 2).ravel(),
+        })
+
+
+def er_ladder(lam_er, lines=ER_LINES, pitchers=None, expected_ip=None, adjusted_era=None) -> ERLadder:
+    """
+    Under/Over % for every ER line from one Poisson PMF per pitcher.
+    ``lines`` is a shared 1-D ladder or one row of lines per pitcher; a line
+    L goes Under on floor(L) ER or fewer. An invalid mean (negative, NaN)
+    prices as NaN, like poisson_cdf.
+    """
+    lam_er = np.atleast_1d(np.asarray(lam_er, dtype=float))
+    lines = np.atleast_1d(np.asarray(lines, dtype=float))
+    k_under = np.floor(lines).astype(int)
+    if np.any(k_under < 0):
+        raise ValueError("ER lines must be ≥ 0.")
+    valid = np.isfinite(lam_er) & (lam_er >= 0)
+    pmf = poisson_pmf_vector(np.where(valid, lam_er, 0.0), int(k_under.max()))
+    pmf[~valid] = np.nan
+    cum = np.cumsum(pmf, axis=-1)
+    cdf = cum[:, k_under] if lines.ndim == 1 else np.take_along_axis(cum, k_under, axis=-1)
+    n = lam_er.size
+    pitchers = np.asarray([f"Pitcher {i + 1}" for i in range(n)] if pitchers is None else pitchers, dtype=object)
+    expected_ip = np.full(n, np.nan) if expected_ip is None else np.asarray(expected_ip, dtype=float)
+    adjusted_era = np.full(n, np.nan) if adjusted_era is None else np.asarray(adjusted_era, dtype=float)
+    return ERLadder(pitchers, expected_ip, adjusted_era, lam_er, lines, pmf, (1.0 - cdf) * 100, cdf * 100)
+
+
+def price_er_slate(pitchers: Sequence[str], era, xera, opp_ops, league_ops, total_ip, games_started,
+                   last3_ip: Sequence[str], ballpark: Optional[Sequence[str]] = None, lines=ER_LINES) -> ERLadder:
+    """
+    ER ladder for every starter on a slate, from the ER form's inputs.
+    ``xera`` > 0 overrides ERA; ``ballpark`` names a BALLPARK_IP_ADJ key
+    per pitcher (default Neutral).
+    """
+    n = len(pitchers)
+    era, xera, opp_ops, league_ops, total_ip, games_started = (
+        np.broadcast_to(np.asarray(x, dtype=float), n) for x in (era, xera, opp_ops, league_ops, total_ip,
+                                                                    games_started))
+    ballpark = ["Neutral"] * n if ballpark is None else ballpark
+    expected_ip = np.array([expected_innings(float(ip), int(gs), last3, BALLPARK_IP_ADJ[park or "Neutral"])
+                            for ip, gs, last3, park in zip(total_ip, games_started, last3_ip, ballpark)])
+    adjusted = [er_lambda(*args) for args in zip(era, xera, opp_ops, league_ops, expected_ip)]
+    return er_ladder([lam for _, lam in adjusted], lines, pitchers, expected_ip, [a for a, _ in adjusted])
+
+
+def score_er_slate(table, lines=ER_LINES):
+    """
+    ER ladder for a table of starters (DataFrame or mapping of columns)
+    with the ER form's fields: pitcher, era, xera, opp_ops, league_ops,
+    total_ip, games_started, last3_ip and ballpark (xera / ballpark may be
+    missing or blank). Long format, one row per pitcher-line pair.
+    """
+    n = len(np.asarray(table["era"]))
+    column = lambda key, default: (np.asarray(table[key], dtype=object) if key in table
+                                   else np.full(n, default, dtype=object))
+    blank = lambda x: x is None or (isinstance(x, float) and np.isnan(x)) or str(x).strip() == ""
+    xera = [0.0 if blank(x) else float(x) for x in column("xera", None)]
+    ballpark = ["Neutral" if blank(x) else str(x).strip() for x in column("ballpark", None)]
+    pitchers = [f"Pitcher {i + 1}" if blank(x) else str(x) for i, x in enumerate(column("pitcher", None))]
+    res = price_er_slate(pitchers, np.asarray(table["era"], dtype=float), xera,
+                         np.asarray(table["opp_ops"], dtype=float), np.asarray(table["league_ops"], dtype=float),
+                         np.asarray(table["total_ip"], dtype=float), column("games_started", 15).astype(float),
+                         [str(x) for x in column("last3_ip", "")], ballpark, lines)
+    return res.to_frame()
@@ -0,0 +1,91 @@
+# Moneyball Phil — Typed saved plays
+# -----------------------------------------------------
+# A saved prop (NFL board, pitcher board, NFL plays waiting to be saved)
+# keeps its numbers as numbers: true probability as a fraction, EV in %,
+# American odds as a float. Text such as "58.00%" is made only when a
+# board is drawn (fmt_pct), and parsed only once, when a payload saved
+# by an older version ("True Prob": "58.00%") is loaded. A legacy row
+# without a usable probability loads with true_prob (and EV, tier) None.
+#
+#   play = Play("NFL", "Over 245.5 Pass Yds", odds=-110, true_prob=0.58, player="Mahomes", group="QB")
+#   store.add("nfl_all_props", play.to_payload(), ...)
+#   play = Play.from_payload(row)            # new or legacy payload
+#
+# Plays are slotted: no per-instance __dict__, which matters for boards
+# and sessions that hold hundreds of them.
+
+from typing import Optional
+
+from .kernels import ev_calc, get_tier_prob
+
+
+def fmt_pct(frac: Optional[float], digits: int = 2) -> str:
+    """0.5812 → "58.12%" (render time only)."""
+    return "—" if frac is None else f"{frac * 100:.{digits}f}%"
+
+
+def _pct_text(value) -> Optional[float]:
+    # Legacy payloads: "58.00%" (or a bare number) in percent; None when missing or unparseable
+    if value is None or value == "":
+        return None
+    try:
+        return float(str(value).replace("%", ""))
+    except ValueError:
+        return None
+
+
+class Play:
+    """
+    One saved prop leg. ``ev_pct`` and ``tier`` default to the board's usual
+    rules; a play with no ``true_prob`` (None) has neither.
+    """
+
+    __slots__ = ("sport", "market", "player", "description", "group", "opp",
+                 "odds", "true_prob", "ev_pct", "tier", "id", "key")
+
+    def __init__(self, sport: str, market: str, odds: float, true_prob: Optional[float], player: str = "",
+                 description: str = "", group: str = "", opp: str = "", ev_pct: Optional[float] = None,
+                 tier: Optional[str] = None, id: Optional[str] = None, key: Optional[str] = None):
+        self.sport = sport
+        self.market = market
+        self.player = player
+        self.description = description
+        self.group = group
+        self.opp = opp
+        self.odds = float(odds)
+        self.true_prob = None if true_prob is None else float(true_prob)
+        priced = self.true_prob is not None
+        self.ev_pct = float(ev_pct) if ev_pct is not None else ev_calc(self.true_prob, self.odds) if priced else None
+        self.tier = tier if tier is not None else get_tier_prob(self.true_prob * 100.0) if priced else None
+        self.id = id
+        self.key = key          # the store's row key, set on load
+
+    @property
+    def label(self) -> str:
+        """The leg's name: the description, else "Player — market"."""
+        return self.description or f"{self.player} — {self.market}"
+
+    def to_payload(self) -> dict:
+        """JSON-ready dict for moneyball.store (empty fields left out; true_prob always kept)."""
+        return {name: getattr(self, name) for name in self.__slots__[:-1]
+                if name == "true_prob" or getattr(self, name) not in (None, "")}
+
+    @classmethod
+    def from_payload(cls, d: dict) -> "Play":
+        if "true_prob" in d:
+            return cls(d["sport"], d.get("market", ""), d["odds"], d["true_prob"], d.get("player", ""),
+                       d.get("description", ""), d.get("group", ""), d.get("opp", ""), d.get("ev_pct"),
+                       d.get("tier"), d.get("id"), d.get("_key"))
+        # Older string-formatted records: NFL {Player, Prop, Group, Opp, ...}
+        # or pitcher {Market, Description, EV, Tier, ...}
+        true_prob = _pct_text(d.get("True Prob"))
+        true_prob = None if true_prob is None else true_prob / 100.0
+        if "Player" in d:
+            return cls("NFL", d.get("Prop", ""), d.get("Odds", 0.0), true_prob, player=d["Player"],
+                       group=d.get("Group", ""), opp=d.get("Opp", ""), id=d.get("id"), key=d.get("_key"))
+        return cls("MLB", d.get("Market", ""), d.get("Odds", 0.0), true_prob, description=d.get("Description", ""),
+                   ev_pct=_pct_text(d.get("EV")), tier=d.get("Tier"), id=d.get("id"), key=d.get("_key"))
+
+    def __repr__(self) -> str:
+        prob = "None" if self.true_prob is None else f"{self.true_prob:.4f}"
+        return f"Play({self.sport!r}, {self.label!r}, odds={self.odds:g}, true_prob={prob})"
@@ -0,0 +1,127 @@
+# Moneyball Phil — Multi-core simulation runner
+# -----------------------------------------------------
+# Splits a Monte Carlo job into fixed-size blocks of draws and runs the
+# blocks on a process pool. Each block draws from its own stream, spawned
+# from one SeedSequence, and the block layout depends only on the number
+# of draws and the block size, never on the worker count. So a job gives
+# bit-identical results with 1 worker or 16, and throughput scales with
+# cores because blocks share nothing.
+#
+#   def hits(rng, m, probs):                      # top-level (picklable) kernel
+#       return int(((rng.random((m, probs.size)) < probs).all(axis=1)).sum())
+#
+#   blocks = run_blocks(hits, 10_000_000, probs, seed=7)   # per-block results, block order
+#   p = sum(blocks) / 10_000_000
+#
+# A kernel is called as kernel(rng, m, *args) for every block, with a
+# numpy Generator and the block's draw count; results come back in block
+# order, so float reductions over them are reproducible too.
+#
+# Small jobs run inline in the calling thread (starting workers costs more
+# than it saves). Larger ones use a pool that is created once per process
+# and reused by later jobs. Set MONEYBALL_WORKERS to fix the worker count
+# (1 = always inline). Workers start with forkserver / spawn, so each one
+# imports the calling script as __mp_main__: a script that runs jobs keeps
+# its top-level work under `if __name__ == "__main__":` (the Streamlit
+# entry renders from main() for this reason), and kernels must live in an
+# importable module, not in the script.
+
+import atexit
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+BLOCK_DRAWS = 250_000
+PARALLEL_MIN_DRAWS = 2_000_000      # below this, jobs run inline
+WORKERS_ENV = "MONEYBALL_WORKERS"
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def block_sizes(n_draws: int, block: int = BLOCK_DRAWS) -> List[int]:
+    """Draw counts of the job's blocks: full blocks, then the remainder."""
+    n_draws, block = int(n_draws), max(1, int(block))
+    full, rest = divmod(n_draws, block)
+    return [block] * full + ([rest] if rest else [])
+
+
+def cpu_count() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def default_workers(n_draws: int) -> int:
+    env = os.environ.get(WORKERS_ENV, "").strip()
+    if env:
+        return max(1, int(env))
+    return cpu_count() if n_draws >= PARALLEL_MIN_DRAWS else 1
+
+
+def _context():
+    # forkserver / spawn: never fork a process that is running other threads (Streamlit)
+    if sys.platform != "win32" and "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["numpy", "moneyball.sim"])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """The shared pool, (re)created when a job asks for more workers than it has."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or workers > _pool_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=True)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=_context())
+            _pool_workers = workers
+        return _pool
+
+
+@atexit.register
+def shutdown_pool():
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+        _pool, _pool_workers = None, 0
+
+
+def _run_block(kernel: Callable, seq: np.random.SeedSequence, m: int, args: tuple):
+    return kernel(np.random.default_rng(seq), m, *args)
+
+
+def run_blocks(kernel: Callable[..., Any], n_draws: int, *args, seed: int = 0, block: int = BLOCK_DRAWS,
+               workers: Optional[int] = None) -> List[Any]:
+    """
+    Run ``kernel(rng, m, *args)`` over ``n_draws`` draws in blocks of
+    ``block`` and return the per-block results in block order. ``workers``
+    None picks inline for small jobs and every core otherwise; the
+    results are the same either way.
+    """
+    sizes = block_sizes(n_draws, block)
+    seqs = np.random.SeedSequence(seed).spawn(len(sizes))
+    n_workers = min(len(sizes), default_workers(n_draws) if workers is None else max(1, int(workers)))
+    if n_workers <= 1:
+        return [_run_block(kernel, s, m, args) for s, m in zip(seqs, sizes)]
+    # Contiguous runs of blocks per task keep pickling overhead low
+    chunk = max(1, len(sizes) // (4 * n_workers))
+    try:
+        results = get_pool(n_workers).map(_run_block, [kernel] * len(sizes), seqs, sizes, [args] * len(sizes),
+                                          chunksize=chunk)
+        return list(results)
+    except BrokenProcessPool:
+        # A worker died (killed, out of memory): drop the pool and finish inline,
+        # which gives the same results
+        shutdown_pool()
+        return [_run_block(kernel, s, m, args) for s, m in zip(seqs, sizes)]
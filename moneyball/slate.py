@@ -0,0 +1,346 @@
+# Moneyball Phil — Slate pricers
+# -----------------------------------------------------
+# One pricer per app module. Each takes a chunk of input rows (dicts keyed
+# by the same fields the module's form collects) and returns flat result
+# rows: one per priced market, with True %, implied %, EV and tier.
+# ROW_PRICERS keeps them grouped by input row.
+#
+# EV follows each module's own definition: edge in pp for the prop
+# modules, ROI per $1 (in %) for Soccer.
+
+import math
+from typing import Callable, Dict, Iterable, List
+
+import numpy as np
+
+from . import ats, mlb, nba, nfl, pitcher, soccer
+from .odds import american_to_prob, implied_prob, parse_american, parse_odds
+from .kernels import (
+    get_tier_prob, ev_tier_label, logistic_prob,
+    BALLPARK_IP_ADJ, expected_bf, expected_innings, er_lambda, parse_pct,
+    estimate_pK,
+    soccer_lambdas, roi_per_dollar, tier_from_true,
+    SOCCER_MARKETS,
+)
+
+SPORTS = ("MLB", "NFL", "NBA", "NCAA Football", "NCAA Basketball")
+OUTPUT_FIELDS = ["module", "event", "market", "odds", "true_pct", "implied_pct", "ev", "tier", "error"]
+
+
+# ---------------------------
+# Field helpers
+# ---------------------------
+def _text(row: dict, key: str, default: str = "") -> str:
+    v = row.get(key)
+    return default if v is None else str(v).strip()
+
+
+def _num(row: dict, key: str, default: float = 0.0) -> float:
+    s = _text(row, key)
+    return default if s == "" else float(s)
+
+
+def _odds(row: dict, key: str) -> float:
+    # Blank odds price as "no odds" (0), like the NFL number inputs
+    s = _text(row, key)
+    return 0.0 if s == "" else parse_american(s)
+
+
+def _result(module: str, event: str, market: str, odds, true_pct, implied_pct, ev, tier) -> dict:
+    r2 = lambda x: None if x is None else round(float(x), 2)
+    return {"module": module, "event": event, "market": market, "odds": odds,
+            "true_pct": r2(true_pct), "implied_pct": r2(implied_pct), "ev": r2(ev), "tier": tier}
+
+
+def _error(module: str, row: dict, event_key: str, exc: Exception) -> dict:
+    return {"module": module, "event": _text(row, event_key), "error": f"{type(exc).__name__}: {exc}"}
+
+
+def _vectorized(module: str, event_key: str, parse_row, price_parsed) -> Callable[[List[dict]], List[List[dict]]]:
+    """
+    Chunk pricer for the array engines: rows are parsed one by one (bad rows
+    become error rows), then every good row is priced in a single call.
+    ``price_parsed`` gets the parsed rows and returns one result list per row;
+    the chunk pricer returns them the same way, in input order.
+    """
+    def price_chunk(rows: List[dict]) -> List[List[dict]]:
+        per_row: List[List[dict]] = [[] for _ in rows]
+        ok, parsed = [], []
+        for i, row in enumerate(rows):
+            try:
+                parsed.append(parse_row(row))
+                ok.append(i)
+            except Exception as e:
+                per_row[i] = [_error(module, row, event_key, e)]
+        if parsed:
+            for i, results in zip(ok, price_parsed(parsed)):
+                per_row[i] = results
+        return per_row
+    return price_chunk
+
+
+def _flat(price_chunk: Callable[[List[dict]], List[List[dict]]]) -> Callable[[List[dict]], List[dict]]:
+    return lambda rows: [r for rs in price_chunk(rows) for r in rs]
+
+
+# ---------------------------
+# NFL Props
+# ---------------------------
+_NFL_GROUPS = {"qb": "QB", "quarterback": "QB", "wr": "WR", "wide receiver": "WR",
+               "rb": "RB", "running back": "RB"}
+_NFL_YDS_LABEL = {"QB": "Pass Yds", "WR": "Rec Yds", "RB": "Rush Yds"}
+# Markets per group, as column indexes into the (over std, under std, over alt, over 2nd, under 2nd) grid
+_NFL_MARKETS = {"QB": (0, 2, 4), "WR": (0, 1, 2, 3, 4), "RB": (0, 1, 2, 3, 4)}
+_NFL_ODDS_KEYS = ("over_std", "under_std", "alt_odds", "rec_over_odds", "rec_under_odds")
+
+
+def _nfl_fields(row: dict):
+    position = _text(row, "position")
+    if position.lower() not in _NFL_GROUPS:
+        raise ValueError(f"unknown position '{position}' (QB/WR/RB)")
+    group = _NFL_GROUPS[position.lower()]
+    if group == "QB":
+        second = (_num(row, "tds"), _num(row, "def_tds"), _num(row, "td_line", 1.5))
+        odds_keys = _NFL_ODDS_KEYS[:4] + ("td_under_odds",)
+    else:
+        second = (_num(row, "rpg"), _num(row, "def_rec"), _num(row, "rec_line"))
+        odds_keys = _NFL_ODDS_KEYS
+    return (group, _text(row, "player"), _num(row, "ypg"), _num(row, "def_yds"),
+            _num(row, "std_line"), _num(row, "alt_line")) + second + (tuple(_odds(row, k) for k in odds_keys),)
+
+
+def _nfl_labels(group: str, std_line: float, alt_line: float, second_line: float):
+    yds = _NFL_YDS_LABEL[group]
+    second = "Pass TDs" if group == "QB" else "Receptions"
+    return (f"Over {std_line} {yds}", f"Under {std_line} {yds}", f"Over {alt_line} Alt {yds}",
+            f"Over {second_line} {second}", f"Under {second_line} {second}")
+
+
+def _price_nfl(fields: list) -> List[List[dict]]:
+    group, name, ypg, def_yds, std_line, alt_line, per_game, def_per_game, second_line, odds = \
+        (np.asarray(c) for c in zip(*fields))
+    _, adj_ypg, adj_2nd = nfl.project(group, ypg, per_game, def_yds, def_per_game)
+    over_std = logistic_prob(adj_ypg, std_line)
+    over_2nd = logistic_prob(adj_2nd, second_line,
+                             scale=np.where(group == "QB", nfl.TDS_SCALE, nfl.RECEPTIONS_SCALE))
+    probs = np.column_stack([over_std, np.round(100 - over_std, 2), logistic_prob(adj_ypg, alt_line),
+                             over_2nd, np.round(100 - over_2nd, 2)])
+    odds = odds.astype(float)
+    implied = implied_prob(odds) * 100
+    ev = np.round(probs - implied, 2)
+    out = []
+    for k, g in enumerate(group):
+        labels = _nfl_labels(g, std_line[k], alt_line[k], second_line[k])
+        out.append([_result("nfl", name[k], labels[j], odds[k, j], probs[k, j], implied[k, j],
+                            ev[k, j], get_tier_prob(probs[k, j]))
+                    for j in _NFL_MARKETS[g]])
+    return out
+
+
+# ---------------------------
+# ATS & Totals
+# ---------------------------
+_ATS_NUMERIC = ["home_pf", "home_pa", "away_pf", "away_pa", "spread_line_home", "total_line"]
+_ATS_ODDS = ["spread_odds_home", "spread_odds_away", "over_odds", "under_odds", "ml_home", "ml_away"]
+
+
+def _ats_fields(row: dict) -> dict:
+    sport = _text(row, "sport")
+    if sport not in SPORTS:
+        raise ValueError(f"unknown sport '{sport}' ({', '.join(SPORTS)})")
+    fields = {"sport": sport, "home": _text(row, "home"), "away": _text(row, "away"),
+              "auto_volatility": _text(row, "auto_volatility", "true").lower() in ("1", "true", "yes", "y", "")}
+    fields.update({k: _num(row, k) for k in _ATS_NUMERIC})
+    fields.update({k: _num(row, k, -110.0) for k in _ATS_ODDS})
+    fields.update({k: _num(row, k) for names in ats.ADJUSTMENTS.values() for k in names})
+    return fields
+
+
+def _price_ats(fields: List[dict]) -> List[List[dict]]:
+    res = ats.evaluate_games({k: [f[k] for f in fields] for k in fields[0]})
+    out = []
+    for k in range(len(fields)):
+        event = f"{res.away[k]} @ {res.home[k]}"
+        out.append([_result("ats", event, res.bet_type[k, j], res.odds[k, j], res.true_pct[k, j],
+                            res.implied_pct[k, j], res.ev_pct[k, j], ev_tier_label(res.ev_pct[k, j]))
+                    for j in range(res.bet_type.shape[1])])
+    return out
+
+
+# ---------------------------
+# MLB Hit Simulator
+# ---------------------------
+def _mlb_fields(row: dict) -> dict:
+    fields = {k: _num(row, k) for k in mlb.LINEUP_COLUMNS}
+    fields.update(name=_text(row, "player", "Player"), order=int(_num(row, "batting_order", 5)),
+                  odds=parse_american(_text(row, "odds")))
+    return fields
+
+
+def _price_mlb(fields: List[dict]) -> List[List[dict]]:
+    res = mlb.price_hitters([f["name"] for f in fields], *([f[k] for f in fields] for k in mlb.LINEUP_COLUMNS),
+                            [f["odds"] for f in fields], [f["order"] for f in fields])
+    return [[_result("mlb", f["name"], "1+ Hit", f["odds"], res.true_prob[k] * 100, res.implied_prob[k] * 100,
+                     res.ev[k], res.zone[k])] for k, f in enumerate(fields)]
+
+
+# ---------------------------
+# Pitcher ER & K
+# ---------------------------
+def _pitcher_er_fields(row: dict) -> dict:
+    expected_ip = expected_innings(_num(row, "total_ip"), int(_num(row, "games_started", 15)), _text(row, "last3_ip"),
+                                   BALLPARK_IP_ADJ[_text(row, "ballpark", "Neutral") or "Neutral"])
+    _, lam_er = er_lambda(_num(row, "era"), _num(row, "xera"), _num(row, "opp_ops"), _num(row, "league_ops"),
+                          expected_ip)
+    er_line = _num(row, "er_line", 2.5)
+    if er_line < 0:
+        raise ValueError("er_line must be ≥ 0")
+    over = _text(row, "over_odds")
+    return {"name": _text(row, "pitcher", "Pitcher"), "lam_er": lam_er, "er_line": er_line,
+            "under_odds": parse_american(_text(row, "under_odds")),
+            "over_odds": parse_american(over) if over else None}
+
+
+def _price_pitcher_er(fields: List[dict]) -> List[List[dict]]:
+    res = pitcher.er_ladder([f["lam_er"] for f in fields], [[f["er_line"]] for f in fields])
+    out = []
+    for k, f in enumerate(fields):
+        plays = [("U", res.under_pct[k, 0], f["under_odds"])]
+        if f["over_odds"] is not None:
+            plays.append(("O", res.over_pct[k, 0], f["over_odds"]))
+        results = []
+        for side, prob, odds in plays:
+            true_prob = round(float(prob), 2)
+            implied = american_to_prob(odds) * 100
+            results.append(_result("pitcher_er", f["name"], f"{side}{f['er_line']:g} ER", odds, true_prob, implied,
+                                   round(true_prob - implied, 2), get_tier_prob(true_prob)))
+        out.append(results)
+    return out
+
+
+def _pitcher_k_fields(row: dict) -> dict:
+    expected_ip = expected_innings(_num(row, "total_ip"), int(_num(row, "games_started", 17)), _text(row, "last3_ip"))
+    pK = estimate_pK(parse_pct(_text(row, "k_pct")), parse_pct(_text(row, "opp_k_pct")),
+                     _num(row, "park", 1.0), _num(row, "ump", 1.0), _num(row, "recent", 1.0))
+    k_line = _num(row, "k_line")
+    if k_line < 0:
+        raise ValueError("k_line must be ≥ 0")
+    return {"name": _text(row, "pitcher", "Pitcher"), "expected_ip": expected_ip, "n_bf": expected_bf(expected_ip),
+            "pK": pK, "k_line": k_line,
+            "odds": [parse_american(_text(row, key)) for key in ("odds_over", "odds_under")]}
+
+
+def _price_pitcher_k(fields: List[dict]) -> List[List[dict]]:
+    res = pitcher.k_ladder([f["n_bf"] for f in fields], [f["pK"] for f in fields], [[f["k_line"]] for f in fields])
+    out = []
+    for k, f in enumerate(fields):
+        results = []
+        for side, prob, odds in [("O", res.over_pct[k, 0], f["odds"][0]), ("U", res.under_pct[k, 0], f["odds"][1])]:
+            implied = american_to_prob(odds) * 100
+            results.append(_result("pitcher_k", f["name"], f"{side}{f['k_line']} K", odds, prob, implied,
+                                   round(float(prob) - implied, 2), get_tier_prob(float(prob))))
+        out.append(results)
+    return out
+
+
+# ---------------------------
+# NBA Simulator
+# ---------------------------
+def _nba_fields(row: dict) -> dict:
+    fields = {"player": _text(row, "player", "Player"), "stat_type": _text(row, "stat_type", "PRA") or "PRA",
+              "lm_profile": _text(row, "lm_profile", "None") or "None"}
+    for key, default in nba.ROSTER_COLUMNS.items():
+        if key in fields:
+            continue
+        fields[key] = _text(row, key) if isinstance(default, str) else type(default)(_num(row, key, default))
+    return fields
+
+
+def _price_nba(fields: List[dict]) -> List[List[dict]]:
+    col = lambda key: [f[key] for f in fields]
+    res = nba.price_players(col("player"), *(col(key) for key in nba.ROSTER_COLUMNS))
+    out = []
+    for k, f in enumerate(fields):
+        kind = "Points" if f["stat_type"] == "Points Only" else "PRA"
+        line, alt_line = f["line"], f["alt_line"]
+        plays = [(f"Over {line:g} {kind}", res.over_prob[k], res.implied_over[k], "odds_over"),
+                 (f"Under {line:g} {kind}", 1.0 - res.over_prob[k], res.implied_under[k], "odds_under")]
+        if alt_line > 0:
+            plays.append((f"Over {alt_line:g} {kind} (Alt)", res.alt_prob[k], res.implied_alt[k], "alt_odds"))
+        results = []
+        for market, prob, implied, key in plays:
+            implied = None if np.isnan(implied) else float(implied)
+            ev = None if implied is None else (prob - implied) * 100.0
+            results.append(_result("nba", f["player"], market, f[key] or None, prob * 100,
+                                   None if implied is None else implied * 100, ev, res.matchup[k]))
+        out.append(results)
+    return out
+
+
+# ---------------------------
+# Soccer EV
+# ---------------------------
+_SOCCER_LABELS = {"O1.5": "Over 1.5", "O2.5": "Over 2.5", "BTTS": "BTTS"}
+_SOCCER_ODDS_KEYS = {"O1.5": "odds_o15", "O2.5": "odds_o25", "BTTS": "odds_btts"}
+
+
+def _soccer_fields(row: dict) -> dict:
+    def per_match(total_key, games_key):
+        games = _num(row, games_key)
+        if games <= 0:
+            raise ValueError(f"{games_key} must be > 0")
+        return _num(row, total_key) / games
+
+    lam_h, lam_a = soccer_lambdas(per_match("home_xg_total", "home_matches"), per_match("away_xga_total", "away_matches"),
+                                  per_match("away_xg_total", "away_matches"), per_match("home_xga_total", "home_matches"))
+    for name, lam in (("λ_home", lam_h), ("λ_away", lam_a)):
+        if not math.isfinite(lam):
+            raise ValueError(f"{name} is not finite. Check your inputs.")
+        if lam < 0:
+            raise ValueError(f"{name} is negative. xG/xGA must be ≥ 0.")
+    rho = _num(row, "rho", 0.0)
+    soccer.goal_matrix(lam_h, lam_a, rho)     # rejects a ρ outside this fixture's valid range (cached)
+    odds = {}
+    for key in SOCCER_MARKETS:
+        odds_str = _text(row, _SOCCER_ODDS_KEYS[key])
+        odds[key] = (odds_str,) + parse_odds(odds_str)
+    return {"label": f"{_text(row, 'home_team')} vs {_text(row, 'away_team')}",
+            "lam_home": lam_h, "lam_away": lam_a, "rho": rho, "odds": odds}
+
+
+def _price_soccer(fields: List[dict]) -> List[List[dict]]:
+    res = soccer.evaluate_fixtures([f["lam_home"] for f in fields], [f["lam_away"] for f in fields],
+                                   rho=[f["rho"] for f in fields])
+    out = []
+    for k, f in enumerate(fields):
+        results = []
+        for key in SOCCER_MARKETS:
+            p = float(res.probs[key][k])
+            odds_str, imp, dec = f["odds"][key]
+            name, badge = tier_from_true(p, key)
+            results.append(_result("soccer", f["label"], _SOCCER_LABELS[key], odds_str, p * 100, imp * 100,
+                                   roi_per_dollar(p, dec) * 100, f"{name} {badge}"))
+        out.append(results)
+    return out
+
+
+# ---------------------------
+# Registry
+# ---------------------------
+# Per-row results (one list per input row), for callers that join results
+# back to their inputs (the backtest replay); PRICERS returns them flat
+ROW_PRICERS: Dict[str, Callable[[List[dict]], List[List[dict]]]] = {
+    "nba": _vectorized("nba", "player", _nba_fields, _price_nba),
+    "pitcher_er": _vectorized("pitcher_er", "pitcher", _pitcher_er_fields, _price_pitcher_er),
+    "nfl": _vectorized("nfl", "player", _nfl_fields, _price_nfl),
+    "ats": _vectorized("ats", "home", _ats_fields, _price_ats),
+    "mlb": _vectorized("mlb", "player", _mlb_fields, _price_mlb),
+    "pitcher_k": _vectorized("pitcher_k", "pitcher", _pitcher_k_fields, _price_pitcher_k),
+    "soccer": _vectorized("soccer", "home_team", _soccer_fields, _price_soccer),
+}
+PRICERS: Dict[str, Callable[[List[dict]], List[dict]]] = {m: _flat(f) for m, f in ROW_PRICERS.items()}
+
+
+def price_rows(module: str, rows: Iterable[dict]) -> List[dict]:
+    """Price a (small) iterable of input rows for one module."""
+    return PRICERS[module](list(rows))
@@ -0,0 +1,188 @@
+# Moneyball Phil — Batch soccer goal model
+# -----------------------------------------------------
+# Prices O1.5 / O2.5 / BTTS for a whole matchday (or season) at once:
+# one (fixtures × goals × goals) probability tensor built from the
+# per-fixture Poisson PMFs, then each market is a masked sum over the
+# last two axes.
+#
+#   T = goal_tensor(lam_home, lam_away)
+#   probs = market_probs(T)          # {"O1.5": (n,), "O2.5": (n,), "BTTS": (n,)}
+#
+# compute_matches() returns the same (probs, odds_parsed, (λh, λa)) tuple
+# per fixture that soccer_app's compute_match does.
+#
+# Every entry point takes an optional Dixon-Coles ρ: independent Poissons
+# misprice the 0-0 / 1-0 / 0-1 / 1-1 cells, and ρ (typically -0.05 to
+# -0.15) scales those four by
+#
+#   τ(0,0) = 1 − λh·λa·ρ    τ(0,1) = 1 + λh·ρ    τ(1,0) = 1 + λa·ρ    τ(1,1) = 1 − ρ
+#
+# ρ = 0 is the plain Poisson model. goal_matrix() prices one fixture and
+# memoizes its normalized matrix in a bounded LRU keyed by (λh, λa, ρ)
+# rounded to MATRIX_QUANTUM, so the same match priced again — another
+# session, another rerun — is a dictionary lookup.
+
+import functools
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .kernels import SOCCER_MARKETS, poisson_pmf_vector, roi_per_dollar, soccer_lambdas, tier_from_true
+from .odds import parse_odds
+
+MAX_GOALS = 10
+LAMBDA_CAP = 4.0
+MATRIX_QUANTUM = 1e-4       # cache key resolution for λ and ρ
+MATRIX_CACHE_SIZE = 4096    # matrices kept (≈1 KiB each at MAX_GOALS = 10)
+
+
+class SoccerSlate(NamedTuple):
+    labels: np.ndarray                # (n,) "Home vs Away"
+    lam_home: np.ndarray              # (n,)
+    lam_away: np.ndarray              # (n,)
+    probs: Dict[str, np.ndarray]      # market → (n,) true probability
+
+    def to_frame(self):
+        """One row per fixture-market pair, like the Saved Matches table."""
+        import pandas as pd
+        n = len(self.labels)
+        return pd.DataFrame({
+            "Match": np.repeat(self.labels, len(SOCCER_MARKETS)),
+            "λ Home": np.repeat(np.round(self.lam_home, 2), len(SOCCER_MARKETS)),
+            "λ Away": np.repeat(np.round(self.lam_away, 2), len(SOCCER_MARKETS)),
+            "Market": np.tile(SOCCER_MARKETS, n),
+            "True %": np.round(np.column_stack([self.probs[k] for k in SOCCER_MARKETS]).ravel() * 100, 2),
+        })
+
+
+def _check_lambdas(name: str, lam: np.ndarray):
+    bad = np.flatnonzero(~np.isfinite(lam))
+    if bad.size:
+        raise ValueError(f"{name} is not finite for fixture {bad[0]}. Check your inputs.")
+    bad = np.flatnonzero(lam < 0)
+    if bad.size:
+        raise ValueError(f"{name} is negative for fixture {bad[0]}. xG/xGA must be ≥ 0.")
+
+
+def _check_rho(rho: np.ndarray, lam_home: np.ndarray, lam_away: np.ndarray):
+    # τ must stay ≥ 0 on all four corrected cells
+    lo = np.maximum(-1.0 / np.maximum(lam_home, 1e-12), -1.0 / np.maximum(lam_away, 1e-12))
+    hi = np.minimum(1.0 / np.maximum(lam_home * lam_away, 1e-12), 1.0)
+    bad = np.flatnonzero(~np.isfinite(rho) | (rho < lo) | (rho > hi))
+    if bad.size:
+        k = bad[0]
+        raise ValueError(f"ρ = {rho[k]:g} is outside [{lo[k]:.3f}, {hi[k]:.3f}] for fixture {k} "
+                         f"(λ_home={lam_home[k]:.2f}, λ_away={lam_away[k]:.2f}).")
+
+
+def goal_tensor(lam_home, lam_away, max_goals: int = MAX_GOALS, rho=0.0) -> np.ndarray:
+    """
+    Batch safe_goal_matrix: (n, max_goals+1, max_goals+1) joint score
+    probabilities, each fixture's matrix normalized to sum to 1. ``rho``
+    (scalar or per fixture) applies the Dixon-Coles low-score correction.
+    """
+    lam_home, lam_away, rho = np.broadcast_arrays(np.atleast_1d(np.asarray(lam_home, dtype=float)),
+                                                  np.atleast_1d(np.asarray(lam_away, dtype=float)),
+                                                  np.atleast_1d(np.asarray(rho, dtype=float)))
+    _check_lambdas("λ_home", lam_home)
+    _check_lambdas("λ_away", lam_away)
+    lam_home, lam_away = np.clip(lam_home, 0.0, LAMBDA_CAP), np.clip(lam_away, 0.0, LAMBDA_CAP)
+    h = poisson_pmf_vector(lam_home, max_goals)
+    a = poisson_pmf_vector(lam_away, max_goals)
+    T = h[:, :, None] * a[:, None, :]
+    if np.any(rho != 0.0):
+        _check_rho(rho, lam_home, lam_away)
+        T[:, 0, 0] *= 1.0 - lam_home * lam_away * rho
+        T[:, 0, 1] *= 1.0 + lam_home * rho
+        T[:, 1, 0] *= 1.0 + lam_away * rho
+        T[:, 1, 1] *= 1.0 - rho
+    return T / T.sum(axis=(1, 2), keepdims=True)
+
+
+@functools.lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def _cached_matrix(q_home: int, q_away: int, q_rho: int, max_goals: int) -> np.ndarray:
+    M = goal_tensor(q_home * MATRIX_QUANTUM, q_away * MATRIX_QUANTUM, max_goals, q_rho * MATRIX_QUANTUM)[0]
+    M.setflags(write=False)     # shared by every caller that hits the cache
+    return M
+
+
+def goal_matrix(lam_home: float, lam_away: float, rho: float = 0.0, max_goals: int = MAX_GOALS) -> np.ndarray:
+    """
+    One fixture's normalized (max_goals+1)² score matrix, memoized on
+    (λh, λa, ρ) rounded to MATRIX_QUANTUM. The array is read-only.
+    """
+    lam = np.array([lam_home, lam_away], dtype=float)
+    _check_lambdas("λ", lam)
+    lam = np.clip(lam, 0.0, LAMBDA_CAP)
+    q_home, q_away = (int(round(x / MATRIX_QUANTUM)) for x in lam)
+    return _cached_matrix(q_home, q_away, int(round(float(rho) / MATRIX_QUANTUM)), int(max_goals))
+
+
+def matrix_cache_info():
+    """functools hit / miss / size counters for goal_matrix()."""
+    return _cached_matrix.cache_info()
+
+
+def market_masks(max_goals: int = MAX_GOALS) -> Dict[str, np.ndarray]:
+    """Boolean (home goals × away goals) masks for each market."""
+    i, j = np.indices((max_goals + 1, max_goals + 1))
+    return {"O1.5": i + j >= 2, "O2.5": i + j >= 3, "BTTS": (i >= 1) & (j >= 1)}
+
+
+def market_probs(T: np.ndarray) -> Dict[str, np.ndarray]:
+    """Batch market_probs_from_matrix: market → (n,) probabilities."""
+    masks = market_masks(T.shape[-1] - 1)
+    return {key: T[:, masks[key]].sum(axis=1) for key in SOCCER_MARKETS}
+
+
+def evaluate_fixtures(lam_home, lam_away, labels: Optional[Sequence[str]] = None,
+                      max_goals: int = MAX_GOALS, rho=0.0) -> SoccerSlate:
+    T = goal_tensor(lam_home, lam_away, max_goals, rho)
+    n = T.shape[0]
+    labels = np.asarray([f"Match {k + 1}" for k in range(n)] if labels is None else labels, dtype=object)
+    return SoccerSlate(labels, np.broadcast_to(lam_home, n).astype(float),
+                       np.broadcast_to(lam_away, n).astype(float), market_probs(T))
+
+
+def evaluate_xg(home_xg_for, away_xga, away_xg_for, home_xga, labels: Optional[Sequence[str]] = None,
+                rho=0.0) -> SoccerSlate:
+    """Same, starting from per-match xG for / xGA against arrays."""
+    lam_h, lam_a = soccer_lambdas(*(np.asarray(x, dtype=float) for x in (home_xg_for, away_xga, away_xg_for, home_xga)))
+    return evaluate_fixtures(lam_h, lam_a, labels, rho=rho)
+
+
+def compute_matches(lam_home, lam_away, odds: Sequence[Mapping[str, str]], rho=0.0) -> List[tuple]:
+    """
+    compute_match for a list of fixtures: one (probs, odds_parsed, (λh, λa))
+    tuple per fixture. ``odds`` holds one {"O1.5": str, "O2.5": str, "BTTS": str}
+    dict per fixture (American if signed, decimal otherwise).
+    """
+    res = evaluate_fixtures(lam_home, lam_away, rho=rho)
+    out = []
+    for k, odds_dict in enumerate(odds):
+        probs = {key: float(res.probs[key][k]) for key in SOCCER_MARKETS}
+        odds_parsed = {}
+        for key in SOCCER_MARKETS:
+            imp, dec = parse_odds(odds_dict[key])
+            odds_parsed[key] = {"imp": imp, "dec": dec, "str": odds_dict[key]}
+        out.append((probs, odds_parsed, (float(res.lam_home[k]), float(res.lam_away[k]))))
+    return out
+
+
+def value_rows(res: SoccerSlate, odds: Sequence[Mapping[str, str]]) -> List[dict]:
+    """Saved-Matches style rows for every fixture-market pair; blank odds leave Implied/EV empty."""
+    rows = []
+    for k, odds_dict in enumerate(odds):
+        for key in SOCCER_MARKETS:
+            true_p = float(res.probs[key][k])
+            odds_str = str(odds_dict.get(key) or "").strip()
+            imp, dec = parse_odds(odds_str) if odds_str else (None, None)
+            tier, badge = tier_from_true(true_p, key)
+            rows.append({
+                "Match": res.labels[k], "Market": key, "Odds": odds_str,
+                "True %": round(true_p * 100, 2),
+                "Implied %": None if imp is None else round(imp * 100, 2),
+                "EV %": None if dec is None else round(roi_per_dollar(true_p, dec) * 100, 2),
+                "Tier": f"{tier} {badge}",
+            })
+    return rows
@@ -0,0 +1,235 @@
+# Moneyball Phil — Saved-play store
+# -----------------------------------------------------
+# SQLite persistence for the saved boards (NFL props, MLB hits, pitcher
+# board, NBA plays, soccer bets, global parlay legs). One table holds every
+# board: the record itself is a JSON payload, and the fields boards are
+# filtered on (date, sport, market, tier) are real indexed columns.
+#
+# Every row belongs to an owner (a workspace: one user's boards and slip).
+# Reads, clears and deletes only ever see the given owner's rows; rows
+# written before owners existed belong to DEFAULT_OWNER.
+#
+#   store = Store()                                  # $MONEYBALL_DB or ./moneyball.db
+#   key = store.add("saved_bets", bet, sport="Soccer", market="O2.5", tier="Strong", owner="ab12")
+#   store.recent("saved_bets", limit=200, owner="ab12")   # newest 200, oldest first (limit=None: all)
+#   store.query(sport="NBA", tier="Elite", since="2025-10-01", owner="ab12")
+#   store.page("player_board", sort="True Prob", numeric=True, descending=True, limit=25, offset=50, owner="ab12")
+#
+# The database runs in WAL mode so readers never block the writer. Adds are
+# buffered and written in one transaction per batch; any read, update or
+# delete flushes the buffer first, so callers always see their own writes.
+# A batch that fails to insert is retried row by row; rows that still fail
+# are logged and dropped, so one bad record never blocks later writes.
+
+import datetime
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from typing import List, Optional, Sequence
+
+DEFAULT_PATH = "moneyball.db"
+DEFAULT_LIMIT = 200
+PAGE_SIZE = 25
+BATCH_SIZE = 64
+DEFAULT_OWNER = "default"
+
+BOARDS = ("nfl_all_props", "saved_players", "player_board", "nba_saved_plays", "saved_bets", "global_parlay")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saved (
+    key        TEXT PRIMARY KEY,
+    board      TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    date       TEXT NOT NULL,
+    sport      TEXT,
+    market     TEXT,
+    tier       TEXT,
+    payload    TEXT NOT NULL,
+    owner      TEXT NOT NULL DEFAULT 'default'
+);
+CREATE INDEX IF NOT EXISTS idx_saved_date ON saved (date);
+CREATE INDEX IF NOT EXISTS idx_saved_sport ON saved (sport);
+CREATE INDEX IF NOT EXISTS idx_saved_market ON saved (market);
+CREATE INDEX IF NOT EXISTS idx_saved_tier ON saved (tier);
+"""
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_saved_board_created ON saved (board, created_at);
+CREATE INDEX IF NOT EXISTS idx_saved_owner_board_created ON saved (owner, board, created_at);
+"""
+_COLUMNS = "key, board, created_at, date, sport, market, tier, payload, owner"
+_INSERT = f"INSERT INTO saved ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+log = logging.getLogger(__name__)
+
+
+class Store:
+    """
+    Thread-safe handle on the saved-play database. One instance can be
+    shared by every Streamlit session in the process.
+
+    Records come back as the dicts that were saved, plus a "_key" entry
+    (the store's id for the row) used by update() and delete().
+    """
+
+    def __init__(self, path: Optional[str] = None, batch_size: int = BATCH_SIZE):
+        self.path = path or os.environ.get("MONEYBALL_DB") or DEFAULT_PATH
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        self._pending: List[tuple] = []
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # Databases from before owners existed: their rows go to DEFAULT_OWNER
+        if "owner" not in {row[1] for row in self._conn.execute("PRAGMA table_info(saved)")}:
+            self._conn.execute(f"ALTER TABLE saved ADD COLUMN owner TEXT NOT NULL DEFAULT '{DEFAULT_OWNER}'")
+        self._conn.executescript(_INDEXES)
+
+    # ---------------- Writes ----------------
+    def add(self, board: str, record: dict, sport: Optional[str] = None, market: Optional[str] = None,
+            tier: Optional[str] = None, owner: str = DEFAULT_OWNER) -> str:
+        """Queue a record; it is written with the next batch. Returns its key."""
+        key = uuid.uuid4().hex
+        now = datetime.datetime.now()
+        payload = json.dumps({k: v for k, v in record.items() if k != "_key"}, default=str, ensure_ascii=False)
+        with self._lock:
+            self._pending.append((key, board, now.isoformat(timespec="microseconds"), now.date().isoformat(),
+                                  sport, market, tier, payload, owner))
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+        return key
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        try:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(_INSERT, batch)
+        except sqlite3.Error:
+            # The transaction rolled back: keep every row that inserts on its own
+            for row in batch:
+                try:
+                    self._conn.execute(_INSERT, row)
+                except sqlite3.Error as e:
+                    log.error("dropping saved record %s on board %r: %s", row[0], row[1], e)
+
+    def update(self, key: str, record: dict, owner: Optional[str] = DEFAULT_OWNER):
+        """Replace a record's payload; only the owner's row matches (owner=None: any owner's)."""
+        payload = json.dumps({k: v for k, v in record.items() if k != "_key"}, default=str, ensure_ascii=False)
+        with self._lock:
+            self._flush()
+            if owner is None:
+                self._conn.execute("UPDATE saved SET payload = ? WHERE key = ?", (payload, key))
+            else:
+                self._conn.execute("UPDATE saved SET payload = ? WHERE key = ? AND owner = ?", (payload, key, owner))
+
+    def delete(self, keys: Sequence[str], owner: str = DEFAULT_OWNER):
+        with self._lock:
+            self._flush()
+            self._conn.executemany("DELETE FROM saved WHERE key = ? AND owner = ?", [(k, owner) for k in keys])
+
+    def clear(self, board: str, owner: str = DEFAULT_OWNER):
+        with self._lock:
+            self._flush()
+            self._conn.execute("DELETE FROM saved WHERE owner = ? AND board = ?", (owner, board))
+
+    # ---------------- Reads ----------------
+    def _select(self, sql: str, args: Sequence) -> List[dict]:
+        with self._lock:
+            self._flush()
+            rows = self._conn.execute(sql, args).fetchall()
+        return [dict(json.loads(payload), _key=key) for key, payload in rows]
+
+    def recent(self, board: str, limit: Optional[int] = DEFAULT_LIMIT, owner: str = DEFAULT_OWNER) -> List[dict]:
+        """The newest ``limit`` records of a board (None: all of them), oldest first (save order)."""
+        rows = self._select("SELECT key, payload FROM saved WHERE owner = ? AND board = ? "
+                            "ORDER BY created_at DESC, rowid DESC LIMIT ?",
+                            (owner, board, -1 if limit is None else int(limit)))
+        return rows[::-1]
+
+    @staticmethod
+    def _board_where(board: str, search: Optional[str], owner: str):
+        sql, args = "owner = ? AND board = ?", [owner, board]
+        if search:
+            # Substring match on the record's values (not its keys or JSON
+            # syntax), case-insensitive for ASCII
+            escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql += (" AND EXISTS (SELECT 1 FROM json_tree(saved.payload) AS j"
+                    " WHERE j.atom IS NOT NULL AND CAST(j.atom AS TEXT) LIKE ? ESCAPE '\\')")
+            args.append(f"%{escaped}%")
+        return sql, args
+
+    def count(self, board: str, search: Optional[str] = None, owner: str = DEFAULT_OWNER) -> int:
+        where, args = self._board_where(board, search, owner)
+        with self._lock:
+            self._flush()
+            return self._conn.execute(f"SELECT COUNT(*) FROM saved WHERE {where}", args).fetchone()[0]
+
+    def page(self, board: str, sort: Optional[str] = None, numeric: bool = False, descending: bool = False,
+             search: Optional[str] = None, limit: int = PAGE_SIZE, offset: int = 0,
+             owner: str = DEFAULT_OWNER) -> List[dict]:
+        """
+        One page of a board, sorted and filtered in SQLite. ``sort`` names a
+        record field (None = save order); ``numeric`` sorts it as a number,
+        ignoring a trailing "%". ``search`` keeps records containing the text.
+        """
+        where, args = self._board_where(board, search, owner)
+        direction = "DESC" if descending else "ASC"
+        if sort is None:
+            order = f"created_at {direction}, rowid {direction}"
+        else:
+            expr = "json_extract(payload, ?)"
+            if numeric:
+                expr = f"CAST(REPLACE({expr}, '%', '') AS REAL)"
+            order = f"{expr} {direction}, created_at, rowid"
+            args.append('$."' + sort.replace('"', '""') + '"')
+        return self._select(f"SELECT key, payload FROM saved WHERE {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                            args + [int(limit), int(offset)])
+
+    def query(self, board: Optional[str] = None, sport: Optional[str] = None, market: Optional[str] = None,
+              tier: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None,
+              limit: Optional[int] = None, owner: Optional[str] = DEFAULT_OWNER) -> List[dict]:
+        """
+        Records matching every given filter (dates are inclusive YYYY-MM-DD),
+        oldest first. ``owner=None`` reads every owner's rows.
+        """
+        where, args = [], []
+        for col, val in (("owner", owner), ("board", board), ("sport", sport), ("market", market), ("tier", tier)):
+            if val is not None:
+                where.append(f"{col} = ?")
+                args.append(val)
+        if since is not None:
+            where.append("date >= ?")
+            args.append(since)
+        if until is not None:
+            where.append("date <= ?")
+            args.append(until)
+        sql = "SELECT key, payload FROM saved"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_at, rowid"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self._select(sql, args)
+
+    def lacking(self, board: str, field: str, owner: Optional[str] = None) -> List[dict]:
+        """Records of a board whose payload has no ``field`` key, for every owner by default (migrations)."""
+        sql, args = "board = ? AND json_type(payload, ?) IS NULL", [board, '$."' + field.replace('"', '""') + '"']
+        if owner is not None:
+            sql += " AND owner = ?"
+            args.append(owner)
+        return self._select(f"SELECT key, payload FROM saved WHERE {sql} ORDER BY created_at, rowid", args)
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._conn.close()
@@ -0,0 +1,17 @@
+# Moneyball Phil — Streamlit pages
+# -----------------------------------------------------
+# One module per sidebar page. Unlike the moneyball package these import
+# Streamlit; moneyball_all_in_one.py imports each one only when its page
+# is first selected, and pandas is imported where a table is drawn.
+#
+#   moneyball_app.nfl            – NFL Prop Simulator
+#   moneyball_app.ats            – ATS & Totals
+#   moneyball_app.mlb            – MLB Hit Simulator
+#   moneyball_app.pitcher        – Pitcher ER & K
+#   moneyball_app.nba            – NBA Simulator
+#   moneyball_app.soccer         – Soccer EV
+#   moneyball_app.global_parlay  – Global Parlay Builder (add_to_global_parlay)
+#   moneyball_app.backtest       – Backtest (ROI, Brier score and calibration over recorded history)
+#   moneyball_app.boards         – saved boards, read lazily from moneyball.store
+#   moneyball_app.odds_feed      – sidebar snapshot import and per-page "Fill from feed" pickers
+#   moneyball_app.profiling      – opt-in rerun spans, sidebar panel and JSONL trace
@@ -0,0 +1,303 @@
+# Moneyball Phil — ATS & Totals page
+# -----------------------------------------------------
+
+import streamlit as st
+
+from moneyball import ats as ats_engine, parlay as parlay_engine
+from moneyball.kernels import (
+    calculate_ev_pct, ev_tier_label,
+)
+
+from . import odds_feed, profiling
+from .global_parlay import add_to_global_parlay
+
+
+# =====================================================
+# ============ MODULE: ATS & Totals (v3.5) ============
+# (Restored projections + tier color labels + adj fix)
+# =====================================================
+def ats_totals_app():
+    st.header("📊 Moneyball Phil — ATS & Totals (v3.5)")
+
+    # ----------------- State -----------------
+    def init_state():
+        defaults = {
+            "home": "", "away": "",
+            "home_pf": 0.0, "home_pa": 0.0,
+            "away_pf": 0.0, "away_pa": 0.0,
+            "spread_line_home": 0.0,
+            "spread_odds_home": -110.0, "spread_odds_away": -110.0,
+            "total_line": 0.0,
+            "over_odds": -110.0, "under_odds": -110.0,
+            "ml_home": -110.0, "ml_away": -110.0,  # 🆕 Moneyline odds
+            "stake": 0.0,
+            "results_df": None,
+        }
+        for k,v in defaults.items():
+            if k not in st.session_state:
+                st.session_state[k] = v
+    init_state()
+
+    def fill_from_feed(event: str):
+        home, _, away = event.partition(" vs ")
+        values = {"home": home.strip(), "away": away.strip()}
+        spread = odds_feed.price(event, "spread_home")
+        if spread is not None and spread.line is not None:
+            values.update(spread_line_home=spread.line, spread_odds_home=float(odds_feed.american_text(spread)))
+            other = odds_feed.price(event, "spread_away", -spread.line)
+            if other is not None:
+                values["spread_odds_away"] = float(odds_feed.american_text(other))
+        over = odds_feed.price(event, "total_over")
+        if over is not None and over.line is not None:
+            values.update(total_line=over.line, over_odds=float(odds_feed.american_text(over)))
+            under = odds_feed.price(event, "total_under", over.line)
+            if under is not None:
+                values["under_odds"] = float(odds_feed.american_text(under))
+        for market in ("ml_home", "ml_away"):
+            q = odds_feed.price(event, market)
+            if q is not None:
+                values[market] = float(odds_feed.american_text(q))
+        return values if len(values) > 2 else {}
+
+    # ----------------- UI -----------------
+    profiling.section("inputs")
+    sport = st.selectbox("Select Sport", ["MLB", "NFL", "NBA", "NCAA Football", "NCAA Basketball"])
+    odds_feed.feed_picker("ats", ats_engine.FEED_MARKETS, fill_from_feed)
+
+    col_inputs, col_results = st.columns([1,2])
+    with col_inputs:
+        with st.form("inputs_form_ats"):
+            n1, n2 = st.columns(2)
+            with n1: st.session_state.home = st.text_input("Home Team", value=st.session_state.home)
+            with n2: st.session_state.away = st.text_input("Away Team", value=st.session_state.away)
+
+            h_col, a_col = st.columns(2)
+            with h_col:
+                st.session_state.home_pf = st.number_input("Home: Avg Scored", step=0.01, format="%.2f", value=float(st.session_state.home_pf))
+                st.session_state.home_pa = st.number_input("Home: Avg Allowed", step=0.01, format="%.2f", value=float(st.session_state.home_pa))
+            with a_col:
+                st.session_state.away_pf = st.number_input("Away: Avg Scored", step=0.01, format="%.2f", value=float(st.session_state.away_pf))
+                st.session_state.away_pa = st.number_input("Away: Avg Allowed", step=0.01, format="%.2f", value=float(st.session_state.away_pa))
+
+            s1, s2 = st.columns(2)
+            with s1:
+                st.session_state.spread_line_home = st.number_input("Home Spread (negative if favorite)", step=0.01, format="%.2f", value=float(st.session_state.spread_line_home))
+            with s2:
+                st.caption(f"Away Spread (auto): {(-st.session_state.spread_line_home):+.2f}")
+
+            so1, so2 = st.columns(2)
+            with so1:
+                st.session_state.spread_odds_home = st.number_input("Home Spread Odds (American)", step=1.0, format="%.0f", value=float(st.session_state.spread_odds_home))
+            with so2:
+                st.session_state.spread_odds_away = st.number_input("Away Spread Odds (American)", step=1.0, format="%.0f", value=float(st.session_state.spread_odds_away))
+
+            t_row1, t_row2 = st.columns(2)
+            with t_row1:
+                st.session_state.total_line = st.number_input("Total Line", step=0.01, format="%.2f", value=float(st.session_state.total_line))
+                st.session_state.over_odds = st.number_input("Over Odds (American)", step=1.0, format="%.0f", value=float(st.session_state.over_odds))
+            with t_row2:
+                st.session_state.stake = st.number_input("Stake ($)", min_value=0.0, step=1.0, format="%.2f", value=float(st.session_state.stake))
+                st.session_state.under_odds = st.number_input("Under Odds (American)", step=1.0, format="%.0f", value=float(st.session_state.under_odds))
+
+            # 🆕 Moneyline inputs
+            ml_row1, ml_row2 = st.columns(2)
+            with ml_row1:
+                st.session_state.ml_home = st.number_input("Home ML Odds (American)", step=1.0, format="%.0f", value=float(st.session_state.ml_home))
+            with ml_row2:
+                st.session_state.ml_away = st.number_input("Away ML Odds (American)", step=1.0, format="%.0f", value=float(st.session_state.ml_away))
+
+            # ⚙️ Advanced Adjustments
+            with st.expander("⚙️ Advanced adjustments (optional)", expanded=False):
+                st.markdown("**Universal**")
+                u1, u2, u3 = st.columns(3)
+                with u1:
+                    home_edge_pts = st.number_input("Home edge (pts)", value=0.0, step=0.25, format="%.2f")
+                    form_H_pct = st.number_input("Home form (±% PF)", value=0.0, step=1.0, format="%.0f")
+                    injury_H_pct = st.number_input("Home injuries (±% PF)", value=0.0, step=1.0, format="%.0f")
+                with u2:
+                    away_edge_pts = st.number_input("Away edge (pts)", value=0.0, step=0.25, format="%.2f")
+                    form_A_pct = st.number_input("Away form (±% PF)", value=0.0, step=1.0, format="%.0f")
+                    injury_A_pct = st.number_input("Away injuries (±% PF)", value=0.0, step=1.0, format="%.0f")
+                with u3:
+                    auto_volatility = st.checkbox("Auto volatility by sport", value=True)
+                    pace_pct_global = st.number_input("Global pace (±% total)", value=0.0, step=1.0, format="%.0f")
+                    variance_pct_manual = st.number_input("Volatility tweak (±% SD)", value=0.0, step=5.0, format="%.0f")
+
+                if sport in ["NFL", "NCAA Football"]:
+                    st.markdown("**Football specifics**")
+                    f1, f2, f3 = st.columns(3)
+                    with f1:
+                        plays_pct = st.number_input("Plays/pace (±% total)", value=0.0, step=1.0, format="%.0f")
+                        to_margin_pts = st.number_input("Turnover margin (pts to Home)", value=0.0, step=0.5, format="%.2f")
+                    with f2:
+                        redzone_H_pct = st.number_input("Home red zone (±% PF)", value=0.0, step=1.0, format="%.0f")
+                    with f3:
+                        redzone_A_pct = st.number_input("Away red zone (±% PF)", value=0.0, step=1.0, format="%.0f")
+                else:
+                    plays_pct = redzone_H_pct = redzone_A_pct = to_margin_pts = 0.0
+
+                if sport in ["NBA", "NCAA Basketball"]:
+                    st.markdown("**Basketball specifics**")
+                    b1, b2, b3 = st.columns(3)
+                    with b1:
+                        pace_pct_hoops = st.number_input("Pace (±% total)", value=0.0, step=1.0, format="%.0f")
+                        rest_H_pct = st.number_input("Home rest/fatigue (±% PF)", value=0.0, step=1.0, format="%.0f")
+                    with b2:
+                        ortg_H_pct = st.number_input("Home ORtg (±% PF)", value=0.0, step=1.0, format="%.0f")
+                        rest_A_pct = st.number_input("Away rest/fatigue (±% PF)", value=0.0, step=1.0, format="%.0f")
+                    with b3:
+                        ortg_A_pct = st.number_input("Away ORtg (±% PF)", value=0.0, step=1.0, format="%.0f")
+                        drtg_H_pct = st.number_input("Home DRtg (±% opp PF)", value=0.0, step=1.0, format="%.0f")
+                    drtg_A_pct = st.number_input("Away DRtg (±% opp PF)", value=0.0, step=1.0, format="%.0f")
+                else:
+                    pace_pct_hoops = ortg_H_pct = ortg_A_pct = drtg_H_pct = drtg_A_pct = rest_H_pct = rest_A_pct = 0.0
+
+                if sport == "MLB":
+                    st.markdown("**MLB specifics**")
+                    m1, m2, m3 = st.columns(3)
+                    with m1:
+                        sp_H_runs = st.number_input("SP impact (Home, runs)", value=0.0, step=0.1, format="%.1f")
+                        bullpen_H_runs = st.number_input("Bullpen (Home, runs)", value=0.0, step=0.1, format="%.1f")
+                    with m2:
+                        sp_A_runs = st.number_input("SP impact (Away, runs)", value=0.0, step=0.1, format="%.1f")
+                        bullpen_A_runs = st.number_input("Bullpen (Away, runs)", value=0.0, step=0.1, format="%.1f")
+                    with m3:
+                        park_total_pct = st.number_input("Park factor (±% total)", value=0.0, step=1.0, format="%.0f")
+                        weather_total_pct = st.number_input("Weather (±% total)", value=0.0, step=1.0, format="%.0f")
+                else:
+                    sp_H_runs = sp_A_runs = bullpen_H_runs = bullpen_A_runs = 0.0
+                    park_total_pct = weather_total_pct = 0.0
+
+            # 🔮 Run + ♻️ Reset (keys to avoid conflicts)
+            btn1, btn2 = st.columns(2)
+            with btn1:
+                run_projection = st.form_submit_button("🔮 Run Projection", key="run_projection_btn_v35")
+            with btn2:
+                reset_inputs = st.form_submit_button("♻️ Reset Inputs", key="reset_inputs_btn_v35")
+
+            # Safe reset: only clear known inputs + results
+            if reset_inputs:
+                for key in ["home","away","home_pf","home_pa","away_pf","away_pa",
+                            "spread_line_home","spread_odds_home","spread_odds_away",
+                            "total_line","over_odds","under_odds","ml_home","ml_away",
+                            "stake","results_df"]:
+                    if key in ["home","away"]:
+                        st.session_state[key] = ""
+                    else:
+                        st.session_state[key] = 0.0 if key != "results_df" else None
+                st.success("Inputs reset.")
+                st.stop()  # stop to avoid running results on same submit
+
+    # ----------------- Results -----------------
+    profiling.section("compute")
+    with col_results:
+        if run_projection:
+            S = st.session_state
+
+            game = {
+                "home": [S.home], "away": [S.away],
+                "home_pf": [S.home_pf], "home_pa": [S.home_pa], "away_pf": [S.away_pf], "away_pa": [S.away_pa],
+                "spread_line_home": [S.spread_line_home],
+                "spread_odds_home": [S.spread_odds_home], "spread_odds_away": [S.spread_odds_away],
+                "total_line": [S.total_line], "over_odds": [S.over_odds], "under_odds": [S.under_odds],
+                "ml_home": [S.ml_home], "ml_away": [S.ml_away],
+                "auto_volatility": [auto_volatility],
+            }
+            adjustments = dict(
+                home_edge_pts=home_edge_pts, away_edge_pts=away_edge_pts,
+                form_H_pct=form_H_pct, form_A_pct=form_A_pct, injury_H_pct=injury_H_pct, injury_A_pct=injury_A_pct,
+                pace_pct_global=pace_pct_global, variance_pct_manual=variance_pct_manual,
+                plays_pct=plays_pct, to_margin_pts=to_margin_pts, redzone_H_pct=redzone_H_pct, redzone_A_pct=redzone_A_pct,
+                pace_pct_hoops=pace_pct_hoops, ortg_H_pct=ortg_H_pct, ortg_A_pct=ortg_A_pct,
+                drtg_H_pct=drtg_H_pct, drtg_A_pct=drtg_A_pct, rest_H_pct=rest_H_pct, rest_A_pct=rest_A_pct,
+                sp_H_runs=sp_H_runs, sp_A_runs=sp_A_runs, bullpen_H_runs=bullpen_H_runs, bullpen_A_runs=bullpen_A_runs,
+                park_total_pct=park_total_pct, weather_total_pct=weather_total_pct,
+            )
+            game.update({k: [v] for k, v in adjustments.items()})
+
+            # Same projection + six markets as the batch slate scorer, for one game
+            res = ats_engine.evaluate_games(game, sport)
+            home_pts, away_pts = res.home_pts[0], res.away_pts[0]
+            proj_total, proj_margin = res.proj_total[0], res.proj_margin[0]
+            inline_summaries = list(zip(res.bet_type[0], res.true_pct[0], res.implied_pct[0], res.ev_pct[0]))
+
+            df = res.results_df(formatted=False)
+            st.session_state.results_df = df
+            # Lines the six rows were priced at, for re-pricing after a feed re-import
+            st.session_state.ats_feed = (f"{S.home} vs {S.away}", odds_feed.get_odds_table().version,
+                                         [S.spread_line_home, -S.spread_line_home, S.total_line, S.total_line,
+                                          None, None])
+
+            # Projections + Inline Summaries
+            profiling.section("results")
+            st.subheader("Projected Game Outcome")
+            st.markdown(f"**Projected Home:** {home_pts:.2f} | **Projected Away:** {away_pts:.2f} | "
+                        f"**Projected Total:** {proj_total:.2f} | **Projected Margin:** {proj_margin:.2f}")
+
+            for bet, tp, ip, ev in inline_summaries:
+                st.markdown(f"🔹 **{bet} → True {tp:.2f}% | Implied {ip:.2f}% | EV {ev:.2f}% | {ev_tier_label(ev)}**")
+
+        # Results Table + Details
+        if st.session_state.get("results_df") is not None:
+            df = st.session_state.results_df
+            feed = st.session_state.get("ats_feed")
+            if feed is not None:
+                event, version, lines = feed
+                moved = set(odds_feed.changed_pairs(event, ats_engine.FEED_MARKETS, version))
+                for row, (market, line) in enumerate(zip(ats_engine.FEED_MARKETS, lines)):
+                    q = odds_feed.price(event, market, line) if market in moved else None
+                    if q is not None and row < len(df):
+                        odds = float(odds_feed.american_text(q))
+                        ev, implied = calculate_ev_pct(float(df.at[row, "True %"]), odds)
+                        df.loc[row, ["Odds", "Implied %", "EV %"]] = [odds, implied, ev]
+                if moved:
+                    st.session_state.ats_feed = (event, odds_feed.get_odds_table().version, lines)
+                    st.caption(f"📥 Re-priced from the odds feed: {', '.join(sorted(moved))}")
+            st.subheader("Bet Results")
+            pct_col = st.column_config.NumberColumn(format="%.2f%%")
+            st.dataframe(df, use_container_width=True,
+                         column_config={"True %": pct_col, "Implied %": pct_col, "EV %": pct_col})
+
+            if len(df) > 0:
+                choice = st.selectbox("Select a bet:", options=list(df["Bet Type"]))
+                selected = df[df["Bet Type"] == choice].iloc[0]
+
+                st.subheader("Bet Details")
+                true_pct, implied_pct, ev_pct = selected["True %"], selected["Implied %"], selected["EV %"]
+                st.markdown(f"Tier: {ev_tier_label(ev_pct)}")
+
+                st.progress(true_pct/100.0, text=f"True Probability: {true_pct:.2f}%")
+                st.progress(implied_pct/100.0, text=f"Implied Probability: {implied_pct:.2f}%")
+                st.progress((ev_pct+100)/200, text=f"EV%: {ev_pct:.2f}%")
+
+                colA, colB = st.columns(2)
+                with colA:
+                    if st.button("💾 Save Straight Bet"):
+                        st.success("Bet saved locally (straight bet).")
+                with colB:
+                    if st.button("🌍 Send to Parlay Slip"):
+                        # rows 0/4 are home spread/ML, 1/5 away, 2/3 the total
+                        side = list(df["Bet Type"]).index(choice) % 6
+                        team = {0: st.session_state.home, 4: st.session_state.home,
+                                1: st.session_state.away, 5: st.session_state.away}.get(side, "")
+                        add_to_global_parlay("ATS/Totals", str(selected["Bet Type"]),
+                                             float(selected["Odds"]),
+                                             true_pct/100.0,
+                                             game=parlay_engine.game_tag(st.session_state.home, st.session_state.away),
+                                             team=team)
+                        st.success("Added to Global Parlay")
+
+    # ----------------- Batch Slate -----------------
+    profiling.section("batch slate")
+    with st.expander("📂 Score a full slate (CSV)", expanded=False):
+        st.caption("One row per game with the form's fields (home, away, home_pf, home_pa, away_pf, away_pa, "
+                   "spread_line_home, total_line, odds columns, optional adjustment columns). "
+                   f"A 'sport' column overrides the selected sport ({sport}).")
+        slate_file = st.file_uploader("Slate CSV", type=["csv"], key="ats_slate_csv")
+        if slate_file is not None:
+            try:
+                import pandas as pd
+                slate_df = ats_engine.score_games(pd.read_csv(slate_file), sport)
+                st.dataframe(slate_df, use_container_width=True, hide_index=True)
+            except Exception as e:
+                st.error(f"⚠️ Slate error: {e}")
@@ -0,0 +1,77 @@
+# Moneyball Phil — Backtest page
+# -----------------------------------------------------
+# Scores the recorded history (moneyball.backtest) by sport, market and
+# tier: ROI and hit rate of the bets the model would have made, Brier
+# score, and calibration curves. "Replay" re-prices the stored inputs with
+# the current model first, so a model change can be checked against every
+# past result.
+
+import os
+
+import streamlit as st
+
+from moneyball import backtest, params
+
+from . import profiling
+
+GROUP_COLUMNS = ["sport", "module", "kind", "market", "tier", "season"]
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _markets(modules: tuple, seasons: tuple, replay: bool, root: str, stamp: tuple):
+    # ``stamp`` (file mtimes) invalidates the entry when history is recorded or settled
+    if replay:
+        return backtest.replay(list(modules), list(seasons), root)
+    return backtest.load(list(modules), list(seasons), root).to_pandas()
+
+
+@profiling.timed("backtest report")
+def backtest_app():
+    st.header("📈 Backtest")
+    root = backtest.history_root()
+    stored = backtest.seasons(root)
+    if not stored:
+        st.info(f"No recorded history in `{os.path.abspath(root)}` yet. Record priced slates with results using "
+                "`python -m moneyball.backtest record <module> slate.csv --results results.csv`.")
+        return
+
+    c1, c2 = st.columns(2)
+    modules = c1.multiselect("Modules", list(stored), default=list(stored), key="bt_modules")
+    all_seasons = sorted({s for m in modules for s in stored[m]})
+    seasons = c2.multiselect("Seasons", all_seasons, default=all_seasons, key="bt_seasons")
+    by = st.multiselect("Group by", GROUP_COLUMNS, default=list(backtest.DEFAULT_BY), key="bt_by")
+    c3, c4, c5 = st.columns(3)
+    min_ev = c3.number_input("Bet when EV is above", value=0.0, step=0.5, key="bt_min_ev")
+    bins = c4.slider("Calibration bins", 5, 20, backtest.DEFAULT_BINS, key="bt_bins")
+    replay = c5.checkbox("Replay with the current model", key="bt_replay",
+                         help="Re-price every stored input instead of scoring the probabilities recorded at the time.")
+    if not modules or not seasons:
+        st.info("Select at least one module and season.")
+        return
+
+    stamp = tuple(os.path.getmtime(backtest.history_path(m, s, root))
+                  for m in modules for s in stored[m] if s in seasons)
+    with st.spinner("Replaying the history…" if replay else "Loading the history…"):
+        frame = _markets(tuple(modules), tuple(seasons), replay, root, stamp)
+    report = backtest.evaluate(frame, by, bins, min_ev)
+    total = backtest.evaluate(frame, (), bins, min_ev).summary
+
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Settled markets", f"{int(total['Markets'].sum()):,}")
+    m2.metric("Bets", f"{int(total['Bets'].sum()):,}")
+    if len(total):
+        m3.metric("ROI", f"{total['ROI %'].iloc[0]:.2f}%")
+        m4.metric("Brier", f"{total['Brier'].iloc[0]:.4f}")
+    st.dataframe(report.summary, use_container_width=True, hide_index=True)
+
+    st.subheader("Calibration")
+    cal = report.calibration
+    if len(cal):
+        curves = cal.pivot_table(index="Predicted %", columns="sport", values="Actual %")
+        chart = curves.reindex(sorted(set(curves.index)))
+        chart["Perfect"] = chart.index
+        st.line_chart(chart.interpolate(limit_area="inside"))
+        st.dataframe(cal, use_container_width=True, hide_index=True)
+    version = f"v{params.ACTIVE.version}" if params.ACTIVE.version else "shipped defaults"
+    st.caption(f"{len(frame):,} markets · ROI and hit rate at $1 per bet with EV above {min_ev:g}; Brier score "
+               f"and calibration over every settled market. Replay uses model parameters {version}.")
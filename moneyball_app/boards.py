@@ -0,0 +1,299 @@
+# Moneyball Phil — Saved boards
+# -----------------------------------------------------
+# The saved boards and parlay legs, backed by moneyball.store instead of
+# st.session_state so they survive a refresh. A page asks for board(name)
+# and gets a list-like view of the newest rows; nothing is kept in session
+# memory, and rows are only read from SQLite when the page touches them.
+# Boards listed in RECORD_TYPES load as typed moneyball.records.Play
+# objects; the rest are the dicts that were saved.
+#
+# Boards belong to a workspace: the ?ws= query parameter, created on a
+# browser's first visit so a refresh or bookmark keeps it, and editable in
+# the sidebar to open a named workspace ("default" holds the rows saved
+# before workspaces existed). Sessions never see or clear another
+# workspace's rows. Boards in WHOLE_BOARDS are read in full; the others
+# show their newest rows, and ``truncated`` says when more are stored.
+#
+# paged_table() renders a board (or an in-session list) as one dataframe
+# with row selection: sorting, filtering and paging happen before the rows
+# reach the browser, so a rerun costs the same with 20 rows or 20,000.
+# RecentRows keeps session-only results bounded and deduplicated by key.
+
+import math
+import uuid
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import streamlit as st
+
+from moneyball.kernels import tier_from_true
+from moneyball.records import Play
+from moneyball.store import DEFAULT_LIMIT, PAGE_SIZE, Store
+
+WORKSPACE_PARAM = "ws"
+
+# Boards never cut to their newest rows: the slip is priced as one bet
+WHOLE_BOARDS = ("global_parlay",)
+
+# Boards whose rows load as typed records instead of dicts
+RECORD_TYPES = {
+    "nfl_all_props": Play,
+    "player_board": Play,
+}
+
+# (sport, market, tier) for the store's index columns, per board (from the payload)
+INDEX_FIELDS: Dict[str, Callable[[dict], Tuple[Optional[str], Optional[str], Optional[str]]]] = {
+    "nfl_all_props": lambda r: ("NFL", r.get("market"), r.get("tier")),
+    "saved_players": lambda r: ("MLB", "1+ Hit", r.get("zone")),
+    "player_board": lambda r: ("MLB", r.get("market"), r.get("tier")),
+    "nba_saved_plays": lambda r: ("NBA", r.get("Type"), r.get("MatchupTier")),
+    "saved_bets": lambda r: ("Soccer", r.get("market"), tier_from_true(r.get("true_p"), r.get("market"))[0]),
+    "global_parlay": lambda r: (r.get("sport"), None, None),
+}
+
+
+def _upgrade_records(store: Store):
+    # Rows saved before the typed records held formatted strings; rewrite
+    # them once so sorting in SQLite sees the numeric fields. SQLite finds
+    # them, so a start only parses the rows that still need it.
+    for name, record_type in RECORD_TYPES.items():
+        for row in store.lacking(name, "true_prob"):
+            store.update(row["_key"], record_type.from_payload(row).to_payload(), owner=None)
+
+
+@st.cache_resource(show_spinner=False)
+def get_store() -> Store:
+    """One store per process, shared by every session ($MONEYBALL_DB or ./moneyball.db)."""
+    store = Store()
+    _upgrade_records(store)
+    return store
+
+
+def workspace() -> str:
+    """This browser's workspace id (the ?ws= query parameter, created on first use)."""
+    ws = st.query_params.get(WORKSPACE_PARAM, "").strip()
+    if not ws:
+        ws = uuid.uuid4().hex[:12]
+        st.query_params[WORKSPACE_PARAM] = ws
+    return ws
+
+
+def render_workspace():
+    """Sidebar field showing the workspace; typing a name opens (or starts) that workspace."""
+    current = workspace()
+    name = st.text_input("Workspace", value=current,
+                         help="Your saved boards and parlay slip. Bookmark the page, or type the same name on "
+                              "another device, to come back to them.").strip()
+    if name and name != current:
+        st.query_params[WORKSPACE_PARAM] = name
+        st.rerun()
+
+
+def _payload(record) -> dict:
+    return record.to_payload() if hasattr(record, "to_payload") else record
+
+
+def _key(record) -> str:
+    return record.key if hasattr(record, "to_payload") else record["_key"]
+
+
+class Board:
+    """
+    List-like view of the newest ``limit`` rows of one board in one
+    workspace (``owner``, default this browser's). Rows are read on first
+    access and re-read after every write made through the view.
+    """
+
+    def __init__(self, name: str, limit: Optional[int] = DEFAULT_LIMIT, owner: Optional[str] = None):
+        self.name = name
+        self.limit = None if name in WHOLE_BOARDS else limit
+        self.owner = workspace() if owner is None else owner
+        self.record_type = RECORD_TYPES.get(name)
+        self._rows: Optional[list] = None
+
+    def _load(self, rows: List[dict]) -> list:
+        return rows if self.record_type is None else [self.record_type.from_payload(r) for r in rows]
+
+    @property
+    def rows(self) -> list:
+        if self._rows is None:
+            self._rows = self._load(get_store().recent(self.name, self.limit, self.owner))
+        return self._rows
+
+    def __iter__(self) -> Iterator:
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, i):
+        return self.rows[i]
+
+    def total(self) -> int:
+        """Rows on the board in the database (may exceed what the view loads)."""
+        return get_store().count(self.name, owner=self.owner)
+
+    @property
+    def truncated(self) -> bool:
+        """More rows are stored than the view loads."""
+        return self.limit is not None and len(self.rows) >= self.limit and self.total() > len(self.rows)
+
+    def count(self, search: Optional[str] = None) -> int:
+        return get_store().count(self.name, search, self.owner)
+
+    def page(self, sort: Optional[str] = None, numeric: bool = False, descending: bool = False,
+             search: Optional[str] = None, limit: int = PAGE_SIZE, offset: int = 0) -> list:
+        """One sorted, filtered page straight from the database (see Store.page)."""
+        return self._load(get_store().page(self.name, sort, numeric, descending, search, limit, offset,
+                                                self.owner))
+
+    def append(self, record):
+        payload = _payload(record)
+        sport, market, tier = INDEX_FIELDS[self.name](payload)
+        get_store().add(self.name, payload, sport=sport, market=market, tier=tier, owner=self.owner)
+        self._rows = None
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def update(self, record):
+        get_store().update(_key(record), _payload(record), self.owner)
+        self._rows = None
+
+    def remove(self, *records):
+        get_store().delete([_key(r) for r in records], self.owner)
+        self._rows = None
+
+    def clear(self):
+        get_store().clear(self.name, self.owner)
+        self._rows = None
+
+
+def board(name: str, limit: Optional[int] = DEFAULT_LIMIT) -> Board:
+    return Board(name, limit)
+
+
+def _values(record) -> Iterator:
+    # Leaf values of a record, as Store.page searches them (keys left out)
+    for v in (record.values() if isinstance(record, dict) else record):
+        if isinstance(v, (dict, list, tuple)):
+            yield from _values(v)
+        elif v is not None:
+            yield v
+
+
+class ListSource:
+    """The Board paging API over a list already in memory (session-only rows)."""
+
+    def __init__(self, rows: Sequence[dict]):
+        self.rows = list(rows)
+
+    def _matching(self, search: Optional[str]) -> List[dict]:
+        if not search:
+            return self.rows
+        needle = search.lower()
+        return [r for r in self.rows if any(needle in str(v).lower() for v in _values(r))]
+
+    def count(self, search: Optional[str] = None) -> int:
+        return len(self._matching(search))
+
+    def page(self, sort: Optional[str] = None, numeric: bool = False, descending: bool = False,
+             search: Optional[str] = None, limit: int = PAGE_SIZE, offset: int = 0) -> List[dict]:
+        rows = self._matching(search)
+        if sort is not None:
+            # Missing / unparseable values sort lowest, as NULLs do in SQLite
+            if numeric:
+                def key(r):
+                    try:
+                        return float(str(r.get(sort)).replace("%", ""))
+                    except ValueError:
+                        return -math.inf
+            else:
+                def key(r):
+                    v = r.get(sort)
+                    return "" if v is None else str(v)
+            rows = sorted(rows, key=key, reverse=descending)
+        elif descending:
+            rows = rows[::-1]
+        return rows[offset:offset + limit]
+
+
+class RecentRows:
+    """
+    In-session rows keyed by ``key(row)``, oldest first. Adding a row whose
+    key is already present replaces it and moves it to the newest end;
+    past ``limit`` rows the oldest are dropped. Costs stay flat however
+    often the same play is re-run.
+    """
+
+    def __init__(self, key: Callable[[dict], Any], limit: int = DEFAULT_LIMIT, rows: Sequence[dict] = ()):
+        self.key = key
+        self.limit = limit
+        self._rows: Dict[Any, dict] = {}
+        for row in rows:
+            self.append(row)
+
+    def append(self, row: dict):
+        k = self.key(row)
+        self._rows.pop(k, None)
+        self._rows[k] = row
+        while len(self._rows) > self.limit:
+            del self._rows[next(iter(self._rows))]
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(list(self._rows.values()))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __bool__(self) -> bool:
+        return bool(self._rows)
+
+    def clear(self):
+        self._rows.clear()
+
+
+# A sort option: label -> (record field or None for save order, numeric?)
+Sorts = Dict[str, Tuple[Optional[str], bool]]
+
+
+def paged_table(source, key: str, columns: Dict[str, Callable[[dict], Any]], sorts: Sorts,
+                default_desc: bool = True, page_size: int = PAGE_SIZE) -> List[dict]:
+    """
+    Render one page of ``source`` (a Board or ListSource) as a single
+    dataframe with multi-row selection, plus filter / sort / page controls.
+    ``columns`` maps each header to a function of the record, which is
+    where numbers get formatted. Returns the selected records so the
+    caller can act on them.
+    """
+    def first_page():
+        st.session_state[f"{key}_page"] = 1
+
+    c1, c2, c3, c4 = st.columns([3, 2, 1, 1])
+    search = c1.text_input("Filter", key=f"{key}_q", placeholder="Text in any field",
+                           on_change=first_page).strip() or None
+    sort_label = c2.selectbox("Sort by", list(sorts), key=f"{key}_sort", on_change=first_page)
+    descending = c3.toggle("Desc", value=default_desc, key=f"{key}_desc", on_change=first_page)
+
+    total = source.count(search)
+    pages = max(1, math.ceil(total / page_size))
+    # Keep the page in range when rows were deleted
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    page = int(c4.number_input("Page", min_value=1, max_value=pages, step=1, key=f"{key}_page"))
+
+    field, numeric = sorts[sort_label]
+    rows = source.page(field, numeric, descending, search, page_size, (page - 1) * page_size)
+    if not rows:
+        st.caption("No rows match the filter." if search else "Nothing saved yet.")
+        return []
+
+    import pandas as pd
+    df = pd.DataFrame([{header: fn(r) for header, fn in columns.items()} for r in rows])
+    # The key follows the page contents so a stale selection never points at new rows
+    event = st.dataframe(df, hide_index=True, use_container_width=True, on_select="rerun",
+                         selection_mode="multi-row",
+                         key=f"{key}_tbl_{page}_{sort_label}_{descending}_{search}_{total}")
+    st.caption(f"Rows {(page - 1) * page_size + 1}–{(page - 1) * page_size + len(rows)} of {total}"
+               f" · page {page} of {pages} · select rows for actions")
+    return [rows[i] for i in event.selection.rows if i < len(rows)]
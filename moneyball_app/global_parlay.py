@@ -0,0 +1,318 @@
+# Moneyball Phil — Global Parlay Builder
+# -----------------------------------------------------
+# The cross-sport slip every module adds legs to, priced with
+# moneyball.parlay (correlated Monte Carlo), plus a search for the best
+# parlays across every saved board (moneyball.optimizer) and stakes for
+# all open bets sized together (moneyball.kelly).
+
+import datetime
+import uuid
+
+import numpy as np
+import streamlit as st
+
+from moneyball import kelly, optimizer
+from moneyball import parlay as parlay_engine
+from moneyball.odds import american_to_prob, american_to_decimal, decimal_to_american, parse_american
+from moneyball.kernels import (
+    roi_per_dollar, parlay_tier,
+)
+from moneyball.store import DEFAULT_LIMIT
+
+from . import profiling
+from .boards import board, paged_table
+
+
+# =====================================================
+# ============ GLOBAL PARLAY BUILDER ==================
+# =====================================================
+def add_to_global_parlay(sport: str, description: str, odds_american: float, true_prob_frac: float,
+                         game: str = "", team: str = ""):
+    # game/team tags drive the default same-game / same-team leg correlations
+    board("global_parlay").append({
+        "id": str(uuid.uuid4())[:8],
+        "sport": sport,
+        "description": description,
+        "odds": float(odds_american),
+        "true_prob": float(true_prob_frac),
+        "game": game or "",
+        "team": team or "",
+    })
+
+def render_global_parlay_builder():
+    st.markdown("---")
+    st.header("🌍 Global Parlay Builder (All Sports)")
+
+    profiling.section("legs")
+    legs = board("global_parlay")
+    if not legs:
+        st.info("No global legs saved yet. Use “Add to Global Parlay” inside any module.")
+        render_parlay_optimizer()
+        render_stake_sizing()
+        return
+
+    # Show table of legs
+    selected = paged_table(legs, "gl_legs", {
+        "Sport": lambda leg: leg["sport"],
+        "Leg": lambda leg: leg["description"],
+        "Odds": lambda leg: int(leg["odds"]),
+        "True": lambda leg: f"{leg['true_prob']*100:.2f}%",
+        "Game": lambda leg: leg.get("game", ""),
+        "Team": lambda leg: leg.get("team", ""),
+    }, sorts={"Added": (None, False), "True": ("true_prob", True), "Odds": ("odds", True),
+              "Sport": ("sport", False)}, default_desc=False)
+
+    cc1, cc2 = st.columns([1,1])
+    with cc1:
+        if st.button(f"🗑️ Remove Selected Legs ({len(selected)})", disabled=not selected, key="gl_rm_selected"):
+            legs.remove(*selected)
+            st.rerun()
+    with cc2:
+        if st.button("🧹 Clear All Global Legs"):
+            legs.clear()
+            st.success("Global parlay cleared.")
+            st.rerun()
+
+    # Manual sportsbook parlay odds
+    st.markdown("### Sportsbook Parlay Odds (manual)")
+    book_odds_str = st.text_input("Enter combined sportsbook odds (American, e.g., +650 or -120):", value="", key="global_book_odds")
+    implied_book = None
+    if book_odds_str.strip():
+        try:
+            book_odds_val = parse_american(book_odds_str)
+            implied_book = american_to_prob(book_odds_val)  # [0..1]
+        except Exception:
+            st.warning("Could not parse the American odds you entered.")
+
+    # Leg correlation: same-game / same-team heuristics from editable tags
+    with st.expander("🔗 Leg Correlation (same-game / same-team)", expanded=False):
+        k1, k2, k3 = st.columns(3)
+        rho_game = k1.number_input("Same-game ρ", -0.9, 0.9, parlay_engine.SAME_GAME_RHO, 0.05, key="gl_rho_game")
+        rho_team = k2.number_input("Same-team ρ", -0.9, 0.9, parlay_engine.SAME_TEAM_RHO, 0.05, key="gl_rho_team")
+        n_draws = k3.selectbox("Simulation draws", [100_000, 250_000, 1_000_000, 5_000_000], index=2, key="gl_draws")
+        import pandas as pd
+        tags = st.data_editor(
+            pd.DataFrame([{"Leg": leg["description"], "Game": leg.get("game", ""), "Team": leg.get("team", "")}
+                          for leg in legs]),
+            disabled=["Leg"], hide_index=True, use_container_width=True,
+            key="gl_tags_" + "-".join(leg["id"] for leg in legs),
+        )
+        for leg, game, team in zip(list(legs), tags["Game"], tags["Team"]):
+            if (leg.get("game", ""), leg.get("team", "")) != (game or "", team or ""):
+                leg["game"], leg["team"] = game or "", team or ""
+                legs.update(leg)
+
+    # Compute auto odds, then correlated true parlay % + EV
+    profiling.section("simulate")
+    dec_product = 1.0
+    for leg in legs:
+        dec_product *= american_to_decimal(float(leg["odds"]))
+
+    auto_american = decimal_to_american(dec_product)
+    implied_auto = american_to_prob(auto_american)
+
+    # EV using sportsbook odds if given, otherwise auto odds
+    if implied_book is not None:
+        used_implied = implied_book
+        used_dec = american_to_decimal(book_odds_val)
+    else:
+        used_implied = implied_auto
+        used_dec = dec_product
+
+    corr = parlay_engine.correlation_matrix(legs, same_game=rho_game, same_team=rho_team)
+    sim = parlay_engine.simulate_parlay([float(leg["true_prob"]) for leg in legs], corr,
+                                        dec_odds=used_dec, n_draws=n_draws)
+    true_parlay = sim.true_prob
+
+    profiling.section("summary")
+    st.markdown("---")
+    g1, g2, g3, g4, g5, g6 = st.columns(6)
+    g1.metric("Legs", f"{len(legs)}")
+    g2.metric("True Parlay %", f"{true_parlay*100:.2f}%")
+    g3.metric("Independent %", f"{sim.independent_prob*100:.2f}%")
+    g4.metric("Auto Combined Odds", f"{auto_american:+d}")
+    g5.metric("Auto Implied %", f"{implied_auto*100:.2f}%")
+    if implied_book is not None:
+        g6.metric("Book Implied %", f"{implied_book*100:.2f}%")
+    else:
+        g6.metric("Book Implied %", "—")
+    if sim.n_draws:
+        st.caption(f"Correlated Monte Carlo ({sim.n_draws:,} draws) — 95% CI: True "
+                   f"{sim.ci_low*100:.2f}–{sim.ci_high*100:.2f}% | EV {sim.ev_ci_low:.2f}–{sim.ev_ci_high:.2f}%")
+    else:
+        st.caption("No correlated legs — True Parlay % is the exact product of leg probabilities.")
+
+    edge_pp = (true_parlay - used_implied) * 100.0
+    ev_pct = roi_per_dollar(true_parlay, used_dec) * 100.0
+
+    st.write(f"**Edge (pp):** {edge_pp:.2f} pp  |  **EV % (ROI/$1):** {ev_pct:.2f}%")
+
+    # Parlay Tier
+    tier = parlay_tier(ev_pct)
+    st.write(f"**Parlay Tier:** {tier}")
+
+    # Copy-ready tracker row
+    legs_text = " + ".join([f"{leg['sport']}: {leg['description']}" for leg in legs])
+    used_amer_for_text = book_odds_val if implied_book is not None else auto_american
+    st.markdown("#### Copy-ready Tracker Row")
+    st.code(
+        f"{datetime.date.today()} | {legs_text} | {int(used_amer_for_text)} | "
+        f"True {true_parlay*100:.2f}% | Implied {used_implied*100:.2f}% | "
+        f"EV {ev_pct:.2f}% | Edge {edge_pp:.2f} pp | {tier}",
+        language="text"
+    )
+
+    render_parlay_optimizer()
+    render_stake_sizing(list(legs), used_dec, (rho_game, rho_team))
+
+
+# =====================================================
+# ========= BEST PARLAYS FROM SAVED LEGS ==============
+# =====================================================
+def _name_before(text: str, n_words: int) -> str:
+    # "Gerrit Cole O6.5 K" → "gerrit cole"
+    return " ".join(str(text).split()[:-n_words]).lower()
+
+
+# board → [(sport, description, true_prob, decimal odds, group)]; legs in the
+# same group (game or player) are never combined by the optimizer
+LEG_SOURCES = {
+    "Global Parlay legs": ("global_parlay", lambda r: (
+        r["sport"], r["description"], float(r["true_prob"]), american_to_decimal(float(r["odds"])),
+        (r.get("game") or "").strip().lower() or r["description"].lower())),
+    "Soccer saved bets": ("saved_bets", lambda r: (
+        "Soccer", f"{r['match_label']} — {r['market_label']}", float(r["true_p"]), float(r["dec"]),
+        str(r["match_label"]).strip().lower())),
+    "NFL board": ("nfl_all_props", lambda r: (
+        "NFL", r.label, float(r.true_prob), american_to_decimal(r.odds), r.player.lower())),
+    "MLB hit board": ("saved_players", lambda r: (
+        "MLB Hit", f"{r['name']} — 1+ Hit", float(r["true_prob"]), american_to_decimal(parse_american(r["odds_txt"])),
+        str(r["name"]).lower())),
+    "Pitcher board": ("player_board", lambda r: (
+        "Pitcher", r.description, float(r.true_prob), american_to_decimal(r.odds), _name_before(r.description, 2))),
+    "NBA board (Overs)": ("nba_saved_plays", lambda r: (
+        "NBA", f"{r['Player']} Over {r['Line']} ({r['Type']})", float(r["TrueFrac"]),
+        american_to_decimal(parse_american(r["OverOdds"])), str(r["Player"]).lower())),
+}
+
+
+def _saved_leg_pool(sources):
+    pool, cut = [], []
+    for label in sources:
+        name, to_leg = LEG_SOURCES[label]
+        rows = board(name)
+        if rows.truncated:
+            cut.append(f"{label} ({rows.total():,} saved)")
+        for r in rows:
+            try:
+                pool.append(to_leg(r))
+            except (KeyError, TypeError, ValueError):
+                continue    # saved without usable odds
+    if cut:
+        st.caption(f"Only the newest {DEFAULT_LIMIT} rows are used from: {', '.join(cut)}.")
+    return pool
+
+
+@profiling.timed("best parlays")
+def render_parlay_optimizer():
+    st.markdown("---")
+    st.subheader("🧠 Best Parlays from Saved Legs")
+    st.caption("Searches every combination of 2–k saved legs (legs priced as independent; legs from the "
+               "same game or player are never combined).")
+    sources = st.multiselect("Leg sources", list(LEG_SOURCES), default=list(LEG_SOURCES)[:2], key="opt_sources")
+    o1, o2, o3, o4 = st.columns(4)
+    objective = o1.radio("Rank by", ["EV %", "True %"], horizontal=True, key="opt_objective")
+    max_legs = o2.slider("Max legs", 2, 8, 4, key="opt_max_legs")
+    top_k = o3.number_input("Show top", 1, 50, 10, key="opt_top_k")
+    ev_floor = o4.number_input("Min EV %", -50.0, 500.0, 0.0, 0.5, key="opt_ev_floor")
+
+    pool = _saved_leg_pool(sources)
+    if len(pool) < 2:
+        st.info("Save at least two legs with odds to search for parlays.")
+        return
+    sports, descs, probs, decs, groups = zip(*pool)
+    picks = optimizer.best_parlays(probs, decs, max_legs=max_legs, top_k=int(top_k),
+                                   objective="ev" if objective == "EV %" else "prob",
+                                   ev_floor=ev_floor / 100.0, groups=groups)
+    if not picks:
+        st.warning(f"No parlay of 2–{max_legs} legs from {len(pool)} saved legs clears {ev_floor:.1f}% EV.")
+        return
+    import pandas as pd
+    st.dataframe(pd.DataFrame([{
+        "Legs": " + ".join(f"{sports[i]}: {descs[i]}" for i in pick.legs),
+        "# Legs": len(pick.legs),
+        "True %": round(pick.true_prob * 100, 2),
+        "Odds": decimal_to_american(pick.dec_odds),
+        "EV %": round(pick.ev_pct, 2),
+        "Tier": parlay_tier(pick.ev_pct),
+    } for pick in picks]), use_container_width=True, hide_index=True)
+    st.caption(f"Top {len(picks)} of every 2–{max_legs} leg parlay from {len(pool)} saved legs.")
+
+
+# =====================================================
+# ============== STAKE SIZING (KELLY) =================
+# =====================================================
+@profiling.timed("stake sizing")
+def render_stake_sizing(slip_legs=(), slip_dec=None, rhos=(parlay_engine.SAME_GAME_RHO, parlay_engine.SAME_TEAM_RHO)):
+    st.markdown("---")
+    st.subheader("💰 Stake Sizing (simultaneous Kelly)")
+    st.caption("Sizes the selected saved bets and the Global Parlay slip together: stakes maximize expected "
+               "bankroll growth over their joint outcome (shared legs and same-game correlation included), "
+               "so the total stays under the cap instead of adding up one Kelly stake per bet.")
+    sources = st.multiselect("Bets to size (as singles)", list(LEG_SOURCES),
+                             default=[s for s in LEG_SOURCES if s != "Global Parlay legs"], key="kelly_sources")
+    include_slip = st.checkbox("Include the Global Parlay slip", value=bool(slip_legs), disabled=not slip_legs,
+                               key="kelly_slip")
+    k1, k2, k3 = st.columns(3)
+    bankroll = k1.number_input("Bankroll ($)", min_value=0.0, value=1000.0, step=50.0, key="kelly_bankroll")
+    fraction = k2.selectbox("Kelly fraction", [0.25, 0.5, 1.0], index=1, key="kelly_fraction",
+                            format_func=lambda f: {0.25: "Quarter", 0.5: "Half", 1.0: "Full"}[f])
+    cap_pct = k3.slider("Max bankroll at risk (%)", 1, 100, int(kelly.DEFAULT_CAP * 100), key="kelly_cap")
+
+    # Legs are shared by (sport, description): a saved single that is also on the slip is one event
+    leg_index, leg_probs, leg_tags = {}, [], []
+
+    def leg(sport, desc, prob, game, team=""):
+        key = (sport, desc)
+        if key not in leg_index:
+            leg_index[key] = len(leg_probs)
+            leg_probs.append(float(prob))
+            leg_tags.append({"game": game, "team": team})
+        return leg_index[key]
+
+    labels, bets, decs = [], [], []
+    for sport, desc, prob, dec, group in _saved_leg_pool(sources):
+        labels.append(f"{sport}: {desc}")
+        bets.append((leg(sport, desc, prob, group),))
+        decs.append(dec)
+    if include_slip and slip_legs and slip_dec:
+        bets.append(tuple(leg(g["sport"], g["description"], g["true_prob"],
+                              (g.get("game") or "").strip().lower() or g["description"].lower(),
+                              (g.get("team") or "").strip().lower()) for g in slip_legs))
+        labels.append(f"Global Parlay ({len(slip_legs)} legs)")
+        decs.append(float(slip_dec))
+    if not bets:
+        st.info("Select saved bets with odds (or build a Global Parlay slip) to size stakes.")
+        return
+
+    corr = parlay_engine.correlation_matrix(leg_tags, same_game=rhos[0], same_team=rhos[1])
+    alloc = kelly.allocate(leg_probs, bets, decs, corr=corr, fraction=fraction, cap=cap_pct / 100.0)
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Total stake", f"${alloc.total * bankroll:,.2f}", f"{alloc.total * 100:.1f}% of bankroll",
+              delta_color="off")
+    m2.metric("Sum of one-at-a-time Kelly", f"{alloc.solo.sum() * 100:.1f}%")
+    m3.metric("Expected growth / round", f"{alloc.growth * 100:.3f}%")
+    import pandas as pd
+    order = np.argsort(-alloc.stakes, kind="stable")
+    st.dataframe(pd.DataFrame([{
+        "Bet": labels[i],
+        "True %": round(float(alloc.true_prob[i]) * 100, 2),
+        "Odds": decimal_to_american(decs[i]),
+        "EV %": round(float(alloc.ev_pct[i]), 2),
+        "Solo Kelly %": round(float(alloc.solo[i]) * 100, 2),
+        "Stake %": round(float(alloc.stakes[i]) * 100, 2),
+        "Stake $": round(float(alloc.stakes[i]) * bankroll, 2),
+    } for i in order]), use_container_width=True, hide_index=True)
+    how = "every joint outcome enumerated" if alloc.exact else f"{alloc.n_outcomes:,} sampled joint outcomes"
+    st.caption(f"{len(bets)} bets over {len(leg_probs)} legs · {how}.")
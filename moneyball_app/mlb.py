@@ -0,0 +1,168 @@
+# Moneyball Phil — MLB Hit Simulator page
+# -----------------------------------------------------
+
+import streamlit as st
+
+from moneyball import mlb as mlb_engine
+from moneyball.odds import american_to_prob, parse_american
+from moneyball.kernels import (
+    AB_LOOKUP, calculate_weighted_avg, pitcher_difficulty, classify_zone,
+)
+
+from . import profiling
+from .boards import board
+from .global_parlay import add_to_global_parlay
+
+
+# =====================================================
+# ======== MODULE: MLB HIT SIMULATOR (Final) ==========
+# =====================================================
+def mlb_hits_app():
+    st.header("⚾ Moneyball Phil: Hit Probability Simulator")
+
+    if "last_player_result" not in st.session_state:
+        st.session_state.last_player_result = None
+    if "id_counter" not in st.session_state:
+        st.session_state.id_counter = 1
+
+    def next_id():
+        st.session_state.id_counter += 1
+        return st.session_state.id_counter
+
+    def _to_float(txt: str, *, allow_empty=False, default=0.0):
+        s = str(txt).strip()
+        if allow_empty and s == "":
+            return default
+        return float(s)
+
+    profiling.section("inputs")
+    st.subheader("📥 Player Stat Entry")
+    with st.form("player_input"):
+        name = st.text_input("Player Name", key="name")
+        season_avg_txt  = st.text_input("Season AVG", placeholder="0.285", key="season_avg")
+        last7_avg_txt   = st.text_input("Last 7 Days AVG", placeholder="0.310", key="last7_avg")
+        split_avg_txt   = st.text_input("Split AVG (Home/Away)", placeholder="0.295", key="split_avg")
+        hand_avg_txt    = st.text_input("AVG vs Handedness", placeholder="0.305", key="hand_avg")
+        pitcher_avg_txt = st.text_input("AVG vs Pitcher", placeholder="0.270", key="pitcher_avg")
+
+        ab_vs_pitcher = st.number_input("At-Bats vs Pitcher", min_value=0, step=1, key="ab_vs_pitcher")
+        pitcher_hand = st.selectbox("Pitcher Handedness", ["Right", "Left"], key="pitcher_hand")
+
+        pitcher_era_txt  = st.text_input("Pitcher ERA", placeholder="3.75", key="pitcher_era")
+        pitcher_whip_txt = st.text_input("Pitcher WHIP", placeholder="1.20", key="pitcher_whip")
+        pitcher_k9_txt   = st.text_input("Pitcher K/9", placeholder="9.3", key="pitcher_k9")
+
+        batting_order = st.selectbox("Batting Order Position", list(range(1, 10)), key="batting_order")
+        odds_txt = st.text_input("Sportsbook Odds (American)", placeholder="-115", key="odds_txt")
+        submit = st.form_submit_button("Simulate Player")
+
+    profiling.section("compute")
+    if submit:
+        try:
+            season_avg  = _to_float(season_avg_txt)
+            last7_avg   = _to_float(last7_avg_txt)
+            split_avg   = _to_float(split_avg_txt)
+            hand_avg    = _to_float(hand_avg_txt)
+            pitcher_avg = _to_float(pitcher_avg_txt)
+            pitcher_era  = _to_float(pitcher_era_txt)
+            pitcher_whip = _to_float(pitcher_whip_txt)
+            pitcher_k9   = _to_float(pitcher_k9_txt)
+            odds_implied = american_to_prob(parse_american(odds_txt))
+        except Exception as e:
+            st.error(f"Input error: {e}")
+        else:
+            weighted_avg = calculate_weighted_avg(season_avg, last7_avg, split_avg, hand_avg, pitcher_avg)
+
+            # Pitcher difficulty adjustments
+            adjustment, tier_pitcher = pitcher_difficulty(pitcher_whip, pitcher_era)
+
+            adj_weighted_avg = max(0.0, min(1.0, weighted_avg + adjustment))
+
+            est_ab = AB_LOOKUP.get(batting_order, 4.0)
+
+            # Over a distribution of AB counts with mean est_ab (not est_ab rounded)
+            true_prob = float(mlb_engine.hit_probability(adj_weighted_avg, est_ab))
+            implied_prob = odds_implied
+            ev = (true_prob - implied_prob) * 100.0
+            zone = classify_zone(true_prob)
+
+            st.session_state.last_player_result = {
+                "id": next_id(), "name": name or "Player",
+                "true_prob": true_prob, "implied_prob": implied_prob,
+                "ev": ev, "odds_txt": odds_txt.strip(),
+                "batting_order": batting_order,
+                "pitcher_hand": pitcher_hand,
+                "ab_vs_pitcher": ab_vs_pitcher,
+                "weighted_avg": weighted_avg,
+                "adj_avg": adj_weighted_avg,
+                "est_ab": est_ab,
+                "pitcher_tier": tier_pitcher,
+                "zone": zone
+            }
+
+    profiling.section("result")
+    if st.session_state.last_player_result:
+        r = st.session_state.last_player_result
+        st.markdown("---")
+        st.subheader("🧪 Latest Simulation (Preview)")
+
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Adjusted AVG", f"{r['adj_avg']:.3f}")
+        c2.metric("Est. AB", f"{r['est_ab']:.1f}")
+        c3.metric("Pitcher Tier", r["pitcher_tier"])
+
+        st.write(f"**Player:** {r['name']} | **Pitcher Hand:** {r['pitcher_hand']} | "
+                 f"**Batting Order:** {r['batting_order']} | **AB vs Pitcher:** {r['ab_vs_pitcher']}")
+        st.write(f"**Weighted AVG (pre-adj):** `{r['weighted_avg']}` → **Adjusted:** `{r['adj_avg']}`")
+        st.write(f"**True Hit %:** {r['true_prob']*100:.1f}% | **Implied %:** {r['implied_prob']*100:.1f}% | "
+                 f"**EV %:** {r['ev']:+.1f}% | **Odds:** {r['odds_txt']} | **Zone:** {r['zone']}")
+
+        c1, c2 = st.columns(2)
+        with c1:
+            if st.button("💾 Save to Board (Hit)"):
+                board("saved_players").append(r)
+                st.success("Saved to board.")
+        with c2:
+            if st.button("🌍 Add to Global Parlay (Hit)"):
+                try:
+                    odds = parse_american(r["odds_txt"])
+                    add_to_global_parlay("MLB Hit", f"{r['name']} — 1+ Hit", odds, r["true_prob"])
+                    st.success("Added to Global Parlay")
+                except Exception:
+                    st.warning("Couldn't parse odds for global parlay.")
+
+    profiling.section("board")
+    st.markdown("---")
+    st.header("📌 Saved Player Board")
+    saved_players = board("saved_players")
+    if not saved_players:
+        st.info("No saved players yet.")
+    else:
+        import pandas as pd
+        df = pd.DataFrame([
+            {
+                "Player": p["name"],
+                "True %": f"{p['true_prob']*100:.2f}%",
+                "Implied %": f"{p['implied_prob']*100:.2f}%",
+                "EV %": f"{p['ev']:.1f}%",
+                "Zone": p["zone"],
+                "Odds": p["odds_txt"]
+            }
+            for p in saved_players
+        ])
+        st.dataframe(df, use_container_width=True)
+
+    # ----------------- Batch lineups -----------------
+    profiling.section("batch lineups")
+    with st.expander("📂 Price whole lineups (CSV)", expanded=False):
+        st.caption("One row per hitter with the form's fields: player, batting_order, season_avg, last7_avg, "
+                   "split_avg, hand_avg, pitcher_avg, pitcher_whip, pitcher_era, odds (American); an optional "
+                   "game column groups hitters. Any number of games are priced in one pass.")
+        lineup_file = st.file_uploader("Lineups CSV", type=["csv"], key="mlb_lineups_csv")
+        if lineup_file is not None:
+            try:
+                import pandas as pd
+                lineups_df = mlb_engine.score_lineups(pd.read_csv(lineup_file))
+                st.dataframe(lineups_df, use_container_width=True, hide_index=True)
+            except Exception as e:
+                st.error(f"⚠️ Lineup error: {e}")
@@ -0,0 +1,266 @@
+# Moneyball Phil — NBA Simulator page
+# -----------------------------------------------------
+
+import streamlit as st
+
+from moneyball import nba as nba_engine
+from moneyball import parlay as parlay_engine
+from moneyball.odds import parse_american, implied_from_text
+from moneyball.kernels import (
+    defense_tier, readiness_badge, nba_projection, true_prob_from_line,
+)
+
+from . import odds_feed, profiling
+from .boards import RecentRows, board
+from .global_parlay import add_to_global_parlay
+
+
+def _board_key(row: dict):
+    # One board row per player, stat type and line: re-running a play replaces it
+    return (str(row["Player"]).strip().lower(), row["Type"], row["Line"])
+
+
+def nba_app():
+    # ---------------- Header ----------------
+    st.header("🏀 NBA Simulator")
+
+    # ---------------- Session defaults ----------------
+    if not isinstance(st.session_state.get("nba_board"), RecentRows):
+        st.session_state.nba_board = RecentRows(_board_key, rows=st.session_state.get("nba_board") or [])
+    st.session_state.setdefault("last_result_nba", None)
+
+    # ---------------- Helpers ----------------
+    def ev_symbol(ev):
+        if ev is None: return ""
+        if ev > 0.5:   return "🟩"
+        if ev < -0.5:  return "🟥"
+        return "🟨"
+
+    # Reset inputs quickly
+    def _reset_inputs():
+        keys = [
+            "nba_player","nba_team","nba_pos","nba_stat","nba_line",
+            "nba_odds_over","nba_odds_under","nba_opp","nba_def_rank",
+            "nba_pts","nba_reb","nba_ast","nba_recent","nba_alt_line","nba_alt_odds",
+            "nba_usage","nba_gp","nba_pre_g","nba_pre_mpg","nba_lm","nba_lm_custom"
+        ]
+        for k in keys:
+            if k in st.session_state: del st.session_state[k]
+        st.success("Inputs cleared.")
+        st.experimental_rerun()
+
+    # ---------------- Inputs (compact for wide mode) ----------------
+    profiling.section("inputs")
+
+    def fill_from_feed(event: str):
+        # Prefer the selected stat type; fall back to the other one the feed quotes
+        stat = st.session_state.get("nba_stat", "PRA")
+        for stat in (stat, "Points Only" if stat == "PRA" else "PRA"):
+            prefix = "pra" if stat == "PRA" else "pts"
+            line = st.session_state.get("nba_line") or None
+            over = odds_feed.price(event, f"{prefix}_over", line) if line else None
+            over = over or odds_feed.price(event, f"{prefix}_over")
+            if over is not None and over.line is not None:
+                break
+        else:
+            return {}
+        values = {"nba_player": event, "nba_stat": stat, "nba_line": float(over.line),
+                  "nba_odds_over": odds_feed.american_text(over)}
+        under = odds_feed.price(event, f"{prefix}_under", over.line)
+        if under is not None:
+            values["nba_odds_under"] = odds_feed.american_text(under)
+        alt_line = st.session_state.get("nba_alt_line") or 0.0
+        alt = odds_feed.price(event, f"{prefix}_over", alt_line) if alt_line > 0 else None
+        if alt is not None:
+            values["nba_alt_odds"] = odds_feed.american_text(alt)
+        return values
+
+    odds_feed.feed_picker("nba", ("pts_over", "pts_under", "pra_over", "pra_under"), fill_from_feed)
+    r1c1, r1c2, r1c3, r1c4 = st.columns([1.2, 1.0, 1.0, 1.0])
+    with r1c1:
+        player_name = st.text_input("Player", key="nba_player")
+        team        = st.text_input("Team", key="nba_team")
+        position    = st.selectbox("Position", ["PG","SG","SF","PF","C"], key="nba_pos")
+        opponent    = st.text_input("Opponent", key="nba_opp")
+    with r1c2:
+        stat_type       = st.radio("Stat Type", ["PRA","Points Only"], horizontal=True, key="nba_stat")
+        sportsbook_line = st.number_input("Sportsbook Line (Pts or PRA)", min_value=0.0, step=0.5, key="nba_line")
+        odds_over       = st.text_input("Over Odds", key="nba_odds_over")
+        odds_under      = st.text_input("Under Odds", key="nba_odds_under")
+    with r1c3:
+        base_pts   = st.number_input("Model Base – Pts", min_value=0.0, step=0.1, key="nba_pts")
+        base_reb   = st.number_input("Model Base – Reb", min_value=0.0, step=0.1, key="nba_reb")
+        base_ast   = st.number_input("Model Base – Ast", min_value=0.0, step=0.1, key="nba_ast")
+        recent_avg = st.number_input("Current-Season Avg (Pts/PRA)", min_value=0.0, step=0.1, key="nba_recent")
+    with r1c4:
+        defense_rank = st.number_input("DEF Rank vs Pos (1–30)", 1, 30, key="nba_def_rank")
+        usage        = st.number_input("Usage % (est.)", 0.0, 100.0, step=0.1, key="nba_usage")
+        alt_line     = st.number_input("Alt Line (optional)", min_value=0.0, step=0.5, key="nba_alt_line")
+        alt_odds     = st.text_input("Alt Over Odds", key="nba_alt_odds")
+
+    r2c1, r2c2, r2c3, r2c4 = st.columns([1.0, 0.9, 0.9, 1.2])
+    with r2c1:
+        gp_current = st.number_input("Games Played (this season)", min_value=0, step=1, key="nba_gp")
+    with r2c2:
+        pre_games  = st.number_input("Preseason Games", min_value=0, step=1, key="nba_pre_g")
+    with r2c3:
+        pre_mpg    = st.number_input("Preseason MPG", min_value=0.0, step=0.5, key="nba_pre_mpg")
+    with r2c4:
+        lm_profile    = st.selectbox("Load Management", ["None","Light","Heavy","Custom %"], key="nba_lm")
+        custom_lm_pct = st.number_input("Custom Role/Minutes % (±)", value=0.0, step=1.0, key="nba_lm_custom")
+
+    act1, act2 = st.columns([1,1])
+    with act1:
+        simulate_clicked = st.button("Simulate (NBA)", use_container_width=True)
+    with act2:
+        if st.button("Reset Inputs", use_container_width=True):
+            _reset_inputs()
+
+    # ---------------- Simulate ----------------
+    profiling.section("compute")
+    if simulate_clicked:
+        # Baselines → blend → LM → defense weighting
+        blended, w_new = nba_projection(stat_type, base_pts, base_reb, base_ast, recent_avg,
+                                        gp_current, pre_games, pre_mpg, lm_profile, custom_lm_pct, defense_rank)
+        w_old = 1.0 - w_new
+        tier_label, tier_emoji, def_factor, def_pct_txt = defense_tier(int(defense_rank))
+
+        # Main line probs
+        true_p = true_prob_from_line(stat_type, blended, sportsbook_line, int(defense_rank))
+        imp_over = implied_from_text(odds_over)
+        implied_for_ev = imp_over if imp_over is not None else None
+        ev_pct = None if implied_for_ev is None else (true_p - implied_for_ev) * 100.0
+        readiness = readiness_badge(int(gp_current), w_new)
+
+        # ------- Compact result row (side-by-side) -------
+        left, right = st.columns([0.62, 0.38])
+
+        with left:
+            st.markdown(
+                f"### **{player_name or 'Player'} — "
+                f"{('Points' if stat_type=='Points Only' else 'PRA')} Line: {sportsbook_line:g}**"
+            )
+            st.markdown(f"**Projected:** {blended:.2f}")
+            st.markdown(f"**Matchup Difficulty:** {tier_emoji} **{tier_label}** (Rank {defense_rank}, {def_pct_txt})")
+            if implied_for_ev is not None:
+                st.markdown(f"**True Probability:** {true_p*100:.2f}% | **Implied Probability:** {implied_for_ev*100:.2f}%")
+                st.markdown(f"**EV:** {ev_symbol(ev_pct)} {ev_pct:+.2f}%")
+            else:
+                st.markdown(f"**True Probability:** {true_p*100:.2f}% | **Implied Probability:** —")
+                st.markdown("**EV:** — (enter Over odds)")
+            st.caption(f"**Blend:** {int(w_old*100)}/{int(w_new*100)} (LY/Current) | **Readiness:** {readiness}")
+
+        with right:
+            st.markdown("#### EV Analysis")
+            true_val = int(round(true_p * 100))
+            st.write(f"True: {true_val:.0f}%")
+            st.progress(min(true_val, 100))
+            if implied_for_ev is not None:
+                imp_val = int(round(implied_for_ev * 100))
+                st.write(f"Implied: {imp_val:.0f}%")
+                st.progress(min(imp_val, 100))
+            else:
+                st.write("Implied: —")
+                st.progress(0)
+
+        # ------- Alt line full analysis -------
+        if alt_line and alt_line > 0:
+            alt_true = true_prob_from_line(stat_type, blended, alt_line, int(defense_rank))
+            alt_imp  = implied_from_text(alt_odds)
+            alt_ev   = None if alt_imp is None else (alt_true - alt_imp) * 100.0
+            st.markdown("---")
+            st.markdown(f"**Alt Line {alt_line:g}:**  "
+                        f"True {alt_true*100:.2f}%"
+                        + (f" | Implied {alt_imp*100:.2f}% | EV {ev_symbol(alt_ev)} {alt_ev:+.2f}%" if alt_imp is not None else "")
+                        + (f"  *(Odds {alt_odds})*" if alt_odds else ""))
+            alt_c1, alt_c2 = st.columns([1,1])
+            with alt_c1:
+                st.write(f"True: {alt_true*100:.1f}%")
+                st.progress(min(int(round(alt_true*100)), 100))
+            with alt_c2:
+                if alt_imp is not None:
+                    st.write(f"Implied: {alt_imp*100:.1f}%")
+                    st.progress(min(int(round(alt_imp*100)), 100))
+                else:
+                    st.write("Implied: —")
+                    st.progress(0)
+
+        # Row for boards & buttons
+        row = {
+            "Player": player_name or "Player",
+            "Type": "Points" if stat_type == "Points Only" else "PRA",
+            "Line": float(sportsbook_line),
+            "Proj": round(blended, 2),
+            "TrueFrac": float(true_p),
+            "OverOdds": odds_over,
+            "UnderOdds": odds_under,
+            "Opponent": opponent,
+            "DefenseRank": int(defense_rank),
+            "MatchupTier": f"{tier_emoji} {tier_label} ({def_pct_txt})",
+            "Blend": f"{int(w_old*100)}/{int(w_new*100)}",
+            "Readiness": readiness,
+        }
+        st.session_state.last_result_nba = row
+        st.session_state.nba_board.append(row)
+
+        # ------- 3 buttons (functional) -------
+        b1, b2, b3 = st.columns(3)
+        with b1:
+            if st.button("💾 Save Play (NBA)", use_container_width=True):
+                board("nba_saved_plays").append(row)
+                st.success("✅ Saved play to NBA board.")
+        with b2:
+            if st.button("🌍 Add Over to Global Parlay (NBA)", use_container_width=True):
+                try:
+                    odds_val = parse_american(row["OverOdds"])
+                    try:
+                        add_to_global_parlay("NBA",
+                                             f"{row['Player']} Over {row['Line']} ({row['Type']})",
+                                             odds_val, float(row["TrueFrac"]),
+                                             game=parlay_engine.game_tag(team, opponent), team=team)
+                        st.success("✅ Added Over leg to Global Parlay.")
+                    except NameError:
+                        st.warning("Global parlay function not found: add_to_global_parlay.")
+                except Exception:
+                    st.warning("Could not parse Over odds.")
+        with b3:
+            if st.button("🌍 Add Under to Global Parlay (NBA)", use_container_width=True):
+                try:
+                    odds_val = parse_american(row["UnderOdds"])
+                    try:
+                        add_to_global_parlay("NBA",
+                                             f"{row['Player']} Under {row['Line']} ({row['Type']})",
+                                             odds_val, 1.0 - float(row["TrueFrac"]),
+                                             game=parlay_engine.game_tag(team, opponent), team=team)
+                        st.success("✅ Added Under leg to Global Parlay.")
+                    except NameError:
+                        st.warning("Global parlay function not found: add_to_global_parlay.")
+                except Exception:
+                    st.warning("Could not parse Under odds.")
+
+    # ---------------- Board (collapsed) ----------------
+    st.markdown("---")
+    profiling.section("board")
+    with st.expander("📈 Top Player Board (NBA)", expanded=False):
+        if st.session_state.nba_board:
+            import pandas as pd
+            st.dataframe(pd.DataFrame(list(st.session_state.nba_board)), use_container_width=True,
+                         column_config={"TrueFrac": st.column_config.NumberColumn("True %", format="percent")})
+            st.caption(f"Latest result per player, type and line (up to {st.session_state.nba_board.limit}).")
+        else:
+            st.caption("No results yet — run a simulation to populate the board.")
+
+    # ---------------- Batch roster ----------------
+    profiling.section("batch roster")
+    with st.expander("📂 Score a roster (CSV)", expanded=False):
+        st.caption("One row per player with the form's fields: player, stat_type (PRA / Points Only), base_pts, "
+                   "base_reb, base_ast, recent_avg, gp, pre_games, pre_mpg, lm_profile, lm_custom_pct, def_rank, "
+                   "line, odds_over, odds_under, alt_line, alt_odds. Missing columns take the form's defaults.")
+        roster_file = st.file_uploader("Roster CSV", type=["csv"], key="nba_roster_csv")
+        if roster_file is not None:
+            try:
+                import pandas as pd
+                roster_df = nba_engine.score_roster(pd.read_csv(roster_file))
+                st.dataframe(roster_df, use_container_width=True, hide_index=True)
+            except Exception as e:
+                st.error(f"⚠️ Roster error: {e}")
@@ -0,0 +1,218 @@
+# Moneyball Phil — NFL Props page
+# -----------------------------------------------------
+
+import uuid
+
+import streamlit as st
+
+from moneyball import nfl as nfl_engine, parlay as parlay_engine
+from moneyball.kernels import NFL_RECEPTIONS_SCALE, NFL_TDS_SCALE, logistic_prob, nfl_projection
+from moneyball.records import Play, fmt_pct
+
+from . import profiling
+from .boards import board, paged_table
+from .global_parlay import add_to_global_parlay
+
+
+# =====================================================
+# =============== MODULE: NFL Props ===================
+# =====================================================
+def nfl_app():
+    st.header("🏈 Moneyball Phil: NFL Prop Simulator (v2.5)")
+
+    # ---- Session State ----
+    if "nfl_temp_props" not in st.session_state:
+        st.session_state.nfl_temp_props = []
+
+    # ---- Helpers ----
+    def add_temp_play(player: str, prop: str, true_prob_pct: float, odds: float, group: str, opp: str = ""):
+        st.session_state.nfl_temp_props.append(
+            Play("NFL", prop, odds, true_prob_pct / 100.0, player=player, group=group, opp=opp, id=str(uuid.uuid4())))
+
+    # ---- UI Common Helpers ----
+    def render_temp_save_controls():
+        if not st.session_state.nfl_temp_props:
+            return
+        st.subheader("📝 Save Plays from Latest Simulation")
+        to_save = []
+        for p in st.session_state.nfl_temp_props:
+            col1, col2, col3, col4, col5 = st.columns([4, 2, 2, 2, 2])
+            with col1:
+                st.markdown(f"**{p.player} – {p.market}**  \nTrue: `{fmt_pct(p.true_prob)}` | Odds: `{p.odds}`")
+            with col2:
+                st.markdown(f"EV: `{p.ev_pct}%`")
+            with col3:
+                st.markdown(f"Tier: {p.tier}")
+            with col4:
+                if st.checkbox("Save", key=f"save_{p.id}"):
+                    to_save.append(p)
+            with col5:
+                if st.button("🌍 Add", key=f"add_gl_{p.id}"):
+                    add_to_global_parlay("NFL", p.label, p.odds, p.true_prob, game=parlay_engine.game_tag(p.opp))
+                    st.success("Added to Global Parlay")
+        if st.button("➕ Add Selected to Board"):
+            board("nfl_all_props").extend(to_save)
+            st.session_state.nfl_temp_props = []
+            st.success("Selected plays added to Top Player Board.")
+
+    def render_board():
+        st.markdown("---")
+        st.subheader("📊 Top Player Board (Saved Plays)")
+        saved = board("nfl_all_props")
+        if not saved.total():
+            st.info("No saved plays yet.")
+            return
+
+        selected = paged_table(saved, "nfl_board", {
+            "Player – Prop": lambda p: f"{p.player} – {p.market}",
+            "Group": lambda p: p.group,
+            "True": lambda p: fmt_pct(p.true_prob),
+            "Odds": lambda p: p.odds,
+            "EV": lambda p: "—" if p.ev_pct is None else f"{p.ev_pct}%",
+            "Tier": lambda p: p.tier,
+        }, sorts={"True Prob": ("true_prob", True), "Saved": (None, False), "Player": ("player", False),
+                  "Odds": ("odds", True), "EV": ("ev_pct", True)})
+        c1, c2 = st.columns(2)
+        if c1.button(f"🌍 Add Selected to Global Parlay ({len(selected)})", disabled=not selected, key="nfl_board_add"):
+            priced = [p for p in selected if p.true_prob is not None]
+            for p in priced:
+                add_to_global_parlay("NFL", p.label, p.odds, p.true_prob, game=parlay_engine.game_tag(p.opp))
+            st.success(f"Added {len(priced)} play(s) to Global Parlay")
+        if c2.button(f"🗑️ Delete Selected ({len(selected)})", disabled=not selected, key="nfl_board_del"):
+            saved.remove(*selected)
+            st.rerun()
+
+    def render_ladder(player: str, group: str, ypg, per_game, def_yds, def_per_game, std_line: float, stat_label: str):
+        # Full alt-line ladder around the standard line (every 5 yds, ±50)
+        lo = max(0.5, std_line - 50.0)
+        res = nfl_engine.price_ladder([player or group], group, ypg, per_game, def_yds, def_per_game,
+                                      nfl_engine.yard_ladder(lo, lo + 100.0, 5.0))
+        with st.expander(f"📶 Alt-Line Ladder — {stat_label}", expanded=False):
+            import pandas as pd
+            st.dataframe(pd.DataFrame({"Line": res.lines, "Over %": res.over_pct[0], "Under %": res.under_pct[0]}),
+                         use_container_width=True, hide_index=True)
+
+    # ---- Position Selector ----
+    profiling.section("inputs")
+    position = st.selectbox("Select Position", ["Quarterback", "Wide Receiver", "Running Back"])
+
+    # ---- QB Module ----
+    if position == "Quarterback":
+        st.header("🎯 Quarterback Inputs")
+        name = st.text_input("Quarterback Name", value="")
+        opp = st.text_input("Opponent Team", value="")
+        std_line = st.number_input("Standard Passing Yards Line", value=0.0)
+        over_std = st.number_input("Odds Over (Standard)", value=0.0)
+        under_std = st.number_input("Odds Under (Standard)", value=0.0)
+        alt_line = st.number_input("Alt Over Line", value=0.0)
+        alt_odds = st.number_input("Odds for Alt Over", value=0.0)
+        td_line = st.number_input("Passing TD Line", value=1.5)
+        td_under_odds = st.number_input("Odds for Under TDs", value=0.0)
+        ypg = st.number_input("QB Yards/Game", value=0.0)
+        tds = st.number_input("QB TD/Game", value=0.0)
+        def_yds = st.number_input("Defense Pass Yards Allowed/Game", value=0.0)
+        def_tds = st.number_input("Defense Pass TDs Allowed/Game", value=0.0)
+
+        if st.button("Simulate QB Props"):
+            profiling.section("compute")
+            tier, adj_ypg, adj_tds = nfl_projection("QB", ypg, tds, def_yds, def_tds)
+            st.session_state.nfl_temp_props = []
+            std_prob = logistic_prob(adj_ypg, std_line)
+            alt_prob = logistic_prob(adj_ypg, alt_line)
+            td_prob = logistic_prob(adj_tds, td_line, scale=NFL_TDS_SCALE)
+            under_td_prob = round(100.0 - td_prob, 2)
+            st.info(f"Opponent Defense Tier: **{tier}**")
+            st.success(f"📈 Over {std_line} Pass Yds → {std_prob:.2f}%")
+            st.success(f"📈 Over {alt_line} Alt Pass Yds → {alt_prob:.2f}%")
+            st.success(f"📉 Under {td_line} Pass TDs → {under_td_prob:.2f}%")
+            add_temp_play(name, f"Over {std_line} Pass Yds", std_prob, over_std, "QB", opp)
+            add_temp_play(name, f"Over {alt_line} Alt Pass Yds", alt_prob, alt_odds, "QB", opp)
+            add_temp_play(name, f"Under {td_line} Pass TDs", under_td_prob, td_under_odds, "QB", opp)
+            render_ladder(name, "QB", ypg, tds, def_yds, def_tds, std_line, "Pass Yds")
+
+    # ---- WR Module ----
+    if position == "Wide Receiver":
+        st.header("🎯 Wide Receiver Inputs")
+        name = st.text_input("Wide Receiver Name", value="")
+        opp = st.text_input("Opponent Team", value="")
+        std_line = st.number_input("Standard Receiving Yards Line", value=0.0)
+        over_std = st.number_input("Odds Over (Standard)", value=0.0)
+        under_std = st.number_input("Odds Under (Standard)", value=0.0)
+        alt_line = st.number_input("Alt Over Line", value=0.0)
+        alt_odds = st.number_input("Odds for Alt Over", value=0.0)
+        rec_line = st.number_input("Receptions Line", value=0.0)
+        rec_over_odds = st.number_input("Odds for Over Receptions", value=0.0)
+        rec_under_odds = st.number_input("Odds for Under Receptions", value=0.0)
+        ypg = st.number_input("WR Yards/Game", value=0.0)
+        rpg = st.number_input("WR Receptions/Game", value=0.0)
+        def_yds = st.number_input("Defense WR Yards Allowed/Game", value=0.0)
+        def_rec = st.number_input("Defense WR Receptions Allowed/Game", value=0.0)
+
+        if st.button("Simulate WR Props"):
+            profiling.section("compute")
+            # --- Scale production by defense strength (league baselines), then tier adjustments ---
+            tier, adj_ypg, avg_rpg = nfl_projection("WR", ypg, rpg, def_yds, def_rec)
+
+            # --- Run logistic probability simulations ---
+            st.session_state.nfl_temp_props = []
+            std_prob = logistic_prob(adj_ypg, std_line)
+            alt_prob = logistic_prob(adj_ypg, alt_line)
+            rec_prob = logistic_prob(avg_rpg, rec_line, scale=NFL_RECEPTIONS_SCALE)
+
+            # --- Display results ---
+            st.info(f"Opponent Defense Tier: **{tier}**")
+            st.success(f"📈 Over {std_line} Rec Yds → {std_prob:.2f}%")
+            st.success(f"📈 Over {alt_line} Alt Rec Yds → {alt_prob:.2f}%")
+            st.success(f"🎯 Over {rec_line} Receptions → {rec_prob:.2f}%")
+            st.success(f"📉 Under {rec_line} Receptions → {round(100 - rec_prob, 2):.2f}%")
+
+            # --- Save props to temporary play board ---
+            add_temp_play(name, f"Over {std_line} Rec Yds", std_prob, over_std, "WR", opp)
+            add_temp_play(name, f"Under {std_line} Rec Yds", round(100 - std_prob, 2), under_std, "WR", opp)
+            add_temp_play(name, f"Over {alt_line} Alt Rec Yds", alt_prob, alt_odds, "WR", opp)
+            add_temp_play(name, f"Over {rec_line} Receptions", rec_prob, rec_over_odds, "WR", opp)
+            add_temp_play(name, f"Under {rec_line} Receptions", round(100 - rec_prob, 2), rec_under_odds, "WR", opp)
+            render_ladder(name, "WR", ypg, rpg, def_yds, def_rec, std_line, "Rec Yds")
+
+    # ---- RB Module ----
+    if position == "Running Back":
+        st.header("🎯 Running Back Inputs")
+        name = st.text_input("Running Back Name", value="")
+        opp = st.text_input("Opponent Team", value="")
+        std_line = st.number_input("Standard Rushing Yards Line", value=0.0)
+        over_std = st.number_input("Odds Over (Standard)", value=0.0)
+        under_std = st.number_input("Odds Under (Standard)", value=0.0)
+        alt_line = st.number_input("Alt Over Line", value=0.0)
+        alt_odds = st.number_input("Odds for Alt Over", value=0.0)
+        rec_line = st.number_input("Receptions Line", value=0.0)
+        rec_over_odds = st.number_input("Odds for Over Receptions", value=0.0)
+        rec_under_odds = st.number_input("Odds for Under Receptions", value=0.0)
+        ypg = st.number_input("RB Yards/Game", value=0.0)
+        rpg = st.number_input("RB Receptions/Game", value=0.0)
+        def_yds = st.number_input("Defense Rush Yards Allowed/Game", value=0.0)
+        def_rec = st.number_input("Defense RB Receptions Allowed/Game", value=0.0)
+
+        if st.button("Simulate RB Props"):
+            profiling.section("compute")
+            tier, adj_ypg, avg_rpg = nfl_projection("RB", ypg, rpg, def_yds, def_rec)
+            st.session_state.nfl_temp_props = []
+            std_prob = logistic_prob(adj_ypg, std_line)
+            alt_prob = logistic_prob(adj_ypg, alt_line)
+            rec_prob = logistic_prob(avg_rpg, rec_line, scale=NFL_RECEPTIONS_SCALE)
+            st.info(f"Opponent Defense Tier: **{tier}**")
+            st.success(f"📈 Over {std_line} Rush Yds → {std_prob:.2f}%")
+            st.success(f"📈 Over {alt_line} Alt Rush Yds → {alt_prob:.2f}%")
+            st.success(f"🎯 Over {rec_line} Receptions → {rec_prob:.2f}%")
+            st.success(f"📉 Under {rec_line} Receptions → {round(100-rec_prob,2):.2f}%")
+            add_temp_play(name, f"Over {std_line} Rush Yds", std_prob, over_std, "RB", opp)
+            add_temp_play(name, f"Under {std_line} Rush Yds", round(100-std_prob,2), under_std, "RB", opp)
+            add_temp_play(name, f"Over {alt_line} Alt Rush Yds", alt_prob, alt_odds, "RB", opp)
+            add_temp_play(name, f"Over {rec_line} Receptions", rec_prob, rec_over_odds, "RB", opp)
+            add_temp_play(name, f"Under {rec_line} Receptions", round(100-rec_prob,2), rec_under_odds, "RB", opp)
+            render_ladder(name, "RB", ypg, rpg, def_yds, def_rec, std_line, "Rush Yds")
+
+    # Render lists + global add buttons
+    profiling.section("save controls")
+    render_temp_save_controls()
+    profiling.section("board")
+    render_board()
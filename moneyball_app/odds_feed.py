@@ -0,0 +1,136 @@
+# Moneyball Phil — Odds feed (sidebar import + page lookups)
+# -----------------------------------------------------
+# One moneyball.odds_feed.OddsTable per process, filled in the sidebar
+# from a local snapshot file or by fetching a feed URL
+# (moneyball.odds_fetch). Pages draw a feed_picker() next to their
+# odds inputs: pick an event, press Fill, and the page's callback writes
+# the looked-up prices into its own input keys. Nothing is drawn until a
+# snapshot has been imported, so the pages look as before without one.
+#
+# Re-importing re-prices what is already priced, but only the markets
+# whose prices moved: saved soccer bets in the store right away, and
+# session-held results (saved matches, the ATS table) on their next
+# rerun via changed_pairs().
+
+from typing import Callable, Dict, Iterable, List, Optional
+
+import streamlit as st
+
+from moneyball.odds import decimal_to_american
+from moneyball.odds_feed import OddsTable, Quote, norm
+from moneyball.odds_fetch import FetchError, fetch_snapshot
+
+from .boards import board
+
+BEST = "Best available"
+
+
+@st.cache_resource(show_spinner=False)
+def get_odds_table() -> OddsTable:
+    return OddsTable()
+
+
+def price(event: str, market: str, line: Optional[float] = None) -> Optional[Quote]:
+    """The feed quote for a market from the book chosen in the sidebar (or the best)."""
+    book = st.session_state.get("odds_feed_book", BEST)
+    return get_odds_table().lookup(event, market, line, None if book == BEST else book)
+
+
+def american_text(q: Quote) -> str:
+    """The quote as American odds text ("+105", "-120") for inputs that only take American."""
+    if q.price.startswith(("+", "-")):
+        return q.price
+    return f"{decimal_to_american(q.dec):+d}"
+
+
+def changed_pairs(event: str, markets: Iterable[str], since: int) -> List[str]:
+    """The ``markets`` of ``event`` whose prices moved after import ``since``."""
+    changed = get_odds_table().changed_since(since)
+    return [m for m in markets if (norm(event), norm(m)) in changed]
+
+
+# ---------------- Sidebar ----------------
+def _reprice_saved_bets(pairs) -> int:
+    bets = board("saved_bets")
+    n = 0
+    for b in bets:
+        if (norm(b.get("match_label")), norm(b.get("market"))) not in pairs:
+            continue
+        q = price(b["match_label"], b["market"])
+        if q is not None and q.dec != float(b["dec"]):
+            b.update(dec=q.dec, implied_p=q.implied, odds_str=q.price)
+            bets.update(b)
+            n += 1
+    return n
+
+
+def _report(result, errors):
+    repriced = _reprice_saved_bets(result.pairs)
+    st.success(f"{result.rows:,} quotes read: {result.added} new, {result.changed} moved, "
+               f"{result.removed} dropped · {repriced} saved bet(s) re-priced")
+    for err in errors[:5]:
+        st.caption(f"⚠️ {err}")
+    if len(errors) > 5:
+        st.caption(f"… and {len(errors) - 5} more skipped rows")
+
+
+def render_sidebar():
+    table = get_odds_table()
+    with st.sidebar.expander("📥 Odds feed", expanded=False):
+        snap = st.file_uploader("Snapshot (CSV / JSONL: book, event, market, line, price)",
+                                type=["csv", "jsonl", "json", "ndjson"], key="odds_feed_file")
+        path = st.text_input("…or a local file path", key="odds_feed_path")
+        if st.button("Import snapshot", key="odds_feed_import", disabled=snap is None and not path.strip()):
+            try:
+                result = table.load(snap if snap is not None else path.strip())
+            except (OSError, UnicodeDecodeError, ValueError) as e:
+                st.error(f"Import failed: {e}")
+            else:
+                _report(result, result.errors)
+        url = st.text_input("…or fetch every market from a feed URL", key="odds_feed_url",
+                            placeholder="http://127.0.0.1:8765")
+        if st.button("Fetch feed", key="odds_feed_fetch", disabled=not url.strip()):
+            try:
+                with st.spinner("Fetching markets…"):
+                    fetched = fetch_snapshot(url.strip())
+            except (FetchError, OSError, ValueError) as e:
+                st.error(f"Fetch failed: {e}")
+            else:
+                result = table.load_rows(fetched.rows, source=fetched.url)
+                st.caption(f"{fetched.markets:,} markets in {fetched.seconds:.2f}s "
+                           f"({fetched.requests:,} requests, {fetched.retries} retries)")
+                _report(result, fetched.errors + result.errors)
+        if len(table):
+            st.selectbox("Price from", [BEST] + table.books(), key="odds_feed_book")
+            st.caption(f"{len(table):,} quotes · {len(table.events()):,} events · "
+                       f"import #{table.version}" + (f" ({table.source})" if table.source else ""))
+
+
+# ---------------- Page helpers ----------------
+def _fill(key: str, on_fill: Callable[[str], Dict[str, object]]):
+    event = st.session_state.get(f"{key}_feed_event")
+    values = on_fill(event) if event else {}
+    for k, v in values.items():
+        st.session_state[k] = v
+    st.session_state[f"{key}_feed_note"] = (f"Filled {len(values)} field(s) from the feed for {event}." if values
+                                            else f"No feed prices for {event}.")
+
+
+def feed_picker(key: str, markets: Iterable[str], on_fill: Callable[[str], Dict[str, object]]):
+    """
+    Event picker + Fill button for a page's odds inputs. ``on_fill(event)``
+    runs in the button callback (before the inputs are drawn) and returns
+    {session_state key: value} to write.
+    """
+    table = get_odds_table()
+    if not len(table):
+        return
+    events = table.events(markets)
+    if not events:
+        return
+    c1, c2 = st.columns([3, 1])
+    c1.selectbox("📥 Odds feed event", events, key=f"{key}_feed_event")
+    c2.button("Fill from feed", key=f"{key}_feed_fill", on_click=_fill, args=(key, on_fill))
+    note = st.session_state.pop(f"{key}_feed_note", None)
+    if note:
+        st.caption(note)
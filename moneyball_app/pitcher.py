@@ -0,0 +1,329 @@
+# Moneyball Phil — Pitcher ER & K page
+# -----------------------------------------------------
+
+import streamlit as st
+
+from moneyball import pitcher as pitcher_engine
+from moneyball.odds import american_to_prob, parse_american
+from moneyball.records import Play, fmt_pct
+from moneyball.kernels import (
+    get_tier_prob, expected_bf, expected_innings, er_lambda, BALLPARK_IP_ADJ, parse_pct,
+    estimate_pK,
+)
+
+from . import odds_feed, profiling
+from .boards import board, paged_table
+from .global_parlay import add_to_global_parlay
+
+
+# =====================================================
+# ======= MODULE: Pitcher ER & K Simulator ============
+# (Final: Explanations + True Prob Tiers + Delete Support + xERA + WHIP restored)
+# =====================================================
+def pitcher_app():
+    st.header("👨‍⚾ Pitcher Earned Runs & Strikeouts Simulator")
+
+    # --- Init session state ---
+    if "er_result" not in st.session_state: 
+        st.session_state.er_result = None
+    if "k_result" not in st.session_state: 
+        st.session_state.k_result = None
+    if "er_line" not in st.session_state:
+        st.session_state.er_line = "2.5"
+
+    # --- UI Tabs ---
+    tabs = st.tabs(["Earned Runs (ER)", "Strikeouts (K)"])
+
+    # ---------------------------
+    # Tab 1: Earned Runs
+    # ---------------------------
+    with tabs[0]:
+        profiling.section("ER inputs")
+
+        def er_from_feed(event: str):
+            # The ER line already entered if the feed quotes it, else the feed's main line
+            try:
+                line = float(st.session_state.get("er_line") or "")
+            except ValueError:
+                line = None
+            q = odds_feed.price(event, "er_under", line) if line is not None else None
+            if q is None:
+                q = odds_feed.price(event, "er_under")
+            if q is None:
+                return {}
+            values = {"er_pitcher": event, "er_under_odds": odds_feed.american_text(q)}
+            if q.line is not None:
+                values["er_line"] = f"{q.line:g}"
+            return values
+
+        odds_feed.feed_picker("er", ("er_under",), er_from_feed)
+        with st.form("er_form_glob"):
+            c1, c2 = st.columns(2)
+            with c1:
+                er_pitcher = st.text_input("Pitcher Name", key="er_pitcher")
+                er_era = st.text_input("ERA", key="er_era")
+                er_total_ip = st.text_input("Total Innings Pitched", key="er_total_ip")
+                er_games = st.number_input("Games Started", value=15, step=1, key="er_games")
+                er_last3 = st.text_input("Last 3 Game IP (e.g. 5.2,6.1,5.0)", key="er_last3")
+                er_xera = st.text_input("xERA (optional, overrides ERA)", key="er_xera")
+                er_whip = st.text_input("WHIP (optional)", key="er_whip")
+            with c2:
+                er_oppops = st.text_input("Opponent OPS", key="er_oppops")
+                er_lgops = st.text_input("League Average OPS", key="er_lgops")
+                er_ballpark = st.selectbox("Ballpark Factor", ["Neutral","Pitcher-Friendly","Hitter-Friendly"], key="er_ballpark")
+                er_line = st.text_input("ER Line (Under, e.g. 2.5)", key="er_line")
+                er_under_odds = st.text_input("Sportsbook Odds (Under ER)", key="er_under_odds")
+            simulate_er = st.form_submit_button("▶ Simulate Player")
+            reset_er = st.form_submit_button("🧹 Reset Form")
+
+        if reset_er:
+            st.session_state.er_result = None
+            st.experimental_rerun()
+
+        profiling.section("ER compute")
+        if simulate_er:
+            try:
+                pitcher_name   = er_pitcher or "Pitcher"
+                era            = float(er_era)
+                total_ip       = float(er_total_ip)
+                games_started  = int(er_games)
+                last_3_ip      = er_last3
+                xera_txt       = er_xera.strip()
+                whip_txt       = er_whip.strip()
+                opponent_ops   = float(er_oppops)
+                league_avg_ops = float(er_lgops)
+                ballpark       = er_ballpark
+                under_odds     = parse_american(er_under_odds)
+                er_line_v      = float(er_line)
+                if er_line_v < 0:
+                    raise ValueError("ER line must be ≥ 0")
+
+                xera = float(xera_txt) if xera_txt else 0.0
+                whip = float(whip_txt) if whip_txt else 0.0
+
+                expected_ip = expected_innings(total_ip, games_started, last_3_ip, BALLPARK_IP_ADJ[ballpark])
+            except Exception:
+                st.error("Enter valid numerics for ERA/IP/OPS/xERA/WHIP and odds.")
+                st.stop()
+
+            adjusted_era, lam_er = er_lambda(era, xera, opponent_ops, league_avg_ops, expected_ip)  # 👈 mean earned runs
+
+            # One Poisson PMF prices the entered line and the whole 0.5–4.5 ladder
+            ladder = pitcher_engine.er_ladder(lam_er, [er_line_v, *pitcher_engine.ER_LINES], pitchers=[pitcher_name],
+                                              expected_ip=[expected_ip], adjusted_era=[adjusted_era])
+            true_prob = round(float(ladder.under_pct[0, 0]), 2)
+            implied_prob = american_to_prob(under_odds) * 100
+            ev = round(true_prob - implied_prob, 2)
+            tier = get_tier_prob(true_prob)
+
+            warning_msg = "⚠️ ERA may be misleading due to high WHIP. Consider xERA." if (whip > 1.45 and era < 3.20 and xera == 0) else ""
+
+            st.session_state.er_result = {
+                "pitcher": pitcher_name, "expected_ip": expected_ip, "line": er_line_v,
+                "proj_er": lam_er,  # 👈 store mean ER
+                "true_prob": true_prob, "implied_prob": implied_prob,
+                "odds": under_odds, "ev": ev, "tier": tier, "warning": warning_msg,
+                "ladder": ladder.to_frame().iloc[1:][["Line", "Under %", "Over %"]].to_dict("records"),
+            }
+
+        profiling.section("ER result")
+        er = st.session_state.er_result
+        if er:
+            market = f"U{er['line']:g} ER"
+            st.subheader("📊 Earned Runs Projection Explanation")
+            st.markdown(f"- **Expected IP:** {er['expected_ip']}")
+            st.markdown(f"- **Projected Earned Runs (mean):** {er['proj_er']}")
+            st.markdown(f"- **True Probability {market}:** {er['true_prob']}%")
+            st.markdown(f"- **Implied Probability:** {er['implied_prob']:.2f}%")
+            st.markdown(f"- **EV:** {er['ev']:.2f}%")
+            st.markdown(f"- **Tier:** {er['tier']}")
+            if er["warning"]: st.warning(er["warning"])
+            st.success(f"{er['pitcher']} — {market} True {er['true_prob']:.2f}% | Odds {int(er['odds'])}")
+            if er.get("ladder"):
+                with st.expander("📈 ER Line Ladder (0.5–4.5)", expanded=False):
+                    import pandas as pd
+                    st.dataframe(pd.DataFrame(er["ladder"]), use_container_width=True, hide_index=True)
+
+            c1, c2 = st.columns(2)
+            with c1:
+                if st.button(f"💾 Save to Board: {market}"):
+                    board("player_board").append(Play("MLB", "ER", er["odds"], er["true_prob"]/100,
+                                                      description=f"{er['pitcher']} {market}", ev_pct=er["ev"], tier=er["tier"]))
+                    st.success("Saved.")
+            with c2:
+                if st.button(f"🌍 Add to Global Parlay: {market}"):
+                    add_to_global_parlay("Pitcher", f"{er['pitcher']} {market}", er["odds"], er["true_prob"]/100)
+                    st.success("Added to Global Parlay")
+
+        profiling.section("ER slate")
+        with st.expander("📂 Price a slate of starters (CSV)", expanded=False):
+            st.caption("One row per starter with the form's fields: pitcher, era, xera, opp_ops, league_ops, "
+                       "total_ip, games_started, last3_ip (e.g. \"5.2,6.1,5.0\"), ballpark. Every starter's "
+                       "0.5–4.5 ER ladder is priced in one pass.")
+            er_slate_file = st.file_uploader("Starters CSV", type=["csv"], key="er_slate_csv")
+            if er_slate_file is not None:
+                try:
+                    import pandas as pd
+                    er_slate_df = pitcher_engine.score_er_slate(pd.read_csv(er_slate_file, dtype={"last3_ip": str}))
+                    st.dataframe(er_slate_df, use_container_width=True, hide_index=True)
+                except Exception as e:
+                    st.error(f"⚠️ Slate error: {e}")
+
+    # ---------------------------
+    # Tab 2: Strikeouts
+    # ---------------------------
+    with tabs[1]:
+        profiling.section("K inputs")
+
+        def k_from_feed(event: str):
+            # The K line already entered if the feed quotes it, else the feed's main line
+            try:
+                line = float(st.session_state.get("k_line") or "")
+            except ValueError:
+                line = None
+            over = odds_feed.price(event, "k_over", line) if line is not None else None
+            if over is None:
+                over = odds_feed.price(event, "k_over")
+            if over is None:
+                return {}
+            values = {"k_pitcher_name": event, "k_line": f"{over.line:g}", "k_odds_over": odds_feed.american_text(over)}
+            under = odds_feed.price(event, "k_under", over.line)
+            if under is not None:
+                values["k_odds_under"] = odds_feed.american_text(under)
+            return values
+
+        odds_feed.feed_picker("k", ("k_over", "k_under"), k_from_feed)
+        with st.form("k_form_glob"):
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                k_pitcher_name = st.text_input("Pitcher Name (K)", key="k_pitcher_name")
+                k_total_ip = st.text_input("Total Innings Pitched (season)", key="k_total_ip")
+                k_games_started = st.number_input("Games Started (season)", value=17, step=1, key="k_games_started")
+                k_last3 = st.text_input("Last 3 Game IP (e.g., 5.2,6.1,5.0)", key="k_last3")
+            with c2:
+                k_pct = st.text_input("Pitcher K% (24.3 or 0.243)", key="k_pct")
+                k_opp_pct = st.text_input("Opponent K% vs Hand (23.0 or 0.23)", key="k_opp_pct")
+                k_line = st.text_input("K Line (e.g., 5.5)", key="k_line")
+            with c3:
+                k_odds_over = st.text_input("Over Odds (American)", key="k_odds_over")
+                k_odds_under = st.text_input("Under Odds (American)", key="k_odds_under")
+                k_park = st.text_input("Park Factor (K)", value="1.00", key="k_park")
+                k_ump = st.text_input("Ump Factor (K)", value="1.00", key="k_ump")
+                k_recent = st.text_input("Recent Form Factor", value="1.00", key="k_recent")
+            calc_k = st.form_submit_button("▶ Calculate Strikeouts")
+            reset_k = st.form_submit_button("🧹 Reset Form")
+
+        if reset_k:
+            st.session_state.k_result = None
+            st.experimental_rerun()
+
+        profiling.section("K compute")
+        if calc_k:
+            try:
+                k_pitcher = k_pitcher_name or "Pitcher"
+                total_ip_k = float(k_total_ip); games_started_k = int(k_games_started)
+                last_3_ip_k = k_last3
+                pitcher_k_pct = parse_pct(k_pct); opp_k_vs_hand = parse_pct(k_opp_pct)
+                k_line_v = float(k_line)
+                odds_over_f = parse_american(k_odds_over)
+                odds_under_f = parse_american(k_odds_under)
+                park_factor = float(k_park); ump_factor = float(k_ump); recent_factor = float(k_recent)
+
+                expected_ip_k = expected_innings(total_ip_k, games_started_k, last_3_ip_k)
+            except Exception as e:
+                st.error(f"Bad input: {e}")
+                st.stop()
+
+            pK   = estimate_pK(pitcher_k_pct, opp_k_vs_hand, park_factor, ump_factor, recent_factor)
+            n_bf = expected_bf(expected_ip_k)
+            expected_ks = round(n_bf * pK, 2)
+
+            # One PMF prices the entered line and the whole 2.5–10.5 ladder
+            ladder = pitcher_engine.k_ladder(n_bf, pK, [k_line_v, *pitcher_engine.K_LINES],
+                                             pitchers=[k_pitcher], expected_ip=[expected_ip_k])
+            p_under = float(ladder.under_pct[0, 0])
+            p_over  = float(ladder.over_pct[0, 0])
+
+            implied_over = american_to_prob(odds_over_f) * 100
+            implied_under = american_to_prob(odds_under_f) * 100
+            ev_over = round(p_over - implied_over, 2)
+            ev_under = round(p_under - implied_under, 2)
+            tier_over = get_tier_prob(p_over)
+            tier_under = get_tier_prob(p_under)
+
+            st.session_state.k_result = {
+                "pitcher": k_pitcher, "k_line": k_line_v, "expected_ip": expected_ip_k,
+                "n_bf": n_bf, "pK": round(pK,3), "expected_ks": expected_ks,
+                "p_over": p_over, "p_under": p_under,
+                "odds_over": odds_over_f, "odds_under": odds_under_f,
+                "ev_over": ev_over, "ev_under": ev_under,
+                "tier_over": tier_over, "tier_under": tier_under,
+                "ladder": ladder.to_frame().iloc[1:][["Line", "Over %", "Under %"]].to_dict("records"),
+            }
+
+        profiling.section("K result")
+        kr = st.session_state.k_result
+        if kr:
+            st.subheader("📊 Strikeout Simulation Results")
+            st.markdown(f"- **Expected IP:** {kr['expected_ip']} innings")
+            st.markdown(f"- **Estimated Batters Faced (BF):** {kr['n_bf']} (PA/IP = 4.3)")
+            st.markdown(f"- **Per-PA Strikeout Probability (pK):** {kr['pK']}")
+            st.markdown(f"- **Expected Strikeouts (mean Ks):** {kr['expected_ks']}")
+            st.markdown(f"- **K Line:** {kr['k_line']}")
+            st.markdown(f"- **True Over %:** {kr['p_over']:.2f}% (Implied {american_to_prob(kr['odds_over'])*100:.2f}%) | EV {kr['ev_over']}% | {kr['tier_over']}")
+            st.markdown(f"- **True Under %:** {kr['p_under']:.2f}% (Implied {american_to_prob(kr['odds_under'])*100:.2f}%) | EV {kr['ev_under']}% | {kr['tier_under']}")
+            if kr.get("ladder"):
+                with st.expander("📈 K Line Ladder (2.5–10.5)", expanded=False):
+                    import pandas as pd
+                    st.dataframe(pd.DataFrame(kr["ladder"]), use_container_width=True, hide_index=True)
+
+            c1, c2 = st.columns(2)
+            with c1:
+                if st.button("💾 Save to Board: Over K"):
+                    board("player_board").append(Play("MLB", "K", kr["odds_over"], kr["p_over"]/100,
+                                                      description=f"{kr['pitcher']} O{kr['k_line']} K",
+                                                      ev_pct=kr["ev_over"], tier=kr["tier_over"]))
+                    st.success("Saved.")
+            with c2:
+                if st.button("💾 Save to Board: Under K"):
+                    board("player_board").append(Play("MLB", "K", kr["odds_under"], kr["p_under"]/100,
+                                                      description=f"{kr['pitcher']} U{kr['k_line']} K",
+                                                      ev_pct=kr["ev_under"], tier=kr["tier_under"]))
+                    st.success("Saved.")
+
+            d1, d2 = st.columns(2)
+            with d1:
+                if st.button("🌍 Add to Global Parlay: Over K"):
+                    add_to_global_parlay("Pitcher", f"{kr['pitcher']} O{kr['k_line']} K", kr["odds_over"], kr["p_over"]/100)
+                    st.success("Added Over leg.")
+            with d2:
+                if st.button("🌍 Add to Global Parlay: Under K"):
+                    add_to_global_parlay("Pitcher", f"{kr['pitcher']} U{kr['k_line']} K", kr["odds_under"], kr["p_under"]/100)
+                    st.success("Added Under leg.")
+
+    # ================= Saved Pitcher Board =================
+    st.markdown("---")
+    profiling.section("board")
+    st.header("📌 Saved Pitcher Board")
+    player_board = board("player_board")
+    if not player_board.total():
+        st.info("No pitcher props saved yet.")
+    else:
+        selected = paged_table(player_board, "pitch_board", {
+            "Market": lambda p: p.market,
+            "Description": lambda p: p.description,
+            "Odds": lambda p: p.odds,
+            "True Prob": lambda p: fmt_pct(p.true_prob),
+            "EV": lambda p: "—" if p.ev_pct is None else f"{p.ev_pct:.2f}%",
+            "Tier": lambda p: p.tier,
+        }, sorts={"Saved": (None, False), "True Prob": ("true_prob", True), "EV": ("ev_pct", True),
+                  "Market": ("market", False)}, default_desc=False)
+        b1, b2 = st.columns(2)
+        if b1.button(f"🌍 Add Selected to Global Parlay ({len(selected)})", disabled=not selected, key="pitch_board_add"):
+            priced = [p for p in selected if p.true_prob is not None]
+            for p in priced:
+                add_to_global_parlay("Pitcher", p.description, p.odds, p.true_prob)
+            st.success(f"Added {len(priced)} leg(s).")
+        if b2.button(f"🗑️ Delete Selected ({len(selected)})", disabled=not selected, key="pitch_board_del"):
+            player_board.remove(*selected)
+            st.rerun()
@@ -0,0 +1,209 @@
+# Moneyball Phil — Rerun profiling
+# -----------------------------------------------------
+# Opt-in timing of each script rerun: a tree of spans (the page, its
+# sections, shared renderers) with wall time and the number of widgets
+# created inside each. The app script starts and ends the run and times
+# each page; pages mark their sections:
+#
+#   with profiling.span("store flush"): ...               # timed block
+#   @profiling.timed("board")                               # timed function
+#   profiling.section("inputs") ... profiling.section("compute") ...
+#
+# section() ends the previous section of the enclosing span and starts the
+# next, so page bodies don't need re-indenting; open sections close with
+# their span. When profiling is off every call is a no-op.
+#
+# Turn it on from the sidebar toggle, or for every session with
+# MONEYBALL_PROFILE=1 (load tests). Runs can be appended to a JSONL trace
+# (MONEYBALL_TRACE, default ./moneyball_trace.jsonl), one object per rerun
+# with flattened "page/section" span paths for offline aggregation.
+
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+from typing import List, Optional
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+ENV_FLAG = "MONEYBALL_PROFILE"
+TRACE_ENV = "MONEYBALL_TRACE"
+DEFAULT_TRACE = "moneyball_trace.jsonl"
+
+_local = threading.local()          # one script thread per session rerun
+_trace_lock = threading.Lock()
+
+
+def forced_on() -> bool:
+    return os.environ.get(ENV_FLAG, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def trace_path() -> str:
+    return os.environ.get(TRACE_ENV) or DEFAULT_TRACE
+
+
+def _widget_count() -> Optional[int]:
+    # Streamlit keeps the ids of widgets registered this run on the script
+    # context; the attribute moved between versions and is not public API.
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    ids = getattr(getattr(ctx, "shared", None), "widget_ids_this_run", None)
+    if ids is None:
+        ids = getattr(ctx, "widget_ids_this_run", None)
+    if hasattr(ids, "snapshot"):        # thread-safe set wrapper without __len__
+        ids = ids.snapshot()
+    try:
+        return len(ids)
+    except TypeError:
+        return None
+
+
+class _Span:
+    __slots__ = ("name", "t0", "ms", "w0", "widgets", "children", "is_section")
+
+    def __init__(self, name: str, is_section: bool = False):
+        self.name = name
+        self.is_section = is_section
+        self.children: List["_Span"] = []
+        self.t0 = time.perf_counter()
+        self.w0 = _widget_count()
+        self.ms = 0.0
+        self.widgets = None
+
+    def close(self):
+        self.ms = (time.perf_counter() - self.t0) * 1000.0
+        w1 = _widget_count()
+        self.widgets = None if w1 is None or self.w0 is None else w1 - self.w0
+
+
+class _Run:
+    def __init__(self):
+        self.root = _Span("rerun")
+        self.stack: List[_Span] = [self.root]
+
+    def open(self, name: str, is_section: bool = False) -> _Span:
+        s = _Span(name, is_section)
+        self.stack[-1].children.append(s)
+        self.stack.append(s)
+        return s
+
+    def close_to(self, span: _Span):
+        """Close ``span`` and anything still open inside it."""
+        if span not in self.stack:
+            return
+        while self.stack:
+            top = self.stack.pop()
+            top.close()
+            if top is span:
+                return
+
+
+def _run() -> Optional[_Run]:
+    return getattr(_local, "run", None)
+
+
+class _Timed:
+    __slots__ = ("name", "_span")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._span = None
+
+    def __enter__(self):
+        run = _run()
+        if run is not None:
+            self._span = run.open(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        run = _run()
+        if run is not None and self._span is not None:
+            run.close_to(self._span)
+        self._span = None
+        return False
+
+
+def span(name: str) -> _Timed:
+    """Time a ``with`` block as a child of the current span."""
+    return _Timed(name)
+
+
+def timed(name: str):
+    """Decorator: time every call of the function as a span."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _Timed(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def section(name: str):
+    """End the current section (if any) of the enclosing span and start ``name``."""
+    run = _run()
+    if run is None:
+        return
+    top = run.stack[-1]
+    if top.is_section:
+        run.close_to(top)
+    run.open(name, is_section=True)
+
+
+# ---------------- Run lifecycle (called by the app script) ----------------
+def begin_run(enabled: bool):
+    _local.run = _Run() if enabled else None
+
+
+def _flatten(s: _Span, prefix: str = "", depth: int = 0) -> List[dict]:
+    path = f"{prefix}/{s.name}" if prefix else s.name
+    rows = [{"span": path, "depth": depth, "ms": round(s.ms, 3), "widgets": s.widgets}]
+    for child in s.children:
+        rows.extend(_flatten(child, path, depth + 1))
+    return rows
+
+
+def _append_trace(record: dict):
+    line = json.dumps(record, ensure_ascii=False)
+    with _trace_lock:
+        with open(trace_path(), "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def end_run(page: str):
+    """Close the run, show it in the sidebar, and append it to the trace if asked."""
+    run = _run()
+    _local.run = None
+    if run is None:
+        return
+    run.close_to(run.root)
+    spans = _flatten(run.root)
+
+    with st.sidebar.expander("⏱️ Profile (last rerun)", expanded=True):
+        widgets = run.root.widgets
+        st.caption(f"{page} — {run.root.ms:.1f} ms"
+                   + ("" if widgets is None else f" — {widgets} widgets"))
+        import pandas as pd
+        total = run.root.ms or 1.0
+        st.dataframe(pd.DataFrame([{
+            "Span": "  " * r["depth"] + r["span"].rsplit("/", 1)[-1],
+            "ms": round(r["ms"], 1),
+            "% run": round(100.0 * r["ms"] / total, 1),
+            "Widgets": r["widgets"],
+        } for r in spans]), hide_index=True, use_container_width=True)
+        trace = forced_on() or st.checkbox(f"Append runs to {trace_path()}", key="profile_trace")
+
+    if trace:
+        ctx = get_script_run_ctx()
+        _append_trace({
+            "ts": datetime.datetime.now().isoformat(timespec="milliseconds"),
+            "session": ctx.session_id if ctx is not None else None,
+            "page": page,
+            "total_ms": round(run.root.ms, 3),
+            "widgets": widgets,
+            "spans": spans,
+        })
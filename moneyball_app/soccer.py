@@ -0,0 +1,414 @@
+# Moneyball Phil — Soccer EV page
+# -----------------------------------------------------
+
+import uuid
+
+import streamlit as st
+
+from moneyball import soccer as soccer_engine
+from moneyball.odds import decimal_to_american, parse_odds
+from moneyball.kernels import (
+    roi_per_dollar, soccer_lambdas, market_probs_from_matrix, tier_from_true,
+    tier_from_ev_simple,
+)
+
+from . import odds_feed, profiling
+from .boards import ListSource, board, paged_table
+from .global_parlay import add_to_global_parlay
+
+
+# =========================
+# Soccer EV Module (v3.2) with Global Parlay Button
+# =========================
+
+def soccer_app():
+    from typing import Dict
+    import numpy as np
+
+    # =========================
+    # --------- Utils ---------
+    # =========================
+
+    def pct(x: float) -> str:
+        try:
+            return f"{float(x)*100:.2f}%"
+        except Exception:
+            return "—"
+
+    def is_num(x) -> bool:
+        try:
+            return np.isfinite(float(x))
+        except:
+            return False
+
+    # =========================
+    # ----- Session Setup -----
+    # =========================
+
+    def init_state():
+        st.session_state.setdefault("matches", [])
+
+    def next_id():
+        # Saved bets outlive the session, so ids can't restart at 1 on refresh
+        return uuid.uuid4().hex[:6]
+
+    # =========================
+    # --------- App -----------
+    # =========================
+
+    st.subheader("⚽ Soccer EV App (v3.2)")
+    init_state()
+
+    # ---------------- Inputs ----------------
+    profiling.section("inputs")
+    st.subheader("➕ Add / Compute a Match (Season totals only)")
+
+    if "reset_seed" not in st.session_state:
+        st.session_state["reset_seed"] = 0
+
+    def reset_inputs():
+        st.session_state["reset_seed"] += 1
+        st.rerun()
+
+    seed = st.session_state["reset_seed"]
+
+    def per_match(total_str, games_str):
+        try:
+            total = float(str(total_str).strip())
+            games = float(str(games_str).strip())
+            if games <= 0:
+                return None
+            return total / games
+        except:
+            return None
+
+    # ---- HOME TEAM ----
+    st.markdown("### Home Team — Season Totals")
+    hcol1, hcol2, hcol3 = st.columns(3)
+    with hcol1:
+        home_team = st.text_input("Home Team", value="", key=f"home_team_name_{seed}")
+    with hcol2:
+        home_xg_total  = st.text_input("Home xG (SEASON TOTAL)",  value="", key=f"home_xg_total_{seed}")
+        home_xga_total = st.text_input("Home xGA (SEASON TOTAL)", value="", key=f"home_xga_total_{seed}")
+    with hcol3:
+        home_season_matches = st.text_input("Matches Played (SEASON TOTAL)", value="", key=f"home_matches_total_{seed}")
+
+    _home_xg_for_val = per_match(home_xg_total, home_season_matches)
+    _home_xga_ag_val = per_match(home_xga_total, home_season_matches)
+    home_xg_for = f"{_home_xg_for_val:.3f}" if _home_xg_for_val is not None else ""
+    home_xga_ag = f"{_home_xga_ag_val:.3f}" if _home_xga_ag_val is not None else ""
+    st.caption(f"Home per-match → xG={(_home_xg_for_val or 0):.3f}, xGA={(_home_xga_ag_val or 0):.3f}")
+
+    # ---- AWAY TEAM ----
+    st.markdown("### Away Team — Season Totals")
+    acol1, acol2, acol3 = st.columns(3)
+    with acol1:
+        away_team = st.text_input("Away Team", value="", key=f"away_team_name_{seed}")
+    with acol2:
+        away_xg_total  = st.text_input("Away xG (SEASON TOTAL)",  value="", key=f"away_xg_total_{seed}")
+        away_xga_total = st.text_input("Away xGA (SEASON TOTAL)", value="", key=f"away_xga_total_{seed}")
+    with acol3:
+        away_season_matches = st.text_input("Matches Played (SEASON TOTAL)", value="", key=f"away_matches_total_{seed}")
+
+    _away_xg_for_val = per_match(away_xg_total, away_season_matches)
+    _away_xga_ag_val = per_match(away_xga_total, away_season_matches)
+    away_xg_for = f"{_away_xg_for_val:.3f}" if _away_xg_for_val is not None else ""
+    away_xga_ag = f"{_away_xga_ag_val:.3f}" if _away_xga_ag_val is not None else ""
+    st.caption(f"Away per-match → xG={(_away_xg_for_val or 0):.3f}, xGA={(_away_xga_ag_val or 0):.3f}")
+
+    # ---- ODDS INPUTS ----
+    st.markdown("### Odds (American or Decimal)")
+
+    def fill_from_feed(event: str) -> Dict[str, str]:
+        s = st.session_state["reset_seed"]
+        values = {}
+        if " vs " in event:
+            values[f"home_team_name_{s}"], values[f"away_team_name_{s}"] = (t.strip() for t in event.split(" vs ", 1))
+        for mkt, key in (("O1.5", "odds_o15"), ("O2.5", "odds_o25"), ("BTTS", "odds_btts")):
+            q = odds_feed.price(event, mkt)
+            if q is not None:
+                values[f"{key}_{s}"] = q.price
+        return values
+
+    odds_feed.feed_picker("soccer", ("O1.5", "O2.5", "BTTS"), fill_from_feed)
+    ocol1, ocol2, ocol3 = st.columns(3)
+    with ocol1:
+        odds_o15  = st.text_input("Over 1.5 Odds", value="", key=f"odds_o15_{seed}")
+    with ocol2:
+        odds_o25  = st.text_input("Over 2.5 Odds", value="", key=f"odds_o25_{seed}")
+    with ocol3:
+        odds_btts = st.text_input("BTTS Odds",     value="", key=f"odds_btts_{seed}")
+    dc_rho = st.number_input("Dixon-Coles ρ (low-score correction, 0 = independent Poisson)", min_value=-0.3,
+                             max_value=0.3, value=0.0, step=0.01, key="soccer_dc_rho",
+                             help="Typical fitted values are -0.05 to -0.15 (more 0-0 / 1-1 draws).")
+
+    # ---- Actions ----
+    btn_cols = st.columns([1,1,2])
+    with btn_cols[0]:
+        compute_only = st.button("Compute Only", key=f"btn_compute_only_{seed}")
+    with btn_cols[1]:
+        compute_and_save = st.button("Compute & Save Match", key=f"btn_compute_save_{seed}")
+    with btn_cols[2]:
+        if st.button("Reset Inputs", key=f"btn_reset_inputs_{seed}"):
+            reset_inputs()
+
+    # =========================
+    # ------ Compute Core -----
+    # =========================
+
+    def compute_match(label: str,
+                      home_xg_for_s: str, away_xga_s: str,
+                      away_xg_for_s: str, home_xga_s: str,
+                      odds_dict: Dict[str, str]):
+        fields = {
+            "Home xG For": home_xg_for_s, "Away xGA Against": away_xga_s,
+            "Away xG For": away_xg_for_s, "Home xGA Against": home_xga_s
+        }
+        for name, val in fields.items():
+            if not is_num(val):
+                raise ValueError(f"{name} invalid: '{val}'")
+            if float(val) < 0:
+                raise ValueError(f"{name} cannot be negative.")
+
+        hxf, axga, axf, hxga = float(home_xg_for_s), float(away_xga_s), float(away_xg_for_s), float(home_xga_s)
+        lam_home, lam_away = soccer_lambdas(hxf, axga, axf, hxga)
+
+        M = soccer_engine.goal_matrix(lam_home, lam_away, dc_rho, max_goals=10)
+        probs = market_probs_from_matrix(M)
+
+        imp15, dec15 = parse_odds(odds_dict["O1.5"])
+        imp25, dec25 = parse_odds(odds_dict["O2.5"])
+        impBT, decBT = parse_odds(odds_dict["BTTS"])
+
+        st.markdown(f"### Results for {label}")
+        results = []
+        markets = [
+            ("O1.5", "Over 1.5", imp15, dec15, odds_dict["O1.5"]),
+            ("O2.5", "Over 2.5", imp25, dec25, odds_dict["O2.5"]),
+            ("BTTS", "BTTS",     impBT, decBT, odds_dict["BTTS"]),
+        ]
+        for key, label_mkt, imp, dec, odds_str in markets:
+            true_p = probs[key]
+            ev = roi_per_dollar(true_p, dec)
+            tier, badge = tier_from_true(true_p, key)
+            results.append({
+                "key": key, "label": label_mkt, "true": true_p, "imp": imp,
+                "ev": ev, "dec": dec, "odds_str": odds_str, "tier": tier, "badge": badge
+            })
+            st.write(f"{label_mkt}: True {pct(true_p)}, Implied {pct(imp)}, EV {pct(ev)} → **{tier}** {badge}")
+
+        st.markdown("---")
+        best_value = max(results, key=lambda r: r["ev"])
+        if best_value["ev"] >= 0.05:
+            st.success(f"Value Play: {best_value['label']} ({best_value['odds_str']}) • EV {pct(best_value['ev'])} • True {pct(best_value['true'])}")
+        else:
+            st.warning("No value play (all EV < 5%).")
+
+        eligible_safe = [r for r in results if r['ev'] >= 0.05]
+        if eligible_safe:
+            best_safe = max(eligible_safe, key=lambda r: r["true"])
+            st.info(f"Safe Play: {best_safe['label']} ({best_safe['odds_str']}) • EV {pct(best_safe['ev'])} • True {pct(best_safe['true'])}")
+        else:
+            st.info("No safe play.")
+
+        odds_parsed = {
+            "O1.5": {"imp": imp15, "dec": dec15, "str": odds_dict["O1.5"]},
+            "O2.5": {"imp": imp25, "dec": dec25, "str": odds_dict["O2.5"]},
+            "BTTS": {"imp": impBT, "dec": decBT, "str": odds_dict["BTTS"]},
+        }
+        return probs, odds_parsed, (lam_home, lam_away)
+
+    odds_dict = {"O1.5": odds_o15, "O2.5": odds_o25, "BTTS": odds_btts}
+    label = f"{home_team} vs {away_team}"
+
+    profiling.section("compute")
+    if compute_only or compute_and_save:
+        try:
+            probs, odds_parsed, (lam_h, lam_a) = compute_match(
+                label, home_xg_for, away_xga_ag, away_xg_for, home_xga_ag, odds_dict
+            )
+            if compute_and_save:
+                rec = {
+                    "id": next_id(),
+                    "label": label,
+                    "lambda_home": lam_h,
+                    "lambda_away": lam_a,
+                    "rho": dc_rho,
+                    "probs": probs,
+                    "feed_version": odds_feed.get_odds_table().version,
+                    "odds": {
+                        "O1.5": odds_parsed["O1.5"],
+                        "O2.5": odds_parsed["O2.5"],
+                        "BTTS": odds_parsed["BTTS"],
+                    }
+                }
+                st.session_state["matches"].append(rec)
+                st.success("Match saved.")
+        except Exception as e:
+            st.error(f"⚠️ Compute error: {e}")
+
+    # ---------------- Saved Matches ----------------
+    st.markdown("---")
+    profiling.section("saved matches")
+    st.subheader("📚 Saved Matches")
+    if not st.session_state["matches"]:
+        st.info("No matches saved yet.")
+    else:
+        market_rows = []
+        feed_version = odds_feed.get_odds_table().version
+        for match in st.session_state["matches"]:
+            # Re-price only the markets whose feed prices moved since this match was priced
+            since = match.get("feed_version", 0)
+            if feed_version > since:
+                for mkt in odds_feed.changed_pairs(match["label"], ("O1.5", "O2.5", "BTTS"), since):
+                    q = odds_feed.price(match["label"], mkt)
+                    if q is not None:
+                        match["odds"][mkt] = {"imp": q.implied, "dec": q.dec, "str": q.price}
+                match["feed_version"] = feed_version
+            for mkt_key, mkt_label in [("O1.5","Over 1.5"),("O2.5","Over 2.5"),("BTTS","BTTS")]:
+                true_p = match["probs"][mkt_key]
+                imp = match["odds"][mkt_key]["imp"]
+                dec = match["odds"][mkt_key]["dec"]
+                market_rows.append({
+                    "match_id": match["id"], "match_label": match["label"],
+                    "lambda_home": match["lambda_home"], "lambda_away": match["lambda_away"],
+                    "market": mkt_key, "market_label": mkt_label, "true_p": true_p, "implied_p": imp,
+                    "dec": dec, "odds_str": match["odds"][mkt_key]["str"],
+                    "edge": true_p - imp, "ev": roi_per_dollar(true_p, dec),
+                })
+        picked = paged_table(ListSource(market_rows), "soccer_matches", {
+            "Match": lambda r: r["match_label"],
+            "λ Home / Away": lambda r: f"{r['lambda_home']:.2f} / {r['lambda_away']:.2f}",
+            "Market": lambda r: r["market_label"],
+            "True %": lambda r: pct(r["true_p"]),
+            "Implied %": lambda r: pct(r["implied_p"]),
+            "Edge": lambda r: f"{r['edge']*100:.2f} pp",
+            "EV %": lambda r: pct(r["ev"]),
+            "Tier": lambda r: " ".join(tier_from_true(r["true_p"], r["market"])),
+        }, sorts={"Saved": (None, False), "EV %": ("ev", True), "True %": ("true_p", True),
+                  "Edge": ("edge", True), "Match": ("match_label", False)}, default_desc=False)
+        s1, s2 = st.columns(2)
+        if s1.button(f"💾 Save Selected Bets ({len(picked)})", disabled=not picked, key="soccer_save_selected"):
+            board("saved_bets").extend({
+                "id": next_id(),
+                "match_id": r["match_id"],
+                "match_label": r["match_label"],
+                "market": r["market"],
+                "market_label": r["market_label"],
+                "true_p": r["true_p"],
+                "implied_p": r["implied_p"],
+                "dec": r["dec"],
+                "odds_str": r["odds_str"],
+            } for r in picked)
+            st.success("Saved bets: " + ", ".join(f"{r['match_label']} — {r['market_label']}" for r in picked))
+        if s2.button(f"🗑️ Delete Selected Matches ({len({r['match_id'] for r in picked})})", disabled=not picked,
+                     key="soccer_del_selected"):
+            drop = {r["match_id"] for r in picked}
+            st.session_state["matches"] = [m for m in st.session_state["matches"] if m["id"] not in drop]
+            saved_bets = board("saved_bets")
+            saved_bets.remove(*[b for b in saved_bets if b.get("match_id") in drop])
+            st.rerun()
+
+    # ---------------- Saved Bets ----------------
+    st.markdown("---")
+    profiling.section("saved bets")
+    st.subheader("💾 Saved Bets")
+    bets = board("saved_bets")
+    if not bets.total():
+        st.info("No saved bets yet.")
+    else:
+        def bet_ev(b):
+            return roi_per_dollar(float(b["true_p"]), float(b["dec"]))
+
+        def bet_implied(b):
+            dec = float(b["dec"])
+            return float(b.get("implied_p", 1.0/dec if dec>0 else 0.0))
+
+        chosen = paged_table(bets, "soccer_bets", {
+            "Bet ID": lambda b: str(b["id"]),
+            "Match | Market": lambda b: f"{b['match_label']} | {b['market_label']}",
+            "True %": lambda b: pct(b["true_p"]),
+            "Implied %": lambda b: pct(bet_implied(b)),
+            "EV %": lambda b: pct(bet_ev(b)),
+            "Odds": lambda b: b["odds_str"],
+            "Tier": lambda b: " ".join(tier_from_true(float(b["true_p"]), b["market"])),
+        }, sorts={"Saved": (None, False), "True %": ("true_p", True), "Odds": ("dec", True),
+                  "Match": ("match_label", False)}, default_desc=False)
+
+        def add_global(selection):
+            for b in selection:
+                add_to_global_parlay("Soccer", f"{b['match_label']} — {b['market_label']}",
+                                     decimal_to_american(float(b["dec"])), float(b["true_p"]), game=b["match_label"])
+
+        t1, t2 = st.columns(2)
+        if t1.button(f"🌍 Add Selected to Global Parlay ({len(chosen)})", disabled=not chosen, key="soccer_bets_add"):
+            add_global(chosen)
+            st.success(f"Added {len(chosen)} bet(s) to Global Parlay")
+        if t2.button(f"🗑️ Delete Selected ({len(chosen)})", disabled=not chosen, key="soccer_bets_del"):
+            bets.remove(*chosen)
+            st.rerun()
+
+        # 🌍 Global Parlay Button
+        if st.button("🌍 Add ALL Saved Bets to Global Parlay", key="btn_add_all_soccer_global_parlay"):
+            add_global(bets)
+            st.success("✅ All saved soccer bets added to Global Parlay!")
+
+    # ---------------- N-Leg Parlay Builder ----------------
+    st.markdown("---")
+    profiling.section("parlay builder")
+    st.subheader("🎛️ Parlay Builder (any number of legs)")
+    saved = bets.rows
+    if len(saved) < 2:
+        st.info("Save at least two bets.")
+    else:
+        def bet_label(b): return f"{b['id']} | {b['match_label']} | {b['market_label']} ({b['odds_str']})"
+        legs = st.multiselect("Choose parlay legs (2+):", options=saved, format_func=bet_label, key="parlay_legs_sel")
+        if len(legs) >= 2:
+            from math import prod
+            p_trues = [float(b["true_p"]) for b in legs]
+            decs = [float(b["dec"]) for b in legs]
+            true_parlay, fallback_dec = prod(p_trues), prod(decs)
+            book_parlay_odds_str = st.text_input("Sportsbook Parlay Odds", value="", key="parlay_book_odds_any")
+            dec_parlay, imp_parlay, using_book_price = None, None, False
+            if book_parlay_odds_str.strip():
+                try:
+                    imp_parlay, dec_parlay = parse_odds(book_parlay_odds_str.strip())
+                    using_book_price = True
+                except: st.warning("Could not parse book odds.")
+            if dec_parlay is None:
+                dec_parlay = fallback_dec
+                imp_parlay = 1.0 / dec_parlay if dec_parlay > 0 else 0.0
+            ev_parlay = roi_per_dollar(true_parlay, dec_parlay)
+            p_tier, p_badge = tier_from_ev_simple(ev_parlay)
+            g1,g2,g3,g4,g5,g6 = st.columns(6)
+            g1.metric("# Legs", f"{len(legs)}")
+            g2.metric("Parlay Decimal", f"{dec_parlay:.3f}")
+            g3.metric("True %", f"{true_parlay*100:.2f}%")
+            g4.metric("Implied %", f"{imp_parlay*100:.2f}%")
+            g5.metric("Edge", f"{(true_parlay-imp_parlay)*100:.2f} pp")
+            g6.metric("EV %", f"{ev_parlay*100:.2f}%")
+            st.write(f"Parlay Tier: {p_tier} {p_badge}")
+
+    # ---------------- Fixture List (batch) ----------------
+    st.markdown("---")
+    profiling.section("fixture list")
+    with st.expander("📂 Price a full fixture list (CSV)", expanded=False):
+        st.caption("One row per fixture with season totals: home_team, away_team, home_xg_total, home_xga_total, "
+                   "home_matches, away_xg_total, away_xga_total, away_matches, and optional odds_o15 / odds_o25 / odds_btts "
+                   "and rho (Dixon-Coles ρ per fixture; defaults to the ρ above).")
+        fixtures_file = st.file_uploader("Fixtures CSV", type=["csv"], key="soccer_fixtures_csv")
+        if fixtures_file is not None:
+            try:
+                import pandas as pd
+                fx = pd.read_csv(fixtures_file, dtype={"odds_o15": str, "odds_o25": str, "odds_btts": str})
+                home_m, away_m = fx["home_matches"].astype(float), fx["away_matches"].astype(float)
+                res = soccer_engine.evaluate_xg(fx["home_xg_total"] / home_m, fx["away_xga_total"] / away_m,
+                                                fx["away_xg_total"] / away_m, fx["home_xga_total"] / home_m,
+                                                labels=(fx["home_team"].astype(str) + " vs " + fx["away_team"].astype(str)).tolist(),
+                                                rho=fx["rho"].astype(float) if "rho" in fx else dc_rho)
+                odds_cols = {"O1.5": "odds_o15", "O2.5": "odds_o25", "BTTS": "odds_btts"}
+                odds = [{k: (r.get(c) if isinstance(r.get(c), str) else "") for k, c in odds_cols.items()}
+                        for r in fx.to_dict("records")]
+                st.dataframe(pd.DataFrame(soccer_engine.value_rows(res, odds)), use_container_width=True, hide_index=True)
+            except Exception as e:
+                st.error(f"⚠️ Fixture list error: {e}")